@@ -1,9 +1,10 @@
 import random
 import socket
 
+from pynars.Config import Config
 from pynars.NARS import Reasoner
 from pynars.NARS.DataStructures.MC.SensorimotorChannel import SensorimotorChannel
-from pynars.Narsese import parser
+from pynars.Narsese import parser, Task, Truth
 
 """
 The sensorimotor channel for the Pong game.
@@ -30,24 +31,46 @@ class PongChannel(SensorimotorChannel):
         """
         self.num_babbling = 200
         self.babbling_chance = 0.5
+        self.terms = {}  # the terms of the statements received from the game, by their Narsese
 
     def information_gathering(self):
         """
         Receive a string from the game and parse it into a task.
         """
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.bind(nars_address)
-        data, _ = sock.recvfrom(1024)
-        status = data.decode()
+        status = self.receive_status()
         if status != "GAME FAILED":
             try:
-                return [parser.parse(each) for each in status.split("|")]
+                return self.status_to_tasks(status)
             except:  # for unexpected game input error
                 print(status)
                 exit()
         else:
             return []
 
+    def receive_status(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(nars_address)
+        data, _ = sock.recvfrom(1024)
+        return data.decode()
+
+    def status_to_tasks(self, status):
+        """
+        The game sends the same few statements with different truth-values, e.g. "<{SELF} --> [good]>. %0.8;0.9%".
+        Each statement is parsed only once, and each task is built from its term and its truth-value.
+        """
+        tasks = []
+        for each in status.split("|"):
+            sentence, _, truth = each.partition(". %")
+            truth = truth.rstrip("%").split(";")
+            if len(truth) != 2:  # anything else is left to the parser
+                tasks.append(parser.parse(each))
+                continue
+            term = self.terms.get(sentence, None)
+            if term is None:
+                term = self.terms[sentence] = parser.parse(sentence + ".").term
+            tasks.append(Task.new_judgement(term, Truth(float(truth[0]), float(truth[1]), Config.k)))
+        return tasks
+
     def babbling(self):
         """
         Based on the probability and remaining counts.
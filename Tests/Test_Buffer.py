@@ -114,6 +114,68 @@ class TEST_EventBuffer(unittest.TestCase):
         event_buffer.put(new_event_task)
         self.assertTrue(event_buffer.get_newest_event().term == new_event_task.term)
 
+    def _put_events(self, event_buffer: EventBuffer, names, generate=True):
+        '''Put the events in turn, and collect the terms generated with each new one.'''
+        results = []
+        for time, name in enumerate(names):
+            event_task: Task = Narsese.parser.parse(f"<{name}1-->{name}2>.")
+            event_task.stamp.t_occurrence = time*(Config.temporal_duration + 1)
+            event_buffer.put(event_task)
+            if generate:
+                results.extend(task.term for task in event_buffer.generate_temporal_sentences(event_task))
+        return results
+
+    def test_incremental_temporal_chaining(self):
+        """
+            Generating only the combinations with each new event gives all the combinations of the events once,
+            and what the exhaustive generation would give, without its duplicates
+        """
+        names = ["A", "B", "C", "D", "E"]
+        results_incremental = self._put_events(EventBuffer(capacity=5), names)
+        self.assertEqual(len(results_incremental), len(set(results_incremental)))
+        self.assertEqual(len(results_incremental), 10 + 10) # 10 pairs and 10 triples
+
+        # the exhaustive generation from the same events
+        event_buffer = EventBuffer(capacity=5)
+        self._put_events(event_buffer, names, generate=False)
+        results_all = [task.term for task in event_buffer.generate_temporal_sentences()]
+        self.assertEqual(set(results_all), set(results_incremental))
+        self.assertEqual(event_buffer.generate_temporal_sentences(), [])
+
+        # the same event again gives no combination generated before
+        event_task: Task = Narsese.parser.parse("<E1-->E2>.")
+        event_task.stamp.t_occurrence = 4*(Config.temporal_duration + 1)
+        event_buffer.put(event_task)
+        results = [task.term for task in event_buffer.generate_temporal_sentences(event_task)]
+        self.assertTrue(len(results) > 0)
+        self.assertTrue(all(result not in results_all for result in results))
+
+    def test_temporal_chaining_limits(self):
+        """
+            Test the limits on the arity and on the number of combinations generated at once
+        """
+        results = self._put_events(EventBuffer(capacity=5, max_arity=2), ["A", "B", "C", "D"])
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(result.is_compound for result in results))
+
+        event_buffer = EventBuffer(capacity=5, max_combinations=2)
+        self._put_events(event_buffer, ["A", "B", "C"])
+        event_task: Task = Narsese.parser.parse("<D1-->D2>.")
+        event_task.stamp.t_occurrence = 3*(Config.temporal_duration + 1)
+        event_buffer.put(event_task)
+        results = event_buffer.generate_temporal_sentences(event_task)
+        C_and_D: Task = Narsese.parser.parse("(&/, <C1-->C2>,+" + str(Config.temporal_duration + 1) + ",<D1-->D2>).")
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].term, C_and_D.term)
+
+        # an event which does not enter the buffer generates nothing
+        old_event_task: Task = Narsese.parser.parse("<old1-->old2>.")
+        old_event_task.stamp.t_occurrence = -1
+        event_buffer = EventBuffer(capacity=3)
+        self._put_events(event_buffer, ["A", "B", "C"])
+        event_buffer.put(old_event_task)
+        self.assertEqual(event_buffer.generate_temporal_sentences(old_event_task), [])
+
 if __name__ == '__main__':
 
     test_classes_to_run = [
@@ -0,0 +1,81 @@
+'''
+Benchmark of feeding a reasoner from many producers, each waiting `delay` milliseconds for every input as if it were read from a socket.
+
+"sync": one loop receives an input from each producer in turn, blocking for the delay as `PongChannel.receive_status` does, inputs it by `Reasoner.input_narsese` and runs a cycle.
+"async": the producers are coroutines which wait for the delay by `asyncio.sleep` and put their inputs into the Narsese channel of an `AsyncReasoner` (of capacity 16), whose cycles run in a thread of their own. The reasoner takes up to `inputs_per_cycle` (4) inputs from each channel per cycle.
+
+Both run until all the inputs are taken out of the channels. It reports the wall time, the number of cycles, the latency of the ingestion of an input (from the time it was received to the time it was put into the reasoner), and the time between the starts of two consecutive cycles, whose spread is the jitter of the cycles. The times are in milliseconds, and the quantiles are the upper edges of the bins of `Histogram`.
+
+Usage:
+    python -m Tests.benchmarks.bench_async_reasoner [n_producers] [n_inputs] [delay]
+'''
+import asyncio
+import sys
+import time
+from time import perf_counter
+
+from pynars.Global import ReasonerContext
+from pynars.NARS import Reasoner, AsyncReasoner
+from pynars.NARS.Control.Profiler import Histogram
+
+
+def new_reasoner():
+    nars = Reasoner(1000, 100, context=ReasonerContext(seed=0))
+    nars.inputs_per_cycle = 4
+    return nars
+
+
+def run_sync(n_producers: int, n_inputs: int, delay: float):
+    nars = new_reasoner()
+    ingest_latency, cycle_interval = Histogram(), Histogram()
+    t_last = None
+    for j in range(n_inputs):
+        for i in range(n_producers):
+            time.sleep(delay)
+            t_received = perf_counter()
+            nars.input_narsese(f'<s{i}_{j} --> p>.')
+            ingest_latency.add(perf_counter() - t_received)
+            t0 = perf_counter()
+            if t_last is not None: cycle_interval.add(t0 - t_last)
+            t_last = t0
+            nars.cycle()
+    while len(nars.narsese_channel) > 0:
+        nars.cycle()
+    return nars.cycles_count, ingest_latency, cycle_interval
+
+
+def run_async(n_producers: int, n_inputs: int, delay: float):
+    nars = new_reasoner()
+    driver = AsyncReasoner(nars, cycles_per_step=1, capacity=16)
+
+    async def produce(i):
+        for j in range(n_inputs):
+            await asyncio.sleep(delay)
+            await driver.input_narsese(f'<s{i}_{j} --> p>.')
+
+    async def main():
+        run = asyncio.create_task(driver.run())
+        await asyncio.gather(*(produce(i) for i in range(n_producers)))
+        while len(driver.narsese_channel) > 0 or len(nars.narsese_channel) > 0:
+            await asyncio.sleep(0.001)
+        driver.stop()
+        await run
+
+    asyncio.run(main())
+    driver.close()
+    return driver.n_cycles, driver.ingest_latency, driver.cycle_interval
+
+
+def main(n_producers: int=16, n_inputs: int=50, delay: int=5):
+    print(f'{n_producers} producers x {n_inputs} inputs, {delay}ms per input')
+    print(f'{"mode":>6} | {"wall(s)":>7} | {"cycles":>6} | {"ingest p50":>10} | {"ingest p99":>10} | {"interval p50":>12} | {"interval p99":>12} | {"interval max":>12}')
+    for name, run in (('sync', run_sync), ('async', run_async)):
+        t0 = perf_counter()
+        n_cycles, ingest_latency, cycle_interval = run(n_producers, n_inputs, delay/1000)
+        wall = perf_counter() - t0
+        print(f'{name:>6} | {wall:>7.2f} | {n_cycles:>6} | {ingest_latency.quantile(0.5)*1e3:>10.3f} | {ingest_latency.quantile(0.99)*1e3:>10.3f} | '
+              f'{cycle_interval.quantile(0.5)*1e3:>12.3f} | {cycle_interval.quantile(0.99)*1e3:>12.3f} | {cycle_interval.max*1e3:>12.3f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
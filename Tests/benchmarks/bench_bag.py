@@ -0,0 +1,57 @@
+'''
+Microbenchmark of the cost of inserting a link into a concept, which updates the budget of the concept within the memory.
+
+"before": the budget is updated by removing the concept from the bag and putting it back, twice per link (priority and durability), as `Concept.update_priority/update_durability` used to do.
+"after": the budget is updated in place by `Bag.update_budget`, once per link.
+
+Usage:
+    python -m Tests.benchmarks.bench_bag [n_concepts] [n_links]
+'''
+import random
+import sys
+from time import perf_counter
+
+from pynars.Config import Config
+from pynars.NAL.Functions import Or
+from pynars.NARS.DataStructures import Bag, Concept, TaskLink
+from pynars.Narsese import Budget, Judgement, Task, Term
+
+
+def update_by_reinsertion(concept: Concept, link: TaskLink, concepts: Bag):
+    concepts.take_by_key(concept, remove=True)
+    concept.budget.priority = Or(concept.budget.priority, link.budget.priority)
+    concepts.put(concept)
+    concepts.take_by_key(concept, remove=True)
+    concept.budget.durability = (Config.concept_update_durability_weight * link.budget.durability
+                                 + (1-Config.concept_update_durability_weight)*concept.budget.durability)
+    concepts.put(concept)
+
+
+def update_in_place(concept: Concept, link: TaskLink, concepts: Bag):
+    concept.update_budget(concepts, p=link.budget.priority, d=link.budget.durability)
+
+
+def run(engine: str, update, n_concepts: int, n_links: int):
+    random.seed(0)
+    concepts = Bag(n_concepts, 100, engine=engine)
+    items = [Concept(Term(f'c{i}'), Budget(random.random(), 0.5, 0.5)) for i in range(n_concepts)]
+    for concept in items: concepts.put(concept)
+    task = Task(Judgement(Term('x')))
+    links = [TaskLink(concept, task, Budget(random.random()*0.1, 0.5, 0.5), index=[]) for concept in random.choices(items, k=n_links)]
+
+    t0 = perf_counter()
+    for link in links:
+        update(link.source, link, concepts)
+    return (perf_counter() - t0) / n_links
+
+
+def main(n_concepts: int = 10000, n_links: int = 10000):
+    print(f'#concepts={n_concepts}, #links={n_links}')
+    for engine in ('list', 'indexed'):
+        t_before = run(engine, update_by_reinsertion, n_concepts, n_links)
+        t_after = run(engine, update_in_place, n_concepts, n_links)
+        print(f'{engine:>8}: before {t_before*1e6:9.2f} us/link, after {t_after*1e6:9.2f} us/link')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+'''
+Benchmark of the temporal chaining of `EventBuffer`, for a stream of events entering a full buffer.
+
+"exhaustive": all the combinations of the events in the buffer are generated with each new event, as `Reasoner.observe` used to do.
+"incremental": only the combinations containing the new event are generated.
+"incremental, capped": the same, with at most `max_combinations` combinations at once.
+
+For each capacity of the buffer, it reports the mean time and the mean number of tasks generated per new event. The exhaustive generation is only run for the capacities up to 25, since it takes seconds per event beyond.
+
+Usage:
+    python -m Tests.benchmarks.bench_event_buffer [n_events] [max_combinations]
+'''
+import sys
+from time import perf_counter
+
+from pynars import Narsese
+from pynars.Config import Config
+from pynars.NARS.DataStructures import EventBuffer
+
+
+def new_events(n_events: int):
+    events = []
+    for time in range(n_events):
+        event_task = Narsese.parser.parse(f'<s{time%7}-->[on{time%3}]>.')
+        event_task.stamp.t_occurrence = time*(Config.temporal_duration + 1)
+        events.append(event_task)
+    return events
+
+
+def run(event_buffer: EventBuffer, events: list, exhaustive: bool):
+    for event_task in events[:event_buffer.capacity]: event_buffer.put(event_task)
+    n_tasks = 0
+    t0 = perf_counter()
+    for event_task in events[event_buffer.capacity:]:
+        event_buffer.put(event_task)
+        if exhaustive:
+            event_buffer._generated.clear() # everything is generated again, as before
+            n_tasks += len(event_buffer.generate_temporal_sentences())
+        else:
+            n_tasks += len(event_buffer.generate_temporal_sentences(event_task))
+    n_events = len(events) - event_buffer.capacity
+    return (perf_counter() - t0)/n_events, n_tasks/n_events
+
+
+def main(n_events: int=20, max_combinations: int=100):
+    print(f'{"capacity":>8} | {"mode":>19} | {"ms/event":>9} | {"tasks/event":>11}')
+    for capacity in (10, 25, 50):
+        events = new_events(capacity + n_events)
+        modes = [('incremental', EventBuffer(capacity)), ('incremental, capped', EventBuffer(capacity, max_combinations=max_combinations))]
+        if capacity <= 25: modes.insert(0, ('exhaustive', EventBuffer(capacity)))
+        for mode, event_buffer in modes:
+            t, n_tasks = run(event_buffer, events, mode == 'exhaustive')
+            print(f'{capacity:>8} | {mode:>19} | {t*1e3:>9.2f} | {n_tasks:>11.1f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
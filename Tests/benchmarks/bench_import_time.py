@@ -0,0 +1,44 @@
+'''
+Benchmark of the time of importing the package, in milliseconds, as reported by `python -X importtime` in a new interpreter, without the bytecode cache.
+
+For each module, it reports the least cumulative time over the runs, and the budget it is expected to stay under. Without the bytecode cache, `import pynars.NARS` takes about 350 ms on a laptop.
+
+Usage:
+    python -m Tests.benchmarks.bench_import_time [n_runs]
+'''
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+root_path = Path(__file__).parent.parent.parent
+
+IMPORT_BUDGETS_MS = {
+    'pynars': 100,
+    'pynars.NARS': 1500,
+}
+
+
+def run_python(*args: str):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    return subprocess.run([sys.executable, *args], cwd=root_path, env=env, capture_output=True, text=True, check=True)
+
+
+def import_time_ms(module: str) -> float:
+    '''The cumulative time of importing `module` in a new interpreter, as reported by `-X importtime`.'''
+    stderr = run_python('-X', 'importtime', '-c', f'import {module}').stderr
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and line.split('|')[-1].strip() == module:
+            return int(line.split('|')[1])/1000
+    raise ValueError(f'`{module}` not found in the output of `-X importtime`')
+
+
+def main(n_runs: int=3):
+    print(f'{"module":<12} | {"ms":>8} | {"budget":>8}')
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        t = min(import_time_ms(module) for _ in range(n_runs))
+        print(f'{module:<12} | {t:>8.0f} | {budget:>8}' + ('' if t < budget else '  over budget'))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
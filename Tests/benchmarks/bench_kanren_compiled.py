@@ -0,0 +1,71 @@
+'''
+Benchmark of the compiled-rules mode of `KanrenEngine`, over the premises of `Tests/test_NAL`.
+
+The rule applications (i.e. the calls of `KanrenEngine.apply`) made when feeding the premises to the engine are recorded, then replayed with the miniKanren solver and with the compiled rules.
+It reports the throughput of both modes, and checks that they derive the same conclusions.
+
+Usage:
+    python -m Tests.benchmarks.bench_kanren_compiled [n_repeats]
+'''
+import sys
+from time import perf_counter
+
+from pynars.NARS.InferenceEngine import KanrenEngine
+from Tests.benchmarks.bench_kanren_rules import run
+from Tests.benchmarks.nal_premises import load_sentences
+
+
+def record_applications(engine: KanrenEngine, sentences: list):
+    applications = []
+    apply = engine.apply
+    def apply_recorded(rule, l1, l2, backward=False):
+        applications.append((rule, l1, l2, backward))
+        return apply(rule, l1, l2, backward)
+    engine.apply = apply_recorded
+    try:
+        run(engine, sentences)
+    finally:
+        del engine.apply
+    return applications
+
+
+def replay(engine: KanrenEngine, applications: list, n_repeats: int):
+    t0 = perf_counter()
+    for _ in range(n_repeats):
+        results = [engine.apply(rule, l1, l2, backward) for rule, l1, l2, backward in applications]
+    return perf_counter() - t0, results
+
+
+def main(n_repeats: int=3):
+    sentences = load_sentences()
+    engine = KanrenEngine()
+    engine.compiled_rules_enabled = False
+    applications = record_applications(engine, sentences)
+    n = len(applications)*n_repeats
+    print(f'#premise pairs={len(sentences)}, #rule applications={len(applications)}')
+
+    results = {}
+    for enabled in (False, True):
+        engine.compiled_rules_enabled = enabled
+        replay(engine, applications, 1) # warm up the caches of `term`
+        duration, results[enabled] = replay(engine, applications, n_repeats)
+        name = 'compiled' if enabled else 'miniKanren'
+        print(f'{name:>10}: {n/duration:10.0f} applications/s ({duration/n*1e6:8.1f}us per application)')
+
+    n_mismatch = sum(1 for r1, r2 in zip(results[False], results[True]) if str(r1) != str(r2))
+    print(f'#mismatches={n_mismatch}')
+
+    # end-to-end: the same premises through the inference methods
+    conclusions = {}
+    for enabled in (False, True):
+        engine.compiled_rules_enabled = enabled
+        t0 = perf_counter()
+        conclusions[enabled], _ = run(engine, sentences)
+        name = 'compiled' if enabled else 'miniKanren'
+        print(f'{name:>10}: {perf_counter() - t0:.2f}s for all the premises')
+    n_mismatch = sum(1 for c1, c2 in zip(conclusions[False], conclusions[True]) if c1 != c2)
+    print(f'#mismatches={n_mismatch}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
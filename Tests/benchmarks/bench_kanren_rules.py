@@ -0,0 +1,77 @@
+'''
+Benchmark of the rule index of `KanrenEngine`, over the premises of `Tests/test_NAL`.
+
+Each pair of premises is fed to the inference methods the way `Reasoner.inference_step` does, once trying all the rules and once trying only the candidates selected by `RuleIndex`.
+It reports the number of rules tried per call and the time per call of each method, and checks that both modes derive the same conclusions.
+
+Usage:
+    python -m Tests.benchmarks.bench_kanren_rules
+'''
+from time import perf_counter
+
+from pynars.NARS.InferenceEngine import KanrenEngine
+from Tests.benchmarks.nal_premises import load_sentences
+
+
+def summarize(results):
+    if isinstance(results, Exception): return type(results).__name__
+    return [(str(conclusion[0]), conclusion[1], str(truth)) for conclusion, truth in results]
+
+
+def call(engine: KanrenEngine, method: str, durations: dict, *args, **kwargs):
+    t0 = perf_counter()
+    try:
+        results, _ = getattr(engine, method)(*args, **kwargs)
+    except Exception as e:
+        results = e
+    durations[method] = durations.get(method, 0) + perf_counter() - t0
+    return summarize(results)
+
+
+def run(engine: KanrenEngine, sentences: list):
+    '''Returns the conclusions of each call and the time spent in each method.'''
+    engine.cache_clear()
+    engine.rule_calls.clear()
+    engine.rules_tried.clear()
+    durations = {}
+    conclusions = []
+    for t1, t2 in sentences:
+        conclusions.append(call(engine, 'inference_immediate', durations, t1, backward=t1.is_question or t1.is_goal))
+        if t2 is None: continue
+        if t1.is_judgement:
+            if t1.is_eternal and t2.is_eternal:
+                conclusions.append(call(engine, 'inference_compositional', durations, t1, t2))
+            conclusions.append(call(engine, 'inference', durations, t1, t2))
+            if t2.is_judgement:
+                conclusions.append(call(engine, 'inference', durations, t2, t1))
+        else:
+            conclusions.append(call(engine, 'backward', durations, t1, t2))
+    return conclusions, durations
+
+
+def main():
+    sentences = load_sentences()
+    engine = KanrenEngine()
+    print(f'#premise pairs={len(sentences)}')
+
+    stats = {}
+    for enabled in (False, True):
+        engine.rule_index_enabled = enabled
+        conclusions, durations = run(engine, sentences)
+        stats[enabled] = (conclusions, durations, dict(engine.rule_calls), dict(engine.rules_tried))
+    engine.rule_index_enabled = KanrenEngine.rule_index_enabled
+
+    print(f'{"method":>24} | {"calls":>6} | {"rules/call (all)":>16} | {"rules/call (index)":>18} | {"ms/call (all)":>13} | {"ms/call (index)":>15}')
+    _, durations_all, calls, tried_all = stats[False]
+    _, durations_index, _, tried_index = stats[True]
+    for method, n in calls.items():
+        print(f'{method:>24} | {n:>6} | {tried_all[method]/n:>16.1f} | {tried_index[method]/n:>18.1f} | {durations_all[method]/n*1e3:>13.2f} | {durations_index[method]/n*1e3:>15.2f}')
+    total_all, total_index = sum(durations_all.values()), sum(durations_index.values())
+    print(f'total: {total_all:.2f}s (all) vs {total_index:.2f}s (index), {total_all/total_index:.1f}x')
+
+    n_mismatch = sum(1 for c1, c2 in zip(stats[False][0], stats[True][0]) if c1 != c2)
+    print(f'#mismatches={n_mismatch}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+'''
+Benchmark of the startup time of `KanrenEngine` and `Reasoner`:
+    - cold: the rules are compiled from `nal-rules.yml` (no cache on disk);
+    - warm: the rules are loaded from the cache on disk;
+    - shared: the rules are already loaded in the process, e.g. by another reasoner.
+
+Each case is run in a fresh process, so that nothing else is warmed up.
+
+Usage:
+    python -m Tests.benchmarks.bench_kanren_startup [n_repeats]
+'''
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+
+script = '''
+import sys
+from time import perf_counter
+from pathlib import Path
+from pynars.NARS.InferenceEngine import KanrenEngine
+from pynars.NARS import Reasoner
+KanrenEngine.path_rules_cache = Path(sys.argv[1])
+n_shared = int(sys.argv[2])
+t0 = perf_counter()
+KanrenEngine()
+t1 = perf_counter()
+Reasoner(100, 100)
+t2 = perf_counter()
+for _ in range(n_shared): Reasoner(100, 100)
+t3 = perf_counter()
+print(t1 - t0, t2 - t1, (t3 - t2)/max(1, n_shared))
+'''
+
+
+def measure(path_cache: Path, cold: bool, n_shared: int=0):
+    if cold and path_cache.exists(): path_cache.unlink()
+    output = subprocess.run([sys.executable, '-c', script, str(path_cache), str(n_shared)], capture_output=True, text=True, check=True).stdout
+    return [float(t) for t in output.strip().splitlines()[-1].split()]
+
+
+def main(n_repeats: int=3):
+    with tempfile.TemporaryDirectory() as root:
+        path_cache = Path(root)/'nal-rules.pkl'
+        cold = [measure(path_cache, True) for _ in range(n_repeats)]
+        warm = [measure(path_cache, False, n_shared=5) for _ in range(n_repeats)]
+    print(f'KanrenEngine(), cold: {median(t[0] for t in cold)*1e3:8.1f}ms')
+    print(f'KanrenEngine(), warm: {median(t[0] for t in warm)*1e3:8.1f}ms')
+    print(f'Reasoner(), shared:   {median(t[2] for t in warm)*1e3:8.1f}ms (the rules loaded by another reasoner in the process)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
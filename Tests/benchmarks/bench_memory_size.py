@@ -0,0 +1,48 @@
+'''
+Benchmark of the memory footprint of a filled `Memory`, measured by `pynars.utils.tools.get_size` and by `tracemalloc`.
+
+The memory is filled with judgements `<s{i} --> p{i%n_predicates}>.` and `<s{i} --> p{j}>.`, so that each concept holds several tasks in its tables.
+It reports the bytes per concept (the whole memory divided by the number of concepts) and the bytes per task (all the tasks in the memory, sharing their terms, divided by the number of tasks).
+
+Usage:
+    python -m Tests.benchmarks.bench_memory_size [n_subjects] [n_predicates]
+'''
+import sys
+import tracemalloc
+from time import perf_counter
+
+from pynars import Narsese
+from pynars.NARS.DataStructures import Memory
+from pynars.utils.tools import get_size
+
+
+def fill(n_subjects: int, n_predicates: int):
+    memory = Memory(100000, 100)
+    for i in range(n_subjects):
+        for j in (i % n_predicates, (i+1) % n_predicates, (i+2) % n_predicates):
+            task = Narsese.parse(f'<s{i} --> p{j}>. %{0.5+j/(2*n_predicates):.2f};0.90%')
+            memory.accept(task)
+    return memory
+
+
+def main(n_subjects: int=2000, n_predicates: int=50):
+    sys.setrecursionlimit(100000) # `get_size` recurses along the links between the concepts
+    tracemalloc.start()
+    t0 = perf_counter()
+    memory = fill(n_subjects, n_predicates)
+    t_fill = perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    concepts = list(memory.concepts)
+    tasks = list({id(task): task for concept in concepts for table in (concept.belief_table, concept.desire_table) for task in table}.values())
+    size_memory = get_size(memory)
+    size_tasks = get_size(tasks) - get_size([None]*len(tasks))
+
+    print(f'#concepts={len(concepts)}, #tasks={len(tasks)}, filled in {t_fill:.2f}s')
+    print(f'get_size: memory {size_memory/2**20:.2f}MiB, {size_memory/len(concepts):.0f}B/concept, {size_tasks/len(tasks):.0f}B/task')
+    print(f'tracemalloc: current {current/2**20:.2f}MiB, peak {peak/2**20:.2f}MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,68 @@
+'''
+Benchmark of `Base.is_overlaped`, in checks per second, for the evidential bases of long chains of derivations.
+
+Each base is built by merging the bases of `length` inputs taken at random among `n_inputs` (with sequential ids, as `Global.get_input_id` gives), one after the other, with `Config.maximum_evidental_base_length` set to `length`, so that the bases of the longer chains reach the maximum length. Then, each base is checked against all the others.
+
+"OrderedSet": the evidences are compared as `OrderedSet`s, as `Base` used to keep them.
+"exact": the evidences are compared as sets.
+"fingerprint": `Base.is_overlaped`, where the evidences are compared only if the fingerprints intersect.
+
+It also reports the ratio of the pairs which overlap, and of those ruled out by the fingerprints alone.
+
+Usage:
+    python -m Tests.benchmarks.bench_overlap [n_inputs] [lengths...]
+'''
+import random
+import sys
+from time import perf_counter
+
+from ordered_set import OrderedSet
+
+from pynars.Config import Config
+from pynars.Narsese import Base
+
+
+def new_bases(n_inputs: int, length: int, n_bases: int):
+    inputs = [Base((i,)) for i in range(n_inputs)]
+    bases = []
+    for _ in range(n_bases):
+        base = random.choice(inputs)
+        for _ in range(length - 1): base = Base.merge(base, random.choice(inputs))
+        bases.append(base)
+    return bases
+
+
+def run(bases, check):
+    t0 = perf_counter()
+    n_overlaps = sum(check(base1, base2) for base1 in bases for base2 in bases)
+    return len(bases)**2/(perf_counter() - t0), n_overlaps/len(bases)**2
+
+
+def exact(base1: Base, base2: Base):
+    return not base1.evidences.isdisjoint(base2.evidences)
+
+
+def fingerprint(base1: Base, base2: Base):
+    return base1.is_overlaped(base2)
+
+
+def main(n_inputs: int=100000, *lengths: int):
+    random.seed(0)
+    maximum_evidental_base_length = Config.maximum_evidental_base_length
+    print(f'{"length":>6} | {"OrderedSet":>10} | {"exact":>10} | {"fingerprint":>11} | {"overlaps":>8} | {"ruled out":>9}')
+    try:
+        for length in lengths or (2, 8, 32, 128):
+            Config.maximum_evidental_base_length = length
+            bases = new_bases(n_inputs, length, 300)
+            ordered_sets = {base: OrderedSet(base) for base in bases}
+            t_ordered_set, _ = run(bases, lambda base1, base2: not ordered_sets[base1].isdisjoint(ordered_sets[base2]))
+            t_exact, overlaps = run(bases, exact)
+            t_fingerprint, _ = run(bases, fingerprint)
+            ruled_out = sum(base1._fingerprint & base2._fingerprint == 0 for base1 in bases for base2 in bases)/len(bases)**2
+            print(f'{length:>6} | {t_ordered_set:>10.0f} | {t_exact:>10.0f} | {t_fingerprint:>11.0f} | {overlaps:>8.3f} | {ruled_out:>9.3f}')
+    finally:
+        Config.maximum_evidental_base_length = maximum_evidental_base_length
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
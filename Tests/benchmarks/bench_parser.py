@@ -0,0 +1,71 @@
+'''
+Benchmark of the Narsese parser over the lines of the `.nal` files in `Tests/examples`, in lines per second.
+
+"lark": every line is parsed by Lark, as before.
+"fast path": the common shapes are parsed by `FastParser`, and the rest by Lark, without the cache.
+"cached, cold": the same, with the cache of the parser empty at first (the same sentences recur across the files).
+"cached, warm": all the lines again, with the cache filled.
+
+It is run over all the lines, and over the lines of the shapes of the fast path only. The sentences with variables are not cached, so they are parsed by Lark each time.
+
+Usage:
+    python -m Tests.benchmarks.bench_parser [n_repeats]
+'''
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from pynars.Narsese import parser
+
+examples_path = Path(__file__).parent.parent/'examples'
+
+
+def collect_lines():
+    lines = []
+    for path in sorted(examples_path.rglob('*.nal')):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if len(line) == 0 or line.startswith('//') or line.startswith("'") or line.isdigit(): continue
+                lines.append(line)
+    return lines
+
+
+def run(parse, lines):
+    t0 = perf_counter()
+    for line in lines:
+        try: parse(line)
+        except Exception: pass
+    return len(lines)/(perf_counter() - t0)
+
+
+def bench(lines, n_repeats: int):
+    results = {mode: 0.0 for mode in ('lark', 'fast path', 'cached, cold', 'cached, warm')}
+    for _ in range(n_repeats):
+        results['lark'] = max(results['lark'], run(parser.parse_lark, lines))
+        parser.cache_clear()
+        parser.cache_size = 0
+        results['fast path'] = max(results['fast path'], run(parser.parse, lines))
+        parser.cache_size = None
+        results['cached, cold'] = max(results['cached, cold'], run(parser.parse, lines))
+        results['cached, warm'] = max(results['cached, warm'], run(parser.parse, lines))
+    return results
+
+
+def main(n_repeats: int=5):
+    lines_all = collect_lines()
+    lines_fast = [line for line in lines_all if parser._fast.parse(line) is not None]
+    cache_size = parser.cache_size
+    print(f'{"lines":>20} | {"mode":>12} | {"lines/s":>8} | {"speedup":>7}')
+    try:
+        for name, lines in ((f'all ({len(lines_all)})', lines_all), (f'fast path ({len(lines_fast)})', lines_fast)):
+            results = bench(lines, n_repeats)
+            for mode, throughput in results.items():
+                print(f'{name:>20} | {mode:>12} | {throughput:>8.0f} | {throughput/results["lark"]:>6.1f}x')
+    finally:
+        parser.cache_size = cache_size
+        parser.cache_clear()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
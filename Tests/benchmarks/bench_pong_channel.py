@@ -0,0 +1,103 @@
+'''
+Benchmark of a cycle of the Pong sensorimotor channel (`PongChannel.channel_cycle`), without the game.
+
+The statuses of the game are generated the way `Pong/game.py` sends them, with the ball on the left, on the right or above the paddle. The operations do nothing. The printing of the channel is discarded.
+
+"parser": each status is parsed into tasks by the parser, as `PongChannel.information_gathering` used to, and so is the conclusion of each prediction fired, as `PredictiveImplication.get_conclusion` used to.
+"direct": `PongChannel.status_to_tasks`, which parses each statement once and builds the tasks from their terms and truth-values, and `PredictiveImplication.get_conclusion`, which builds the conclusion from its term.
+
+It reports the mean time per cycle of a whole cycle, of the conversion of the statuses into tasks, and of the predictions fired. Most of a cycle is spent by `Memory.accept`, on the predictive implications forwarded to the memory.
+
+Usage:
+    python -m Tests.benchmarks.bench_pong_channel [n_cycles] [seed]
+'''
+import contextlib
+import io
+import random
+import sys
+from time import perf_counter
+
+from Pong.PongChannel import PongChannel
+from pynars.NARS import Reasoner
+from pynars.NARS.DataStructures.MC.EventBuffer import PredictiveImplication
+from pynars.NAL.Functions import Truth_deduction
+from pynars.Narsese import parser
+
+get_conclusion_direct = PredictiveImplication.get_conclusion
+
+
+def get_conclusion_parser(self: PredictiveImplication, condition_task):
+    truth = Truth_deduction(self.task.truth, condition_task.task.truth)
+    if truth.c < 0.3:
+        return None, None
+    task = parser.parse(self.conclusion.word + ". " + str(truth))
+    return self.interval, task
+
+
+def new_status(rng: random.Random):
+    position = rng.random()
+    if position < 0.4:
+        return "<{left} --> [on]>. %1;0.9%|<{SELF} --> [good]>. %" + str(1 - rng.random()/2) + ";0.9%"
+    elif position < 0.8:
+        return "<{right} --> [on]>. %1;0.9%|<{SELF} --> [good]>. %" + str(1 - rng.random()/2) + ";0.9%"
+    return "<{SELF} --> [good]>. %1;0.9%"
+
+
+class BenchPongChannel(PongChannel):
+    use_parser = False
+
+    def __init__(self, *args, seed=0):
+        super().__init__(*args)
+        self.rng = random.Random(seed)
+        self.t_status = 0.0
+
+    def receive_status(self):
+        return new_status(self.rng)
+
+    def status_to_tasks(self, status):
+        t0 = perf_counter()
+        if self.use_parser:
+            tasks = [parser.parse(each) for each in status.split("|")]
+        else:
+            tasks = super().status_to_tasks(status)
+        self.t_status += perf_counter() - t0
+        return tasks
+
+
+def run(n_cycles: int, seed: int, use_parser: bool):
+    t_prediction = 0.0
+    get_conclusion = get_conclusion_parser if use_parser else get_conclusion_direct
+    def get_conclusion_timed(self, condition_task):
+        nonlocal t_prediction
+        t0 = perf_counter()
+        result = get_conclusion(self, condition_task)
+        t_prediction += perf_counter() - t0
+        return result
+    PredictiveImplication.get_conclusion = get_conclusion_timed
+
+    random.seed(seed)
+    nars = Reasoner(100, 100)
+    channel = BenchPongChannel("Pong", 2, 5, 50, 5, 50, 50, 1, seed=seed)
+    channel.use_parser = use_parser
+    for name, vocabulary in (("^left", ["^left", "left"]), ("^right", ["^right", "right"]), ("^hold", ["^hold", "mid"])):
+        channel.register_operation(name, lambda: None, vocabulary)
+    t0 = perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(n_cycles):
+                channel.channel_cycle(nars.memory)
+    finally:
+        PredictiveImplication.get_conclusion = get_conclusion_direct
+    return (perf_counter() - t0)/n_cycles, channel.t_status/n_cycles, t_prediction/n_cycles
+
+
+def main(n_cycles: int=500, seed: int=0):
+    run(20, seed, False)
+    print(f'{"mode":>6} | {"ms/cycle":>8} | {"status (us)":>11} | {"predictions (us)":>16}')
+    for mode, use_parser in (('parser', True), ('direct', False)):
+        t_cycle, t_status, t_prediction = run(n_cycles, seed, use_parser)
+        print(f'{mode:>6} | {t_cycle*1e3:>8.2f} | {t_status*1e6:>11.1f} | {t_prediction*1e6:>16.1f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
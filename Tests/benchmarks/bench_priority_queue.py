@@ -0,0 +1,60 @@
+'''
+Benchmark of the `PriorityQueue` of the MC buffers, in operations per second.
+
+For each size, a full queue receives `size` more pushes (each one evicting the lowest item), then `size` edits of random items by their identifiers, `size` random pops with pushes back, and finally all the items are popped.
+
+Usage:
+    python -m Tests.benchmarks.bench_priority_queue [sizes...]
+'''
+import random
+import sys
+from time import perf_counter
+
+from pynars.NARS.DataStructures.MC.Utils import PriorityQueue
+
+
+class Prediction:
+    def __init__(self, name):
+        self.name = name
+
+
+def identifier(prediction: Prediction):
+    return prediction.name
+
+
+def run(size: int):
+    random.seed(0)
+    pq = PriorityQueue(size, identifier=identifier)
+    predictions = [Prediction(i) for i in range(2*size)]
+    for prediction in predictions[:size]: pq.push(prediction, random.random())
+    results = {}
+
+    t0 = perf_counter()
+    for prediction in predictions[size:]: pq.push(prediction, random.random())
+    results['push'] = size/(perf_counter() - t0)
+
+    t0 = perf_counter()
+    for _ in range(size): pq.edit(predictions[random.randrange(size, 2*size)], random.random(), identifier)
+    results['edit'] = size/(perf_counter() - t0)
+
+    t0 = perf_counter()
+    for _ in range(size):
+        prediction = pq.random_pop()
+        if prediction is not None: pq.push(prediction, random.random())
+    results['random_pop'] = size/(perf_counter() - t0)
+
+    t0 = perf_counter()
+    while len(pq) > 0: pq.pop()
+    results['pop'] = size/(perf_counter() - t0)
+    return results
+
+
+def main(*sizes: int):
+    print(f'{"size":>6} | ' + ' | '.join(f'{name:>10}' for name in ('push', 'edit', 'random_pop', 'pop')))
+    for size in sizes or (100, 1000, 10000):
+        results = run(size)
+        print(f'{size:>6} | ' + ' | '.join(f'{ops:>10.0f}' for ops in results.values()))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
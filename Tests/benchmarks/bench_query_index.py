@@ -0,0 +1,52 @@
+'''
+Benchmark of answering the wh-questions in `Memory`.
+
+The judgements `<s{i} --> p{j}>` are accepted by a memory, with the queries `<?x --> p{j}>` and `<s{i} --> ?x>` pending for the first few `i` and `j`. Then, it reports the mean time of `Memory._solve_judgement` for some judgements accepted again, and of `Memory._solve_query` for the queries, with the counters `Memory.query_fanout` per call.
+
+Usage:
+    python -m Tests.benchmarks.bench_query_index [n_judgements...]
+'''
+import random
+import sys
+from time import perf_counter
+
+from pynars import Narsese
+from pynars.NARS.DataStructures import Memory
+
+
+def run(n_judgements: int, n_queries: int, n_probes: int=1000):
+    random.seed(0)
+    n_terms = int(n_judgements**0.5)
+    memory = Memory(10*n_judgements, 100)
+    queries = [Narsese.parser.parse(f'<?x --> p{j}>?') for j in range(n_queries//2)]
+    queries += [Narsese.parser.parse(f'<s{i} --> ?x>?') for i in range(n_queries - n_queries//2)]
+    judgements = [Narsese.parser.parse(f'<s{random.randrange(n_terms)} --> p{random.randrange(n_terms)}>.') for _ in range(n_judgements)]
+    for task in judgements: memory.accept(task)
+    for task in queries: memory.accept(task)
+
+    results = {}
+    for name, solve, tasks in (('judgement', memory._solve_judgement, judgements[:n_probes]), ('query', memory._solve_query, queries)):
+        if len(tasks) == 0: continue
+        fanout = dict(memory.query_fanout)
+        t = 0.0
+        for task in tasks:
+            concept = memory.take_by_key(task.term, remove=False)
+            t0 = perf_counter()
+            solve(task, concept)
+            t += perf_counter() - t0
+        checked = sum(memory.query_fanout[key] - fanout.get(key, 0) for key in ('candidate_queries', 'candidate_beliefs'))
+        matched = memory.query_fanout['matched'] - fanout.get('matched', 0)
+        results[name] = (t/len(tasks), checked/len(tasks), matched/len(tasks))
+    return results
+
+
+def main(*sizes: int):
+    print(f'{"judgements":>10} | {"queries":>7} | {"solve":>9} | {"us/call":>8} | {"checked":>7} | {"matched":>7}')
+    for n_judgements in sizes or (2000, 8000):
+        for n_queries in (0, n_judgements//40):
+            for name, (t, checked, matched) in run(n_judgements, n_queries).items():
+                print(f'{n_judgements:>10} | {n_queries:>7} | {name:>9} | {t*1e6:>8.1f} | {checked:>7.2f} | {matched:>7.2f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,65 @@
+'''
+Benchmark of running many cycles in a row, in cycles/s.
+
+"deepcopy": a copy of the output of each cycle is kept, the way `Console.run_line` and `NARSInterface.run_line` used to.
+"cycles": `Reasoner.cycles`, keeping the output of each cycle.
+"run": `Reasoner.run` without a sink.
+"run+ring": `Reasoner.run` into a ring buffer of the last 100 outputs.
+
+Each one runs with a new reasoner with the same seed, after the premises of `Tests/examples/multi_steps/nal1.multistep.nal`. The best of `n_rounds` rounds is reported.
+
+Usage:
+    python -m Tests.benchmarks.bench_run [n_cycles] [n_rounds]
+'''
+import gc
+import sys
+from collections import deque
+from copy import deepcopy
+from time import perf_counter
+
+from pynars.Global import ReasonerContext
+from pynars.NARS import Reasoner
+
+premises = [
+    '<a --> b>. %1.00;0.90%',
+    '<b --> c>. %1.00;0.90%',
+    '<c --> d>. %1.00;0.90%',
+    '<a --> d>?',
+]
+
+
+def run_deepcopy(nars: Reasoner, n_cycles: int):
+    outputs = []
+    for _ in range(n_cycles):
+        outputs.append(deepcopy(nars.cycle()))
+
+
+def run_cycles(nars: Reasoner, n_cycles: int):
+    nars.cycles(n_cycles)
+
+
+def run_run(nars: Reasoner, n_cycles: int):
+    nars.run(n_cycles)
+
+
+def run_ring(nars: Reasoner, n_cycles: int):
+    nars.run(n_cycles, deque(maxlen=100))
+
+
+def main(n_cycles: int=10000, n_rounds: int=2):
+    results = {}
+    for _ in range(n_rounds):
+        for name, func in (('deepcopy', run_deepcopy), ('cycles', run_cycles), ('run', run_run), ('run+ring', run_ring)):
+            nars = Reasoner(100, 100, context=ReasonerContext(seed=0))
+            for premise in premises: nars.input_narsese(premise)
+            gc.collect()
+            t0 = perf_counter()
+            func(nars, n_cycles)
+            results[name] = max(results.get(name, 0), n_cycles/(perf_counter() - t0))
+            del nars
+    for name, cycles_per_sec in results.items():
+        print(f'{name:>9}: {cycles_per_sec:8.0f} cycles/s, {cycles_per_sec/results["deepcopy"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
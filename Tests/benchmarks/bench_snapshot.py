@@ -0,0 +1,74 @@
+'''
+Benchmark of the snapshots of a `Memory` (see `Snapshot.py`), in seconds.
+
+For each size, a memory is filled with judgements `<s_i --> p_j>` until it has that many concepts (the statements, and their subjects and predicates), and a question is asked about some of them.
+
+"save": `Memory.save`.
+"load": `Memory.load` into an empty memory, where the tables and links of the concepts are not read yet. The memory saved is dropped and the table of interned terms is cleared before, so that all the terms are built again, as in a new process.
+"access": the tables of all the concepts are then accessed, so that they are all read.
+
+Usage:
+    python -m Tests.benchmarks.bench_snapshot [sizes...]
+'''
+import gc
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from pynars import Global
+from pynars.NARS.DataStructures import Memory
+from pynars.Narsese import Copula, Statement, Task, Term, intern_clear
+
+
+def fill(memory: Memory, n_concepts: int):
+    n_atoms = max(2, int(n_concepts**0.5))
+    subjects = [Term(f's_{i}') for i in range(n_atoms)]
+    predicates = [Term(f'p_{i}') for i in range(n_atoms)]
+    i = 0
+    while len(memory) < n_concepts:
+        subject, predicate = subjects[i % n_atoms], predicates[(i // n_atoms + i) % n_atoms]
+        term = Statement(subject, Copula.Inheritance, predicate)
+        memory.accept(Task.new_judgement(term))
+        if i % 10 == 0: memory.accept(Task.new_question(term))
+        i += 1
+
+
+def run(n_concepts: int, path: str):
+    with Global.ReasonerContext(seed=0):
+        memory = Memory(n_concepts)
+        fill(memory, n_concepts)
+        results = {}
+
+        t0 = perf_counter()
+        memory.save(path)
+        results['save'] = perf_counter() - t0
+        n_concepts_saved = len(memory)
+        del memory
+        intern_clear()
+        gc.collect()
+
+        memory_loaded = Memory(n_concepts)
+        t0 = perf_counter()
+        memory_loaded.load(path)
+        results['load'] = perf_counter() - t0
+
+        t0 = perf_counter()
+        for concept in memory_loaded.concepts: concept.belief_table
+        results['access'] = perf_counter() - t0
+        assert len(memory_loaded) == n_concepts_saved
+    return results
+
+
+def main(*sizes: int):
+    print(f'{"concepts":>8} | {"KiB":>8} | {"B/concept":>9} | ' + ' | '.join(f'{name:>8}' for name in ('save', 'load', 'access')))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'memory.snapshot')
+        for size in sizes or (1000, 10000, 100000):
+            results = run(size, path)
+            n_bytes = os.path.getsize(path)
+            print(f'{size:>8} | {n_bytes/1024:>8.0f} | {n_bytes/size:>9.0f} | ' + ' | '.join(f'{t:>8.3f}' for t in results.values()))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
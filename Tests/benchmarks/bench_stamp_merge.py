@@ -0,0 +1,42 @@
+'''
+Benchmark of `Stamp_merge`, in merges per second.
+
+"premises": the stamps of two premises with evidential bases of `size` evidences each are merged, as in each inference step.
+"chain": the stamp of each conclusion is merged with a stamp of an input, so that the bases grow up to `size` evidences, as in a chain of derivations.
+
+Usage:
+    python -m Tests.benchmarks.bench_stamp_merge [sizes...]
+'''
+import sys
+from time import perf_counter
+
+from pynars.NAL.Functions.StampFunctions import Stamp_merge
+from pynars.Narsese import Base, Stamp
+
+
+def run_premises(size: int, n: int):
+    stamp1 = Stamp(0, None, None, Base(tuple(range(size))))
+    stamp2 = Stamp(0, None, None, Base(tuple(range(size, 2*size))))
+    t0 = perf_counter()
+    for _ in range(n): Stamp_merge(stamp1, stamp2)
+    return n/(perf_counter() - t0)
+
+
+def run_chain(size: int, n: int):
+    inputs = [Stamp(0, 0, None, Base((i,))) for i in range(size)]
+    t0 = perf_counter()
+    for _ in range(n//size):
+        stamp = inputs[0]
+        for stamp_input in inputs[1:]: stamp = Stamp_merge(stamp, stamp_input)
+    return (n//size)*(size - 1)/(perf_counter() - t0)
+
+
+def main(*sizes: int):
+    print(f'{"size":>6} | {"premises":>10} | {"chain":>10}')
+    for size in sizes or (2, 8, 32, 128):
+        n = 20000
+        print(f'{size:>6} | {run_premises(size, n):>10.0f} | {run_chain(size, n):>10.0f}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,72 @@
+'''
+Microbenchmark of the belief table of a concept, when it is full (`Config.capacity_table`).
+
+"add": adding a task, half of the times one already in the table, with the `depq.DEPQ` the table used to wrap, and with `Table`.
+"match": selecting the best solution to a question, the way `Concept.match_belief` used to (a list of the qualities and `max`), and with `Table.match` scoring the tasks one by one and vectorized.
+
+Usage:
+    python -m Tests.benchmarks.bench_table [n_tasks] [capacity]
+'''
+import random
+import sys
+from time import perf_counter
+
+from depq import DEPQ
+
+from pynars import Global, Narsese
+from pynars.Config import Config
+from pynars.NAL.Functions.Tools import calculate_solution_quality
+from pynars.NARS.DataStructures import Table
+
+
+def add_depq(depq: DEPQ, task, p):
+    if task in depq:
+        depq.remove(task)
+    depq.insert(task, p)
+
+
+def match_list(table: Table, sentence):
+    qualities = [(calculate_solution_quality(sentence, task.sentence), task) for task in table]
+    _, item_max = max(qualities, key=lambda quality: quality[0])
+    return item_max
+
+
+def timeit(func, args_list, n_repeat=1, n_best_of=5):
+    durations = []
+    for _ in range(n_best_of):
+        t0 = perf_counter()
+        for _ in range(n_repeat):
+            for args in args_list: func(*args)
+        durations.append((perf_counter() - t0)/(n_repeat*len(args_list)))
+    return min(durations)
+
+
+def main(n_tasks: int=300, capacity: int=None):
+    capacity = capacity if capacity is not None else Config.capacity_table
+    random.seed(0)
+    Global.time = 100
+    tasks = []
+    for i in range(n_tasks):
+        tense = random.choice(('', '', ':|:', ':\\:'))
+        task = Narsese.parse(f'<robin --> bird>. {tense} %{random.random():.2f};{0.01+random.random()*0.98:.2f}%')
+        if not task.is_eternal: task.stamp.t_occurrence = random.randint(0, 100)
+        tasks.append(task)
+    ops = [(random.choice(tasks), random.random()) for _ in range(20000)]
+
+    depq = DEPQ(maxlen=capacity)
+    t_add_depq = timeit(lambda task, p: add_depq(depq, task, p), ops, n_best_of=1)
+    table = Table(capacity)
+    t_add_table = timeit(table.add, ops, n_best_of=1)
+    print(f'add: {t_add_depq*1e6:.2f}us (DEPQ) vs {t_add_table*1e6:.2f}us (Table), {t_add_depq/t_add_table:.1f}x')
+
+    questions = [(Narsese.parse(line).sentence,) for line in ('<robin --> bird>?', '<robin --> bird>? :|:')]
+    t_list = timeit(lambda sentence: match_list(table, sentence), questions, 1000)
+    table.vectorized = False
+    t_scalar = timeit(table.match, questions, 1000)
+    table.vectorized = True
+    t_vectorized = timeit(table.match, questions, 1000)
+    print(f'match ({len(table)} beliefs): {t_list*1e6:.1f}us (list) vs {t_scalar*1e6:.1f}us (Table, one by one) vs {t_vectorized*1e6:.1f}us (Table, vectorized), {t_list/t_vectorized:.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,56 @@
+'''
+Benchmark of the term-link scan of `Reasoner.inference_step`, on `Tests/examples/multi_steps/stresstest_bird1.nal`, where `bird` and `fly` become hub concepts.
+
+For each cap on the term-links matched per step (`Config.max_term_links_matched`, `None` for all of them), it reports the cycles per second, the mean duration of the scan (see `CycleProfiler`), the number of inference steps with a belief found, and the best answer to `<{bA} --> fly>?` with the cycle it was found at.
+A first run, which is not reported, warms up the caches shared by the reasoners, so that each reported run starts in the same state.
+
+Usage:
+    python -m Tests.benchmarks.bench_term_links [n_cycles] [seed]
+'''
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from pynars.Config import Config
+from pynars.Global import ReasonerContext
+from pynars.NARS import Reasoner, CycleProfiler
+
+path = Path(__file__).parent.parent/'examples/multi_steps/stresstest_bird1.nal'
+
+
+def run(n_cycles: int, seed: int):
+    nars = Reasoner(100, 100, context=ReasonerContext(seed=seed))
+    with open(path) as f:
+        lines = [line.strip() for line in f if line.strip() and not line.startswith("'")]
+    for line in lines: nars.input_narsese(line)
+
+    best = (0.0, None)
+    def sink(tasks_line):
+        nonlocal best
+        answers = tasks_line[3]
+        if answers is None: return
+        for answer in answers:
+            if answer.truth.c > best[0]: best = (answer.truth.c, nars.context.time)
+
+    nars.profiler = profiler = CycleProfiler()
+    t0 = perf_counter()
+    nars.run(n_cycles, sink)
+    duration = perf_counter() - t0
+    scan = profiler.histograms['consider.term_link_scan']
+    n_valid = sum(profiler.counters.get(f'cache_{result}.syllogistic', 0) for result in ('hits', 'misses'))
+    return n_cycles/duration, scan.mean, n_valid, best
+
+
+def main(n_cycles: int=3000, seed: int=0):
+    max_default = Config.max_term_links_matched
+    run(n_cycles, seed)
+    print(f'{"max links":>9} | {"cycles/s":>8} | {"scan (us)":>9} | {"#beliefs":>8} | best answer')
+    for max_links in (None, 20, max_default, 5):
+        Config.max_term_links_matched = max_links
+        cycles_per_sec, t_scan, n_valid, (c, t) = run(n_cycles, seed)
+        print(f'{str(max_links):>9} | {cycles_per_sec:>8.0f} | {t_scan*1e6:>9.1f} | {n_valid:>8} | c={c:.2f} at cycle {t}')
+    Config.max_term_links_matched = max_default
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
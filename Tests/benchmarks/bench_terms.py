@@ -0,0 +1,84 @@
+'''
+Benchmark of the hash-consing of terms (see `pynars/Narsese/_py/Intern.py`), with interning disabled and enabled.
+
+It replays the premises of `Tests/test_NAL` through `KanrenEngine` (see `bench_kanren_rules.py`) and reports the number of terms built and the time spent.
+It also parses the premises again and looks the new terms up in a hash table keyed by the first ones, the way `Bag` and `Memory` look up concepts by term.
+
+Usage:
+    python -m Tests.benchmarks.bench_terms
+'''
+from time import perf_counter
+
+from pynars import Narsese
+from pynars.Narsese import Term, intern_info, intern_clear
+from pynars.NARS.InferenceEngine import KanrenEngine
+from Tests.benchmarks.nal_premises import load_premises
+from Tests.benchmarks.bench_kanren_rules import run
+
+n_built = 0
+_init = Term.__init__
+
+
+def _init_counted(self, *args, **kwargs):
+    global n_built
+    n_built += 1
+    _init(self, *args, **kwargs)
+
+
+def parse_all(premises):
+    sentences = []
+    for premise1, premise2 in premises:
+        try:
+            sentence1 = Narsese.parse(premise1.strip()).sentence
+            sentence2 = Narsese.parse(premise2.strip()).sentence if premise2 is not None else None
+        except Exception:
+            continue
+        sentences.append((sentence1, sentence2))
+    return sentences
+
+
+def lookup(terms_keys, terms_query, n_repeat=200):
+    table = {term: i for i, term in enumerate(terms_keys)}
+    t0 = perf_counter()
+    for _ in range(n_repeat):
+        for term in terms_query:
+            table[term]
+    return (perf_counter() - t0)/(n_repeat*len(terms_query))
+
+
+def main():
+    global n_built
+    premises = load_premises()
+    engine = KanrenEngine()
+    Term.__init__ = _init_counted
+
+    print(f'{"interning":>9} | {"#built (parse)":>14} | {"#built (derive)":>15} | {"derive (s)":>10} | {"lookup (ns)":>11}')
+    conclusions = {}
+    for enabled in (False, True):
+        Term.interning_enabled = enabled
+        intern_clear()
+
+        n_built = 0
+        sentences = parse_all(premises)
+        n_parse = n_built
+
+        n_built = 0
+        t0 = perf_counter()
+        conclusions[enabled], _ = run(engine, sentences)
+        t_derive = perf_counter() - t0
+        n_derive = n_built
+
+        terms_keys = list({s.term: None for pair in sentences for s in pair if s is not None})
+        terms_query = [s.term for pair in parse_all(premises) for s in pair if s is not None]
+        t_lookup = lookup(terms_keys, terms_query)
+        print(f'{str(enabled):>9} | {n_parse:>14} | {n_derive:>15} | {t_derive:>10.2f} | {t_lookup*1e9:>11.0f}')
+
+    Term.__init__ = _init
+    Term.interning_enabled = True
+    print(intern_info())
+    n_mismatch = sum(1 for c1, c2 in zip(conclusions[False], conclusions[True]) if c1 != c2)
+    print(f'#mismatches={n_mismatch}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+'''
+The premises used by `Tests/test_NAL`, extracted from the calls of `process_two_premises` in the test files, so that benchmarks can replay them.
+'''
+import ast
+from pathlib import Path
+from typing import List, Tuple, Union
+
+from pynars import Narsese
+from pynars.Narsese import Sentence
+
+root_tests = Path(__file__).parent.parent/'test_NAL'
+
+
+def load_premises() -> List[Tuple[str, Union[str, None]]]:
+    '''
+    Returns:
+        List[Tuple[str, Union[str, None]]]: the pairs of premises (the second one may be `None`), in the order they appear in the test files.
+    '''
+    premises = []
+    for filepath in sorted(root_tests.glob('test_NAL*.py')):
+        tree = ast.parse(filepath.read_text(encoding='utf-8'))
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'process_two_premises'): continue
+            args = [arg.value if isinstance(arg, ast.Constant) else ... for arg in node.args[:2]]
+            if len(args) < 2 or not isinstance(args[0], str) or not (args[1] is None or isinstance(args[1], str)): continue
+            premises.append((args[0], args[1]))
+    return premises
+
+
+def load_sentences() -> List[Tuple[Sentence, Union[Sentence, None]]]:
+    '''The pairs of premises parsed into sentences. The premises which cannot be parsed are skipped.'''
+    sentences = []
+    for premise1, premise2 in load_premises():
+        try:
+            sentence1 = Narsese.parse(premise1.strip()).sentence
+            sentence2 = Narsese.parse(premise2.strip()).sentence if premise2 is not None else None
+        except Exception:
+            continue
+        sentences.append((sentence1, sentence2))
+    return sentences
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import unittest
+
+from pynars.Global import ReasonerContext
+from pynars.NARS import Reasoner, AsyncReasoner
+from pynars.NARS.DataStructures import AsyncChannel, Channel
+from pynars.Narsese import Task, Term
+
+premises = [
+    '<a --> b>. %1.00;0.90%',
+    '<b --> c>. %1.00;0.90%',
+    '<c --> d>. %1.00;0.90%',
+    '<a --> d>?',
+]
+
+
+def outputs_str(tasks_line):
+    tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest, _ = tasks_line
+    return ([str(task) for task in tasks_derived], str(judgement_revised), str(goal_revised), str(answers_question), str(answers_quest))
+
+
+class TEST_AsyncChannel(unittest.TestCase):
+
+    def test_backpressure(self):
+        '''A producer waits while the channel is full, until some items are taken out.'''
+        async def main():
+            channel = AsyncChannel(2)
+            channel.put_nowait(1)
+            channel.put_nowait(2)
+            self.assertRaises(asyncio.QueueFull, channel.put_nowait, 3)
+            producer = asyncio.create_task(channel.put(3))
+            await asyncio.sleep(0)
+            self.assertFalse(producer.done())
+            self.assertEqual([item for item, _ in channel.take_nowait(1)], [1])
+            await producer
+            self.assertEqual([item for item, _ in channel.take_nowait(10)], [2, 3])
+            self.assertEqual(len(channel), 0)
+        asyncio.run(main())
+
+
+class TEST_AsyncReasoner(unittest.TestCase):
+
+    def test_same_as_run(self):
+        '''The inputs queued before a run are ingested before its first cycle.'''
+        nars = Reasoner(100, 100, context=ReasonerContext(seed=0))
+        driver = AsyncReasoner(nars, cycles_per_step=7)
+        outputs = []
+        async def main():
+            for premise in premises: await driver.input_narsese(premise)
+            return await driver.run(50, lambda tasks_line: outputs.append(outputs_str(tasks_line)))
+        self.assertEqual(asyncio.run(main()), 50)
+        driver.close()
+
+        nars = Reasoner(100, 100, context=ReasonerContext(seed=0))
+        for premise in premises: nars.input_narsese(premise)
+        expected = [outputs_str(nars.cycle()) for _ in range(50)]
+        self.assertEqual(outputs, expected)
+
+    def test_producers(self):
+        '''Many producers feed the reasoner through small channels, and none of their inputs is dropped.'''
+        nars = Reasoner(1000, 100, context=ReasonerContext(seed=0))
+        nars.inputs_per_cycle = 2
+        driver = AsyncReasoner(nars, cycles_per_step=2, capacity=4)
+        channel = driver.add_channel(4)
+        self.assertIn(channel.target, nars.channels)
+        n_producers, n_inputs = 8, 10
+
+        async def produce_narsese(i):
+            for j in range(n_inputs):
+                await driver.input_narsese(f'<s{i}_{j} --> p>.')
+
+        async def produce_tasks(i):
+            for j in range(n_inputs):
+                await channel.put(Task.new_judgement(Term(f't{i}_{j}')))
+
+        async def main():
+            run = asyncio.create_task(driver.run())
+            await asyncio.gather(*(produce_narsese(i) for i in range(n_producers)), *(produce_tasks(i) for i in range(n_producers)))
+            while len(driver.narsese_channel) > 0 or len(channel) > 0:
+                await asyncio.sleep(0.001)
+            driver.stop()
+            return await run
+
+        n_cycles = asyncio.run(main())
+        driver.close()
+        self.assertEqual(driver.ingest_latency.count, 2*n_producers*n_inputs)
+        self.assertEqual(driver.n_cycles, n_cycles)
+        self.assertEqual(nars.cycles_count, n_cycles)
+        self.assertEqual(driver.cycle_duration.count, n_cycles)
+        self.assertEqual(driver.cycle_interval.count, n_cycles - 1)
+
+        stats = json.loads(json.dumps(driver.stats()))
+        self.assertEqual(stats['queued'], [0, 0])
+        self.assertEqual(stats['ingest_latency']['count'], 2*n_producers*n_inputs)
+        self.assertLessEqual(stats['cycle_interval']['p50'], stats['cycle_interval']['max'])
+
+    def test_shared_target(self):
+        '''The channels ingested into the same target do not overfill it together.'''
+        nars = Reasoner(100, 100, context=ReasonerContext(seed=0))
+        driver = AsyncReasoner(nars)
+        target = Channel(4)
+        channels = [driver.add_channel(6, target) for _ in range(2)]
+        async def main():
+            for i, channel in enumerate(channels):
+                for j in range(6):
+                    await channel.put(Task.new_judgement(Term(f't{i}_{j}')))
+            await driver.run(1)
+        asyncio.run(main())
+        driver.close()
+        self.assertEqual(len(target), 4)
+        self.assertEqual(sum(len(channel) for channel in channels), 8)
+
+    def test_narsese_lines(self):
+        '''The lines of Narsese are parsed at once, and the comments are skipped.'''
+        nars = Reasoner(100, 100, context=ReasonerContext(seed=0))
+        driver = AsyncReasoner(nars)
+        async def main():
+            for line in ('// a comment', '<a --> b>.', '', '<b --> c>.'):
+                await driver.input_narsese(line)
+            await driver.run(1)
+        asyncio.run(main())
+        driver.close()
+        self.assertEqual(driver.ingest_latency.count, 4)
+        self.assertEqual(len(nars.narsese_channel), 1) # the other task is taken by the cycle
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_AsyncChannel,
+        TEST_AsyncReasoner,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -125,6 +125,105 @@ class TEST_Bag(unittest.TestCase):
         plt.savefig(f'./Tests/test_Bag_take_{n}')
         plt.show()
 
+    def _run_random_operations(self, engine: str, take_in_order: bool):
+        import random
+        bag = Bag(50, 10, take_in_order=take_in_order, engine=engine)
+        tasks = [Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), Budget(i/200, 0.5, 0.5)) for i in range(200)]
+        random.seed(0)
+        taken = []
+        for _ in range(2000):
+            task = tasks[random.randrange(len(tasks))]
+            op = random.random()
+            if op < 0.5: item = bag.put(task)
+            elif op < 0.7: item = bag.take_by_key(task)
+            elif op < 0.8: item = bag.take_min()
+            elif op < 0.9: item = bag.take_max()
+            else: item = bag.take()
+            taken.append(hash(item) if item is not None else None)
+            self.assertEqual(len(bag), bag.count())
+            self.assertEqual(set(bag.level_lut), set(bag.item_lut.lut))
+        return taken, sorted(hash(item) for item in bag)
+
+    def test_bag_engines_equivalent(self):
+        '''the indexed buckets should behave the same as the list-backed ones'''
+        self.assertEqual(self._run_random_operations('list', True), self._run_random_operations('indexed', True))
+        # when taking randomly, the sequences of random numbers consumed differ, so only the consistency is checked.
+        self._run_random_operations('indexed', False)
+
+    def test_bag_take_by_key_after_priority_changed(self):
+        '''the item should be removed from its bucket even if its priority has been changed while being in the bag'''
+        bag = Bag(1000, 100, engine='indexed')
+        task = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.2, 0.5, 0.5))
+        bag.put(task)
+        task.budget.priority = 0.9
+        self.assertIs(bag.take_by_key(task), task)
+        self.assertEqual(len(bag), 0)
+        self.assertEqual(bag.count(), 0)
+        self.assertIsNone(bag.take())
+
+    def test_bag_evict_min(self):
+        '''when the bag is full, the item with the lowest priority is evicted'''
+        bag = Bag(10, 10, engine='indexed')
+        tasks = [Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), Budget(0.05 + i/10, 0.5, 0.5)) for i in range(10)]
+        for task in tasks[1:]: bag.put(task)
+        bag.put(tasks[0])
+        task = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.5, 0.5, 0.5))
+        self.assertIs(bag.put(task), tasks[0])
+        self.assertIn(task, bag)
+        self.assertEqual(len(bag), 10)
+        self.assertEqual(len(bag), bag.count())
+
+    def test_bag_update_budget(self):
+        '''the item is moved to another level only if the level of its priority changes'''
+        for engine in ('list', 'indexed'):
+            bag = Bag(1000, 10, engine=engine)
+            task1 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.52, 0.5, 0.5))
+            task2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal'))), Budget(0.51, 0.5, 0.5))
+            bag.put(task1)
+            bag.put(task2)
+            self.assertIs(bag.reprioritize(task1, 0.53), task1)
+            self.assertEqual(list(bag.levels[5]), [task1, task2])
+
+            def set_priority(budget: Budget): budget.priority = 0.91
+            def set_durability(budget: Budget): budget.durability = 0.9
+            self.assertIs(bag.update_budget(task1, set_priority, set_durability), task1)
+            self.assertEqual(task1.budget.durability, 0.9)
+            self.assertEqual(list(bag.levels[5]), [task2])
+            self.assertEqual(list(bag.levels[9]), [task1])
+            self.assertIs(bag.take_max(), task1)
+            self.assertEqual(len(bag), bag.count())
+
+            task3 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('animal'))))
+            self.assertIsNone(bag.reprioritize(task3, 0.1))
+            self.assertNotIn(task3, bag)
+
+    def test_bag_put_merge_relevel(self):
+        '''merging a duplicate item moves the item to the level of the merged priority'''
+        bag = Bag(1000, 10, engine='indexed')
+        task = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.1, 0.5, 0.5))
+        bag.put(task)
+        bag.put(Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.9, 0.5, 0.5)))
+        self.assertEqual(len(bag.levels[1]), 0)
+        self.assertEqual(bag.level_lut[hash(task)], bag.map_priority(task.budget.priority))
+        self.assertIs(bag.take_by_key(task), task)
+        self.assertEqual(bag.count(), 0)
+
+    def test_bag_peek(self):
+        '''the items are peeked at in the order in which they would be taken out, and are left in place'''
+        for engine in ('list', 'indexed'):
+            bags = Bag(1000, 10, engine=engine), Bag(1000, 10, engine=engine)
+            for bag in bags:
+                for i in range(20):
+                    bag.put(Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), Budget(0.05*(i%7) + 0.6*(i%2), 0.5, 0.5)))
+            bag_peeked, bag_taken = bags
+            levels = [list(level) for level in bag_peeked.levels]
+            items_peeked = [item.term for item in bag_peeked.peek()]
+            items_taken = [bag_taken.take().term for _ in range(20)]
+            self.assertEqual(items_peeked, items_taken)
+            self.assertEqual([list(level) for level in bag_peeked.levels], levels)
+            self.assertEqual(len(list(bag_peeked.peek(5))), 5)
+            self.assertEqual(list(bag_peeked.peek(0)), [])
+            self.assertEqual(list(Bag(10, 10, engine=engine).peek()), [])
 
 
 if __name__ == '__main__':
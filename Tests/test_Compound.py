@@ -90,6 +90,13 @@ class TEST_Compound(unittest.TestCase):
         line = '(&&, <(&&, <#x-->bird>, <#x-->swimer>)-->#y>, <swan-->#y>).'
         term = Narsese.parse(line).term
         pass
+
+    def test_empty(self):
+        '''the intersection of two disjoint sets has no component left'''
+        from pynars.Narsese import EmptyCompound
+        c1 = Compound.ExtensionalSet(Term("A"))
+        c2 = Compound.ExtensionalSet(Term("B"))
+        self.assertRaises(EmptyCompound, Compound, Connector.ExtensionalIntersection, c1, c2)
         
 
 if __name__ == '__main__':
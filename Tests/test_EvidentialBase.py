@@ -4,7 +4,10 @@ import unittest
 from pynars.NARS.DataStructures import Bag, Task, Concept
 from pynars.Narsese import Judgement, Term, Statement, Copula, Truth   
 
-from pynars.Narsese import Base, Task
+from pynars.Narsese import Base, Task, Stamp
+from pynars.NAL.Functions.StampFunctions import Stamp_merge
+from pynars.Config import Config
+from copy import deepcopy
 
 class TEST_Base(unittest.TestCase):
     def __init__(self, methodName: str = ...) -> None:
@@ -16,9 +19,10 @@ class TEST_Base(unittest.TestCase):
         task2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal'))))
         task3 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('animal'))))
         base = Base()
-        base.add(task1)
-        base.add(task2)
+        base = base.add(task1)
+        base = base.add(task2)
         self.assertEqual(len(base), 2)
+        self.assertIs(base.add(task2), base)
         base = Base((task1, task2, task3))
         self.assertEqual(len(base), 3)
 
@@ -65,12 +69,61 @@ class TEST_Base(unittest.TestCase):
         self.assertIsNone(base._hash)
         h1 = hash(base)
         self.assertIsNotNone(base._hash)
-        base.add(task3)
+        base = base.add(task3)
         self.assertIsNone(base._hash)
         h2 = hash(base)
         self.assertIsNotNone(base._hash)
         self.assertNotEqual(h1, h2)
         pass
 
+    def test_merge(self):
+        '''the evidences are interleaved, into a new base of bounded length'''
+        base1 = Base((1, 2, 3))
+        base2 = Base((4, 2))
+        base = Base.merge(base1, base2)
+        self.assertEqual(tuple(base), (4, 1, 2, 3))
+        self.assertEqual(tuple(base1), (1, 2, 3))
+        self.assertEqual(tuple(base2), (4, 2))
+        self.assertIs(Base.merge(base1, None), base1)
+        self.assertEqual(base, Base((4, 1, 2, 3)))
+        self.assertEqual(hash(base), hash(Base((4, 1, 2, 3))))
+
+        maximum_evidental_base_length = Config.maximum_evidental_base_length
+        Config.maximum_evidental_base_length = 3
+        try:
+            self.assertEqual(tuple(Base.merge(Base((1, 2, 3)), Base((4, 5)))), (4, 1, 5, 2))
+            self.assertEqual(tuple(Base.merge(Base((1, 2, 3, 4, 5)), Base((6,)))), (6, 1, 2))
+        finally:
+            Config.maximum_evidental_base_length = maximum_evidental_base_length
+
+    def test_fingerprint(self):
+        '''the fingerprints rule out the overlaps, and the evidences are compared only when they intersect'''
+        n_bits = Base.fingerprint_bits
+        base1 = Base((1, 2))
+        base2 = Base((3, 4))
+        self.assertEqual(base1._fingerprint & base2._fingerprint, 0)
+        self.assertFalse(base1.is_overlaped(base2))
+        self.assertIsNone(base1._set) # not compared
+        base3 = Base((3, 2 + n_bits))
+        self.assertFalse(base1.is_overlaped(base3))
+        self.assertIsNotNone(base1._set)
+        self.assertTrue(base1.is_overlaped(base1.add(5)))
+        self.assertTrue(Base.merge(base1, base2).is_overlaped(Base((4,))))
+        self.assertEqual(Base.merge(base1, base2)._fingerprint, Base((1, 2, 3, 4))._fingerprint)
+        self.assertEqual((base1 | base3)._fingerprint, Base((1, 2, 3, 2 + n_bits))._fingerprint)
+
+    def test_stamp_merge(self):
+        '''the stamps are merged without copying their bases'''
+        stamp1 = Stamp(1, 10, None, Base((1,)))
+        stamp2 = Stamp(2, 12, None, Base((2,)))
+        stamp = Stamp_merge(stamp1, stamp2)
+        self.assertEqual((stamp.t_creation, stamp.t_occurrence), (1, 12))
+        self.assertEqual(tuple(stamp.evidential_base), (2, 1))
+        self.assertEqual(tuple(stamp1.evidential_base), (1,))
+        stamp = Stamp_merge(Stamp(1, None, None, Base((1,))), stamp2)
+        self.assertIsNone(stamp.t_occurrence)
+        self.assertIs(deepcopy(stamp).evidential_base, stamp.evidential_base)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from pathlib import Path
+
+from Tests.benchmarks.bench_import_time import run_python
+
+root_path = Path(__file__).parent.parent
+pynars_path = root_path/'pynars'
+
+
+def snapshot(path: Path):
+    return {file: file.stat().st_mtime for file in path.rglob('*') if '__pycache__' not in file.parts}
+
+
+class TEST_ImportTime(unittest.TestCase):
+
+    def test_parser_built_lazily(self):
+        '''the Lark parser and the YAML rules are not loaded by importing'''
+        code = 'import sys, pynars.NARS; from pynars import Narsese; print(Narsese.parser._parser is None, "pynars.Narsese.Parser.narsese_lark" in sys.modules, "yaml" in sys.modules)'
+        self.assertEqual(run_python('-c', code).stdout.split()[-3:], ['True', 'False', 'False'])
+        code = 'from pynars import Narsese; print(Narsese.parse("<(&&,a,b)-->c>.").term)'
+        self.assertEqual(run_python('-c', code).stdout.split('\n')[-2], '<(&&, a, b)-->c>')
+
+    def test_no_write(self):
+        '''importing does not write into the package'''
+        files = snapshot(pynars_path)
+        run_python('-c', 'import pynars.NARS')
+        self.assertEqual(snapshot(pynars_path), files)
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_ImportTime,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -0,0 +1,236 @@
+import shutil
+import tempfile
+import unittest
+from copy import copy
+from pathlib import Path
+
+from pynars import Global, Narsese
+from pynars.NARS.InferenceEngine import KanrenEngine
+from pynars.NARS.InferenceEngine.KanrenEngine.util import InferenceCache
+from Tests.benchmarks.bench_kanren_rules import run
+from Tests.benchmarks.nal_premises import load_sentences
+
+
+class TEST_InferenceCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = InferenceCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), (True, 1))
+        cache.put('c', 3) # evicts 'b', the least recently used
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.get('c'), (True, 3))
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.currsize), (3, 1, 1, 2))
+
+    def test_ttl(self):
+        time = Global.time
+        try:
+            cache = InferenceCache(maxsize=10, ttl=2)
+            cache.put('a', 1)
+            Global.time = time + 2
+            self.assertEqual(cache.get('a'), (True, 1))
+            Global.time = time + 3
+            self.assertEqual(cache.get('a'), (False, None))
+            self.assertEqual(cache.info().evictions, 1)
+            self.assertEqual(len(cache), 0)
+        finally:
+            Global.time = time
+
+
+class TEST_KanrenEngine_cache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = KanrenEngine()
+
+    def setUp(self):
+        self.engine.cache_clear()
+
+    def test_keyed_on_content(self):
+        '''Sentences with the same term, truth, tense and evidential base share the results, whatever the objects.'''
+        engine = self.engine
+        t1 = Narsese.parse('<robin --> bird>. %1.0;0.9%').sentence
+        t2 = Narsese.parse('<bird --> animal>. %1.0;0.9%').sentence
+        res, cached = engine.inference(t1, t2)
+        self.assertFalse(cached)
+        self.assertGreater(len(res), 0)
+
+        res_same, cached = engine.inference(copy(t1), copy(t2))
+        self.assertTrue(cached)
+        self.assertIs(res_same, res)
+
+        # the same judgement input again has another evidential base, so it is reasoned on again.
+        t1_again = Narsese.parse('<robin --> bird>. %1.0;0.9%').sentence
+        res_again, cached = engine.inference(t1_again, t2)
+        self.assertFalse(cached)
+        self.assertEqual(len(res_again), len(res))
+
+        t1_other = Narsese.parse('<robin --> bird>. %1.0;0.8%').sentence
+        _, cached = engine.inference(t1_other, t2)
+        self.assertFalse(cached)
+
+        info = engine.cache_info()['inference']
+        self.assertEqual((info.hits, info.misses), (1, 3))
+        self.assertEqual(engine.cache_info()['backward'].misses, 0)
+
+    def test_keyword_arguments(self):
+        engine = self.engine
+        t = Narsese.parse('<robin --> bird>.').sentence
+        _, cached = engine.inference_immediate(t, backward=True)
+        self.assertFalse(cached)
+        _, cached = engine.inference_immediate(t, backward=False)
+        self.assertFalse(cached)
+        _, cached = engine.inference_immediate(t, backward=True)
+        self.assertTrue(cached)
+
+    def test_bounded(self):
+        engine = self.engine
+        cache = engine.caches['inference_immediate']
+        maxsize = cache.maxsize
+        try:
+            cache.maxsize = 3
+            for i in range(5):
+                engine.inference_immediate(Narsese.parse(f'<a{i} --> b>.').sentence)
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(cache.info().evictions, 2)
+        finally:
+            cache.maxsize = maxsize
+
+
+class TEST_RuleIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = KanrenEngine()
+
+    def tearDown(self):
+        self.engine.rule_index_enabled = KanrenEngine.rule_index_enabled
+
+    def _conclusions(self, method, *args, **kwargs):
+        self.engine.cache_clear()
+        results, _ = getattr(self.engine, method)(*args, **kwargs)
+        return [(str(conclusion[0]), conclusion[1], str(truth)) for conclusion, truth in results]
+
+    def _assert_same(self, method, *args, **kwargs):
+        self.engine.rule_index_enabled = False
+        tried = self.engine.rules_tried[method]
+        expected = self._conclusions(method, *args, **kwargs)
+        n_all = self.engine.rules_tried[method] - tried
+
+        self.engine.rule_index_enabled = True
+        tried = self.engine.rules_tried[method]
+        self.assertEqual(self._conclusions(method, *args, **kwargs), expected)
+        n_index = self.engine.rules_tried[method] - tried
+        self.assertLessEqual(n_index, n_all)
+        return n_all, n_index
+
+    def test_syllogistic(self):
+        premises = [
+            ('<bird --> animal>. %1.00;0.90%', '<robin --> bird>. %1.00;0.90%'),
+            ('<sport --> competition>. %1.00;0.90%', '<chess --> competition>. %0.90;0.90%'),
+            ('<robin <-> swan>. %1.00;0.90%', '<gull <-> swan>. %1.00;0.90%'),
+            ('<<robin --> bird> ==> <robin --> animal>>. %1.00;0.90%', '<robin --> bird>. %1.00;0.90%'),
+            ('<(&&, <robin --> swimmer>, <robin --> [flying]>) ==> <robin --> bird>>. %1.00;0.90%', '<robin --> [flying]>. %1.00;0.90%'),
+            ('<{key1} --> (/, open, _, {lock1})>. %1.00;0.90%', '<$x --> key>. %1.00;0.90%'),
+        ]
+        for premise1, premise2 in premises:
+            t1 = Narsese.parse(premise1).sentence
+            t2 = Narsese.parse(premise2).sentence
+            n_all, n_index = self._assert_same('inference', t1, t2)
+            self._assert_same('inference', t2, t1)
+            self._assert_same('inference_compositional', t1, t2)
+        self.assertLess(n_index, n_all)
+
+    def test_backward_and_immediate(self):
+        t1 = Narsese.parse('<robin --> animal>?').sentence
+        t2 = Narsese.parse('<bird --> animal>. %1.00;0.90%').sentence
+        self._assert_same('backward', t1, t2)
+        self._assert_same('inference_immediate', t1, backward=True)
+        self._assert_same('inference_immediate', t2)
+
+
+class TEST_CompiledRules(unittest.TestCase):
+
+    def test_conformance_NAL(self):
+        '''The compiled rules derive the same conclusions as the miniKanren solver, over the premises of all the NAL tests.'''
+        sentences = load_sentences()
+        engine = KanrenEngine()
+        engine.compiled_rules_enabled = False
+        expected, _ = run(engine, sentences)
+        engine.compiled_rules_enabled = True
+        conclusions, _ = run(engine, sentences)
+        self.assertEqual(conclusions, expected)
+
+    def test_variables_in_premises(self):
+        engine = KanrenEngine()
+        premises = [
+            ('<<$x --> bird> ==> <$x --> animal>>. %1.00;0.90%', '<robin --> bird>. %1.00;0.90%'),
+            ('<{key1} --> (/, open, _, {lock1})>. %1.00;0.90%', '<$x --> key>. %1.00;0.90%'),
+            ('<(&&, <#x --> bird>, <#x --> swimmer>) ==> <#x --> animal>>. %1.00;0.90%', '<#y --> bird>. %1.00;0.90%'),
+        ]
+        for premise1, premise2 in premises:
+            t1 = Narsese.parse(premise1).sentence
+            t2 = Narsese.parse(premise2).sentence
+            results = {}
+            for enabled in (False, True):
+                engine.compiled_rules_enabled = enabled
+                engine.cache_clear()
+                res, _ = engine.inference(t1, t2)
+                results[enabled] = [(str(conclusion[0]), conclusion[1], str(truth)) for conclusion, truth in res]
+            self.assertEqual(results[True], results[False])
+
+
+class TEST_RuleCache(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.attrs = (KanrenEngine._rules, KanrenEngine._rules_digest, KanrenEngine.path_rules, KanrenEngine.path_rules_cache)
+        shutil.copy(KanrenEngine.path_rules, self.root/'nal-rules.yml')
+        KanrenEngine.path_rules = self.root/'nal-rules.yml'
+        KanrenEngine.path_rules_cache = self.root/'nal-rules.pkl'
+        KanrenEngine._rules = None
+
+    def tearDown(self):
+        KanrenEngine._rules, KanrenEngine._rules_digest, KanrenEngine.path_rules, KanrenEngine.path_rules_cache = self.attrs
+        shutil.rmtree(self.root)
+
+    def _conclusions(self, engine):
+        t1 = Narsese.parse('<bird --> animal>. %1.00;0.90%').sentence
+        t2 = Narsese.parse('<robin --> bird>. %1.00;0.90%').sentence
+        res, _ = engine.inference(t1, t2)
+        return [(str(conclusion[0]), conclusion[1], str(truth)) for conclusion, truth in res]
+
+    def test_load_from_disk(self):
+        engine = KanrenEngine()
+        self.assertTrue(KanrenEngine.path_rules_cache.exists())
+        KanrenEngine._rules = None
+        engine_loaded = KanrenEngine()
+        self.assertIsNot(engine_loaded.rules_syllogistic, engine.rules_syllogistic)
+        for rules, rules_loaded in ((engine.rules_syllogistic, engine_loaded.rules_syllogistic), (engine.rules_backward, engine_loaded.rules_backward), (engine.rules_immediate, engine_loaded.rules_immediate)):
+            self.assertEqual([rule[0] for rule in rules_loaded], [rule[0] for rule in rules])
+            self.assertEqual([len(rule[1][1]) for rule in rules_loaded], [len(rule[1][1]) for rule in rules])
+        self.assertEqual([theorem[2] for theorem in engine_loaded.theorems], [theorem[2] for theorem in engine.theorems])
+        self.assertEqual(self._conclusions(engine_loaded), self._conclusions(engine))
+
+    def test_shared(self):
+        engine1 = KanrenEngine()
+        engine2 = KanrenEngine()
+        self.assertIs(engine1.rules_syllogistic, engine2.rules_syllogistic)
+        self.assertIs(engine1.theorems, engine2.theorems)
+
+    def test_invalidated(self):
+        engine = KanrenEngine()
+        mtime = KanrenEngine.path_rules_cache.stat().st_mtime_ns
+        with open(KanrenEngine.path_rules, 'a') as f:
+            f.write('\n# modified\n')
+        engine_modified = KanrenEngine()
+        self.assertIsNot(engine_modified.rules_syllogistic, engine.rules_syllogistic)
+        self.assertNotEqual(KanrenEngine.path_rules_cache.stat().st_mtime_ns, mtime)
+        self.assertEqual(self._conclusions(engine_modified), self._conclusions(engine))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,23 +1,32 @@
-import NARS
+import os
+import tempfile
 import unittest
 
+from pynars import NARS, Narsese, Global
+
 from pynars.NARS.DataStructures import Bag, Task, Memory, Concept
 from pynars.NARS.DataStructures._py.Concept import Concept
 from pynars.Narsese import Judgement, Term, Statement, Copula, Truth   
 
 from pathlib import Path
-import Narsese
 from pynars.Narsese import Compound, Connector
 
 
-def test_conceptualize(self):
-    pass
+def dump(memory: Memory):
+    '''The concepts of a memory, level by level, with their budgets, tables and links.'''
+    concepts = []
+    for pointer, level in enumerate(memory.concepts.levels):
+        for concept in level:
+            tables = [[(str(task), tuple(task.budget), p, tuple(task.evidential_base), task.input_id) for task, p in getattr(concept, name).items()] for name in ('belief_table', 'desire_table', 'question_table', 'quest_table')]
+            links = [[(str(link), link.type, link.component_index) for level_link in getattr(concept, name).levels for link in level_link] for name in ('term_links', 'task_links')]
+            concepts.append((pointer, str(concept.term), tuple(concept.budget), tables, links))
+    return concepts
 
 class TEST_Memory(unittest.TestCase):
 
     def test_conceptualize(self):
         ''''''
-        nars = NARS.Reasoner_3_0_4(100, 100)
+        nars = NARS.Reasoner(100, 100)
 
         line = '<bird-->animal>.'
         task = Narsese.parser.parse(line)
@@ -29,7 +38,7 @@ class TEST_Memory(unittest.TestCase):
 
     def test_accept_1(self):
         ''''''
-        nars = NARS.Reasoner_3_0_4(100, 100)
+        nars = NARS.Reasoner(100, 100)
 
         line = '((&&, <robin-->bird>, <bird-->animal>) ==> <robin-->animal>).'
         task = Narsese.parser.parse(line)
@@ -53,7 +62,7 @@ class TEST_Memory(unittest.TestCase):
 
     def test_accept_2(self):
         ''''''
-        nars = NARS.Reasoner_3_0_4(100, 100)
+        nars = NARS.Reasoner(100, 100)
 
         line = '<bird-->animal>.'
         task = Narsese.parser.parse(line)
@@ -79,6 +88,68 @@ class TEST_Memory(unittest.TestCase):
 
         pass
 
+    def test_save_load(self):
+        '''a memory is restored from a snapshot as it was, and the snapshot of the restored memory is the same'''
+        memory = Memory(100, 100)
+        for line in ('<robin-->bird>. %0.5;0.5%', '<bird-->animal>. %0.7;0.7%', '<robin-->bird>?', '<?x-->animal>?'):
+            memory.accept(Narsese.parser.parse(line))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path1, path2 = os.path.join(directory, '1.snapshot'), os.path.join(directory, '2.snapshot')
+            memory.save(path1)
+            memory_loaded = Memory(100, 100)
+            memory_loaded.load(path1)
+            memory_loaded.save(path2)
+            with open(path1, 'rb') as f1, open(path2, 'rb') as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+        self.assertEqual(len(memory_loaded), len(memory))
+        self.assertEqual(dump(memory_loaded), dump(memory))
+        self.assertEqual([str(task) for task in memory_loaded.query_index], [str(task) for task in memory.query_index])
+        self.assertEqual(set(memory_loaded.belief_index), set(memory.belief_index))
+
+        # the restored beliefs answer the questions
+        task = Narsese.parser.parse('<bird-->animal>?')
+        answers_question = memory_loaded.accept(task)[2]
+        self.assertEqual([str(answer.sentence) for answer in answers_question], ['<bird-->animal>. %0.700;0.700%'])
+
+    def test_load_lazily(self):
+        '''the tables and links of a concept are read when the concept is first accessed'''
+        memory = Memory(100, 100)
+        memory.accept(Narsese.parser.parse('<robin-->bird>.'))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'memory.snapshot')
+            memory.save(path)
+            memory.load(path)
+        concept = memory.take_by_key(Narsese.parser.parse('<robin-->bird>.').term, remove=False)
+        self.assertNotIn('belief_table', concept.__dict__)
+        self.assertEqual(len(concept.belief_table), 1)
+        self.assertIn('belief_table', concept.__dict__)
+        self.assertEqual(len(concept.term_links), 2)
+        with self.assertRaises(AttributeError): concept.no_such_attribute
+
+    def test_save_load_reasoner(self):
+        '''a reasoner restores the clock and the input ids of its context, and carries on from the snapshot'''
+        nars = NARS.Reasoner(100, 100, context=Global.ReasonerContext(seed=0))
+        nars.input_narsese('((&&, <robin-->bird>, <bird-->animal>) ==> <robin-->animal>).')
+        nars.input_narsese('<robin-->bird>.')
+        nars.cycles(10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'reasoner.snapshot')
+            nars.save(path)
+            nars_loaded = NARS.Reasoner(100, 100, context=Global.ReasonerContext(seed=0))
+            nars_loaded.load(path)
+        self.assertEqual((nars_loaded.context.time, nars_loaded.context._input_id), (nars.context.time, nars.context._input_id))
+        self.assertEqual(dump(nars_loaded.memory), dump(nars.memory))
+        nars_loaded.cycles(10)
+        self.assertEqual(nars_loaded.context.time, nars.context.time + 10)
+
+    def test_load_invalid(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'memory.snapshot')
+            with open(path, 'wb') as f: f.write(b'<robin-->bird>.')
+            with self.assertRaises(ValueError): Memory(100, 100).load(path)
+
 
 if __name__ == '__main__':
 
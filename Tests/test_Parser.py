@@ -289,6 +289,54 @@ class TEST_Parser(unittest.TestCase):
         content = Narsese.parser.parse(line).sentence
         pass
 
+    def test_fast_path(self):
+        '''the common shapes are parsed without Lark, with the same results'''
+        from pynars.Narsese.Parser.parser import FastParser
+        lines = [
+            '<robin-->bird>.',
+            '$0.5;0.6$ < robin --> bird >! :|: %0.5; 0.4%',
+            '<<robin-->bird>==><robin-->animal>>. %1;0.9;2%',
+            '<robin {-- bird>? :/:',
+            '<robin --> bird>@ :!-3:',
+        ]
+        parser = Narsese.parser
+        for line in lines:
+            entry = parser._fast.parse(line)
+            self.assertIsNotNone(entry, msg=line)
+            task, task_lark = FastParser.new_task(*entry), parser.parse_lark(line)
+            self.assertIs(task.term, task_lark.term)
+            self.assertEqual(task.sentence.punct, task_lark.sentence.punct)
+            self.assertEqual(task.stamp.t_occurrence, task_lark.stamp.t_occurrence)
+            self.assertEqual(str(task.budget), str(task_lark.budget))
+            if task.is_judgement or task.is_goal:
+                self.assertEqual(str(task.truth), str(task_lark.truth))
+        for line in ('<(&&,a,b)-->c>.', '<$x-->bird>.', '<robin-->bird>. %1.5%', '<robin-->bird>? %1.0;0.9%', '<robin-->bird>. :|: :|:'):
+            self.assertIsNone(parser._fast.parse(line), msg=line)
+
+    def test_parse_cache(self):
+        '''a sentence input again is not parsed again, but still gives a new task'''
+        parser = Narsese.parser
+        parser.cache_clear()
+        task1 = parser.parse('<(&&,a,b)-->c>. %0.9;0.8%')
+        task2 = parser.parse('<(&&,a,b)-->c>.  %0.9;0.8%  ')
+        self.assertEqual(parser.cache_info().hits, 1)
+        self.assertIsNot(task1, task2)
+        self.assertIs(task1.term, task2.term)
+        self.assertEqual(str(task1.sentence), str(task2.sentence))
+        self.assertNotEqual(task1.stamp.evidential_base, task2.stamp.evidential_base)
+        # the terms with variables are not shared
+        task1, task2 = parser.parse('<$x-->bird>.'), parser.parse('<$x-->bird>.')
+        self.assertIsNot(task1.term, task2.term)
+        self.assertEqual(parser.cache_info().currsize, 1)
+        self.assertRaises(Exception, parser.parse, '<robin-->bird>. %1.5%')
+
+    def test_parse_lines(self):
+        lines = ['// comment', '', "'comment", '<robin-->bird>.', '10', '<robin-->bird', '(&&,a,b)?']
+        tasks = list(Narsese.parser.parse_lines(lines))
+        self.assertEqual(len(tasks), 3)
+        self.assertIsNone(tasks[1])
+        self.assertTrue(tasks[2].is_question)
+
     # def test_list(self):
     #     line = '(#,a,b,c,d).'
     #     content = Narsese.parser.parse(line).sentence
@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from pynars.NARS.DataStructures.MC.Utils import PriorityQueue
+
+
+class Item:
+    def __init__(self, name):
+        self.name = name
+
+
+class TEST_PriorityQueue(unittest.TestCase):
+
+    def test_push_pop(self):
+        '''the highest is popped first, and the oldest one among the same values'''
+        pq = PriorityQueue(10)
+        a, b, c, d = Item('a'), Item('b'), Item('c'), Item('d')
+        for item, value in ((a, 0.5), (b, 0.9), (c, 0.5), (d, 0.1)):
+            self.assertIsNone(pq.push(item, value))
+        self.assertEqual([(value, item.name) for value, item in pq], [(0.1, 'd'), (0.5, 'c'), (0.5, 'a'), (0.9, 'b')])
+        self.assertEqual(pq.pop(), (b, 0.9))
+        self.assertEqual(pq.pop(), (a, 0.5))
+        self.assertEqual(pq.pop_min(), (d, 0.1))
+        self.assertEqual(len(pq), 1)
+
+    def test_evict_min(self):
+        '''when the queue is full, the lowest is evicted'''
+        pq = PriorityQueue(3)
+        items = [Item(i) for i in range(4)]
+        for item in items[:3]: pq.push(item, 0.2 + item.name/10)
+        self.assertIs(pq.push(items[3], 0.1), items[3])
+        self.assertIs(pq.push(Item(4), 0.9), items[0])
+        self.assertEqual([item.name for _, item in pq], [1, 2, 4])
+
+    def test_edit_by_identifier(self):
+        '''an item is edited or taken out by its identifier, through the index or by a scan'''
+        pq = PriorityQueue(10, identifier=lambda x: x.name)
+        for name, value in (('a', 0.3), ('b', 0.6), ('c', 0.9)):
+            pq.push(Item(name), value)
+        b = Item('b')
+        pq.edit(b, 0.95)
+        self.assertEqual(pq.pop(), (b, 0.95))
+        pq.edit(Item('x'), 0.5)
+        self.assertEqual(len(pq), 2)
+        pq.edit(Item('a'), 0.1, lambda x: x.name)
+        self.assertEqual(pq.pq[0][0], 0.1)
+        self.assertEqual(pq.take_by_key('c')[1], 0.9)
+        self.assertEqual(pq.take_by_key('c'), (None, None))
+        self.assertEqual(len(pq), 1)
+        self.assertEqual(pq._index.keys(), {'a'})
+
+    def test_random_pop(self):
+        '''an item with a higher value is more likely to be popped'''
+        random.seed(0)
+        counts = {'low': 0, 'high': 0}
+        for _ in range(1000):
+            pq = PriorityQueue(10)
+            pq.push(Item('low'), 0.3)
+            pq.push(Item('high'), 0.6)
+            item = pq.random_pop()
+            if item is not None:
+                counts[item.name] += 1
+                self.assertEqual(len(pq), 1)
+        self.assertGreater(counts['high'], counts['low'])
+        self.assertIsNone(PriorityQueue(10).random_pop())
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_PriorityQueue,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
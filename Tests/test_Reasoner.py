@@ -0,0 +1,146 @@
+import json
+import os
+import tempfile
+import unittest
+from collections import deque
+
+from pynars.Global import ReasonerContext
+from pynars.NARS import Reasoner, CycleProfiler
+from pynars.NARS.Control.Profiler import Histogram
+
+premises = [
+    '<a --> b>. %1.00;0.90%',
+    '<b --> c>. %1.00;0.90%',
+    '<c --> d>. %1.00;0.90%',
+    '<a --> d>?',
+]
+
+
+def new_reasoner(seed: int=0):
+    nars = Reasoner(100, 100, context=ReasonerContext(seed=seed))
+    for premise in premises: nars.input_narsese(premise)
+    return nars
+
+
+def outputs_str(tasks_line):
+    tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest, _ = tasks_line
+    return ([str(task) for task in tasks_derived], str(judgement_revised), str(goal_revised), str(answers_question), str(answers_quest))
+
+
+class TEST_Reasoner_Run(unittest.TestCase):
+
+    def test_same_as_cycle(self):
+        '''The sink receives the output of each cycle as soon as the cycle is done.'''
+        outputs = []
+        new_reasoner().run(50, lambda tasks_line: outputs.append(outputs_str(tasks_line)))
+        nars = new_reasoner()
+        expected = [outputs_str(nars.cycle()) for _ in range(50)]
+        self.assertEqual(outputs, expected)
+
+    def test_no_sink(self):
+        nars = new_reasoner()
+        nars.run(20)
+        self.assertEqual(nars.context.time, 20)
+
+    def test_ring_buffer(self):
+        nars = new_reasoner()
+        ring = deque(maxlen=5)
+        nars.run(20, ring)
+        self.assertEqual(len(ring), 5)
+        self.assertEqual(nars.context.time, 20)
+
+    def test_snapshot(self):
+        nars = new_reasoner()
+        outputs, snapshots = [], []
+        nars.run(20, outputs)
+        nars = new_reasoner()
+        nars.run(20, snapshots, snapshot=True)
+        tasks = [task for tasks_line in outputs for task in tasks_line[0]]
+        tasks_copied = [task for tasks_line in snapshots for task in tasks_line[0]]
+        self.assertEqual(len(tasks), len(tasks_copied))
+        self.assertTrue(all(task is not task_copied for task, task_copied in zip(tasks, tasks_copied)))
+
+
+class TEST_Reasoner_Input(unittest.TestCase):
+
+    def test_input_bulk(self):
+        '''Inputting the lines at once is the same as inputting them one by one.'''
+        nars = Reasoner(100, 100, context=ReasonerContext(seed=0))
+        results = nars.input_narsese_bulk(['// premises', *premises, '', '5', '<a --> '])
+        self.assertEqual([success for success, _, _ in results], [True]*len(premises) + [False])
+        outputs = [outputs_str(nars.cycle()) for _ in range(50)]
+        nars = new_reasoner()
+        expected = [outputs_str(nars.cycle()) for _ in range(50)]
+        self.assertEqual(outputs, expected)
+
+
+class TEST_Reasoner_Profiler(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = Histogram()
+        for duration in (0.5e-6, 1.5e-6, 3e-6, 3e-6, 100.0):
+            histogram.add(duration)
+        self.assertEqual(histogram.counts[0], 1)
+        self.assertEqual(histogram.counts[1], 1)
+        self.assertEqual(histogram.counts[2], 2)
+        self.assertEqual(histogram.counts[-1], 1)
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.max, 100.0)
+        self.assertEqual(histogram.quantile(0.5), 4e-6)
+
+    def test_profile(self):
+        nars = new_reasoner()
+        nars.profiler = profiler = CycleProfiler()
+        outputs = []
+        nars.run(200, lambda tasks_line: outputs.append(outputs_str(tasks_line)))
+        self.assertEqual(profiler.n_cycles, 200)
+        self.assertEqual(profiler.histograms['cycle'].count, 200)
+        self.assertEqual(profiler.histograms['observe'].count + profiler.histograms['consider'].count, 200)
+        for phase in ('observe.channels', 'observe.memory_accept', 'consider.take_concept', 'consider.put_back', 'consider.task_link', 'consider.term_link_scan', 'inference.structural', 'inference.syllogistic', 'filter'):
+            self.assertIn(phase, profiler.histograms)
+        self.assertEqual(profiler.histograms['consider.take_concept'].count, profiler.histograms['consider'].count)
+        for histogram in profiler.histograms.values():
+            self.assertEqual(sum(histogram.counts), histogram.count)
+        self.assertGreater(profiler.counters['tasks_derived.syllogistic'], 0)
+        self.assertGreater(profiler.counters['rules_tried.inference'], 0)
+        self.assertIn('cache_misses.structural', profiler.counters)
+
+        # the profiler does not change the reasoning
+        nars = new_reasoner()
+        expected = []
+        nars.run(200, lambda tasks_line: expected.append(outputs_str(tasks_line)))
+        self.assertEqual(outputs, expected)
+
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, 'profile.json')
+            profiler.export(path)
+            with open(path) as f:
+                exported = json.load(f)
+        self.assertEqual(exported['n_cycles'], 200)
+        self.assertEqual(exported['phases']['cycle']['count'], 200)
+        self.assertEqual(len(exported['phases']['cycle']['counts']), len(exported['edges'])+1)
+        self.assertIn('inference.syllogistic', profiler.summary())
+
+        profiler.reset()
+        self.assertEqual(len(profiler.histograms), 0)
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_Reasoner_Run,
+        TEST_Reasoner_Input,
+        TEST_Reasoner_Profiler,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -0,0 +1,90 @@
+import unittest
+
+from pynars import Global
+from pynars.Global import ReasonerContext
+from pynars.NARS import Reasoner
+
+lines = [
+    '<robin --> bird>.',
+    '<bird --> animal>.',
+    '<robin --> [flying]>. %0.90;0.80%',
+    '<robin --> animal>?',
+]
+
+
+def derivations(tasks_derived):
+    return tuple(sorted(str(task) for task in tasks_derived))
+
+
+class TEST_ReasonerContext(unittest.TestCase):
+
+    def test_default_context(self):
+        '''The reasoners created without a context share the process-wide one, and `Global.time` is its clock.'''
+        nars = Reasoner(100, 100)
+        self.assertIs(nars.context, Global.current_context())
+        time = Global.time
+        nars.cycle()
+        self.assertEqual(Global.time, time+1)
+        self.assertEqual(nars.context.time, time+1)
+
+    def test_activation(self):
+        context = ReasonerContext(seed=0)
+        time = Global.time
+        with context:
+            self.assertIs(Global.current_context(), context)
+            Global.time += 5
+            self.assertEqual(Global.get_input_id(), 0)
+            self.assertEqual(Global.get_input_id(), 1)
+        self.assertEqual(context.time, 5)
+        self.assertEqual(Global.time, time)
+        self.assertIsNot(Global.current_context(), context)
+
+    def test_32_reasoners(self):
+        '''
+        32 reasoners, with a context each, run side by side, cycle after cycle. Each one must derive the same as a reasoner running alone with the same seed, and keep its own clock and input ids.
+        '''
+        n_reasoners, n_cycles = 32, 30
+
+        def run_alone(seed):
+            nars = Reasoner(100, 100, context=ReasonerContext(seed=seed))
+            for line in lines: nars.input_narsese(line)
+            return [derivations(nars.cycle()[0]) for _ in range(n_cycles)]
+
+        seeds = [i % 4 for i in range(n_reasoners)]
+        expected = {seed: run_alone(seed) for seed in set(seeds)}
+
+        time = Global.time
+        reasoners = [Reasoner(100, 100, context=ReasonerContext(seed=seed)) for seed in seeds]
+        for line in lines:
+            for nars in reasoners: nars.input_narsese(line)
+        outputs = [[] for _ in reasoners]
+        for _ in range(n_cycles):
+            for nars, output in zip(reasoners, outputs):
+                output.append(derivations(nars.cycle()[0]))
+
+        for seed, nars, output in zip(seeds, reasoners, outputs):
+            self.assertEqual(output, expected[seed])
+            self.assertEqual(nars.context.time, n_cycles)
+            self.assertEqual(nars.context.get_input_id(), len(lines))
+        self.assertEqual(len({id(nars.all_theorems) for nars in reasoners}), n_reasoners)
+        self.assertEqual(Global.time, time)
+        self.assertTrue(any(len(derived) > 0 for output in outputs for derived in output))
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_ReasonerContext,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -0,0 +1,91 @@
+'''
+Benchmark of the first-party `pynars.utils.SparseLUT.SparseLUT` against the native `sparse_lut` package (if installed), on the rule map of `GeneralEngine`.
+
+It reports the time to build the table, the latency of a look-up (for keys which hit some rules and for random keys), and the size of the pickled cache.
+
+Usage:
+    python -m Tests.test_RuleMap.bench_SparseLUT [n_lookups]
+'''
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from pynars.NARS.InferenceEngine.GeneralEngine import GeneralEngine
+from pynars.NARS.RuleMap import RuleMap
+from pynars.utils.SparseLUT import SparseLUT
+
+
+def collect_rules():
+    '''Add the rules of `GeneralEngine` to a temporary rule map without building it. Return the shape and the entries.'''
+    rule_map_original = GeneralEngine.rule_map
+    try:
+        GeneralEngine.rule_map = RuleMap(name='bench')
+        engine = GeneralEngine.__new__(GeneralEngine)
+        GeneralEngine.__init__(engine, build=False)
+        return GeneralEngine.rule_map.map.shape, GeneralEngine.rule_map.map.data
+    finally:
+        GeneralEngine.rule_map = rule_map_original
+
+
+def sample_keys(shape, data, n: int):
+    '''Half of the keys are sampled from the patterns of the rules (thus hit), the other half uniformly.'''
+    def from_pattern(pattern):
+        key = []
+        for n_type, index in zip(shape, pattern):
+            if index is None or index is Any: key.append(random.choice(list(range(n_type)) + [None]))
+            elif isinstance(index, list): key.append(random.choice(index))
+            else: key.append(index)
+        return tuple(key)
+    keys_hit = [from_pattern(random.choice(data)[0]) for _ in range(n//2)]
+    keys_random = [tuple(random.choice(list(range(n_type)) + [None]) for n_type in shape) for _ in range(n - n//2)]
+    return keys_hit, keys_random
+
+
+def bench(name: str, cls, shape, data, keys_hit, keys_random):
+    lut = cls(shape)
+    for indices, value in data: lut.add(indices, value)
+    t0 = perf_counter()
+    lut.build()
+    t_build = perf_counter() - t0
+
+    results = []
+    for keys in (keys_hit, keys_random):
+        t0 = perf_counter()
+        for key in keys: lut[key]
+        results.append((perf_counter() - t0)/len(keys)*1e6)
+
+    with tempfile.TemporaryDirectory() as root:
+        lut.dump(root, 'bench')
+        size = (Path(root)/'bench.pkl').stat().st_size
+
+    print(f'{name:>8}: build {t_build:8.3f}s | lookup (hit) {results[0]:6.2f}us | lookup (random) {results[1]:6.2f}us | pickled {size/1024:9.1f}KB')
+    return lut
+
+
+def main(n_lookups: int=100000):
+    random.seed(0)
+    shape, data = collect_rules()
+    print(f'#rules={len(data)}, #dims={len(shape)}')
+    keys_hit, keys_random = sample_keys(shape, data, n_lookups)
+
+    lut = bench('py', SparseLUT, shape, data, keys_hit, keys_random)
+    try:
+        from sparse_lut import SparseLUT as SparseLUT_native
+    except ImportError:
+        print('  native: `sparse_lut` is not installed.')
+        return
+    lut_native = bench('native', SparseLUT_native, shape, data, keys_hit, keys_random)
+
+    n_mismatch = 0
+    for key in keys_hit + keys_random:
+        values, values_native = lut[key], lut_native[key]
+        if (values is None) != (values_native is None) or (values is not None and list(values) != list(values_native)):
+            n_mismatch += 1
+    print(f'#mismatches={n_mismatch}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,118 @@
+import random
+import tempfile
+import unittest
+from typing import Any
+
+from pynars.utils.SparseLUT import SparseLUT
+
+
+class TEST_SparseLUT_py(unittest.TestCase):
+    '''Tests of the first-party `pynars.utils.SparseLUT.SparseLUT`.'''
+
+    def test_0_0(self):
+        lut = SparseLUT((10, 20))
+        lut[1, 1] = "foo"
+        lut.build()
+        self.assertEqual(list(lut[1, 1]), ["foo"])
+        self.assertEqual(lut[2, 2], None)
+
+    def test_0_1(self):
+        lut = SparseLUT((3, 3, 3))
+        lut.add([0, Any, Any], "A")
+        lut.add([Any, 0, 1], "B")
+        lut.build(False)
+        self.assertEqual(list(lut[0, 2, 2]), ["A"])
+        self.assertEqual(list(lut[2, 0, 1]), ["B"])
+        self.assertEqual(list(lut[0, 0, 1]), ["A", "B"])
+        self.assertEqual(list(lut[0, None, None]), ["A"])
+        self.assertEqual(lut[1, None, None], None)
+
+    def test_list_and_none(self):
+        lut = SparseLUT((3, 4))
+        lut.add([[0, 2], [1, None]], "A")
+        lut.add([2, Any], "B")
+        lut.build()
+        self.assertEqual(list(lut[0, 1]), ["A"])
+        self.assertEqual(list(lut[0, None]), ["A"])
+        self.assertEqual(list(lut[2, None]), ["A", "B"])
+        self.assertEqual(list(lut[2, 3]), ["B"])
+        self.assertEqual(lut[1, 1], None)
+        self.assertEqual(lut[0, 2], None)
+
+    def test_order_of_values(self):
+        lut = SparseLUT((2, 2))
+        lut.add([Any, 1], "B")
+        lut.add([1, Any], "A")
+        lut.add([1, 1], "B")
+        lut.build()
+        self.assertEqual(list(lut[1, 1]), ["B", "A"])
+
+    def test_empty(self):
+        lut = SparseLUT((2, 2))
+        lut.build()
+        self.assertEqual(lut[0, 0], None)
+
+    def test_dump_load(self):
+        random.seed(0)
+        shape = (3, 4, 5, 2)
+        lut = SparseLUT(shape)
+        for i in range(30):
+            indices = [random.choice([Any, random.randrange(n), [random.randrange(n), None]]) for n in shape]
+            lut.add(indices, i)
+        lut.build()
+        with tempfile.TemporaryDirectory() as root:
+            lut.dump(root, 'lut')
+            lut2 = SparseLUT(shape)
+            lut2.load(root, 'lut')
+        for _ in range(500):
+            indices = tuple(random.choice(list(range(n)) + [None]) for n in shape)
+            values1, values2 = lut[indices], lut2[indices]
+            self.assertEqual(values1 is None, values2 is None)
+            if values1 is not None: self.assertEqual(list(values1), list(values2))
+
+    def test_same_as_brute_force(self):
+        random.seed(1)
+        shape = (3, 4, 5, 2, 3)
+        lut = SparseLUT(shape)
+        entries = []
+        for i in range(50):
+            indices = [random.choice([Any, random.randrange(n), [random.randrange(n), random.randrange(n)]]) for n in shape]
+            lut.add(indices, i)
+            entries.append((indices, i))
+        lut.build()
+
+        def match(pattern, index):
+            if pattern is Any: return True
+            if isinstance(pattern, list): return index in pattern
+            return pattern == index
+
+        for _ in range(2000):
+            indices = tuple(random.choice(list(range(n)) + [None]) for n in shape)
+            expected = [value for pattern, value in entries if all(match(p, idx) for p, idx in zip(pattern, indices))]
+            values = lut[indices]
+            self.assertEqual(list(values) if values is not None else [], expected)
+
+    def test_same_as_native(self):
+        try:
+            from sparse_lut import SparseLUT as SparseLUT_native
+        except ImportError:
+            self.skipTest("The package `sparse_lut` is not installed.")
+        random.seed(2)
+        shape = (3, 4, 5, 2, 3)
+        lut = SparseLUT(shape)
+        lut_native = SparseLUT_native(shape)
+        for i in range(50):
+            indices = [random.choice([Any, random.randrange(n), [random.randrange(n), random.randrange(n)]]) for n in shape]
+            lut.add(indices, i)
+            lut_native.add(indices, i)
+        lut.build()
+        lut_native.build()
+        for _ in range(2000):
+            indices = tuple(random.choice(list(range(n)) + [None]) for n in shape)
+            values1, values2 = lut[indices], lut_native[indices]
+            self.assertEqual(values1 is None, values2 is None)
+            if values1 is not None: self.assertEqual(list(values1), list(values2))
+
+
+if __name__ == '__main__':
+    unittest.main()
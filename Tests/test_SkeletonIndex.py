@@ -0,0 +1,113 @@
+import unittest
+
+from pynars import Narsese
+from pynars.NARS.DataStructures import Memory, SkeletonIndex
+
+
+def parse_term(text: str):
+    return Narsese.parser.parse(text + '.').term
+
+
+class TEST_SkeletonIndex(unittest.TestCase):
+
+    def test_candidates(self):
+        '''the candidates are those with a compatible skeleton'''
+        index = SkeletonIndex()
+        for text in ('<?x --> bird>', '<robin --> ?x>', '<?x --> ?y>', '<?x --> animal>', '<?x <-> robin>', '<?x ==> bird>', '(&&, ?x, a)', 'bird'):
+            index.add(text, parse_term(text))
+        self.assertEqual(len(index), 7)
+        self.assertEqual(set(index.candidates(parse_term('<robin --> bird>'))), {'<?x --> bird>', '<robin --> ?x>', '<?x --> ?y>'})
+        self.assertEqual(set(index.candidates(parse_term('<sparrow --> animal>'))), {'<?x --> animal>', '<?x --> ?y>'})
+        self.assertEqual(set(index.candidates(parse_term('<$y --> animal>'))), {'<?x --> animal>', '<robin --> ?x>', '<?x --> ?y>'})
+        self.assertEqual(set(index.candidates(parse_term('<robin <-> swan>'))), {'<?x <-> robin>'})
+        self.assertEqual(set(index.candidates(parse_term('<swan <-> robin>'))), {'<?x <-> robin>'})
+        self.assertEqual(set(index.candidates(parse_term('(&&, b, a)'))), {'(&&, ?x, a)'})
+        self.assertEqual(index.candidates(parse_term('robin')), [])
+
+        index.remove('<?x --> ?y>')
+        self.assertEqual(set(index.candidates(parse_term('<robin --> bird>'))), {'<?x --> bird>', '<robin --> ?x>'})
+
+    def test_capacity(self):
+        '''the items no longer alive are dropped, but not those still alive'''
+        dead = {'<a0 --> ?x>', '<a5 --> ?x>'}
+        index = SkeletonIndex(8, lambda item: item not in dead)
+        for i in range(8):
+            index.add(f'<a{i} --> ?x>', parse_term(f'<a{i} --> ?x>'))
+        index.add('<a1 --> ?x>', parse_term('<a1 --> ?x>'))
+        index.add('<a8 --> ?x>', parse_term('<a8 --> ?x>'))
+        self.assertEqual(list(index), ['<a2 --> ?x>', '<a3 --> ?x>', '<a4 --> ?x>', '<a6 --> ?x>', '<a7 --> ?x>', '<a1 --> ?x>', '<a8 --> ?x>'])
+        self.assertEqual(index.candidates(parse_term('<a0 --> b>')), [])
+
+        # all alive: the index grows, and is not shrunk at each item added.
+        for i in range(9, 40):
+            index.add(f'<a{i} --> ?x>', parse_term(f'<a{i} --> ?x>'))
+        self.assertEqual(len(index), 38)
+        self.assertEqual(index.candidates(parse_term('<a2 --> b>')), ['<a2 --> ?x>'])
+
+    def test_capacity_oldest(self):
+        '''without `is_alive`, the oldest items are dropped'''
+        index = SkeletonIndex(8)
+        for i in range(8):
+            index.add(f'<a{i} --> ?x>', parse_term(f'<a{i} --> ?x>'))
+        index.add('<a1 --> ?x>', parse_term('<a1 --> ?x>'))
+        index.add('<a8 --> ?x>', parse_term('<a8 --> ?x>'))
+        self.assertEqual(list(index), ['<a4 --> ?x>', '<a5 --> ?x>', '<a6 --> ?x>', '<a7 --> ?x>', '<a1 --> ?x>', '<a8 --> ?x>'])
+
+
+class TEST_Memory_Query(unittest.TestCase):
+
+    def test_judgement_answers_query(self):
+        '''a judgement answers the pending queries which match it, and only those are checked'''
+        memory = Memory(100, 100)
+        for line in ('<?x --> bird>?', '<?x --> fish>?', '<?x --> animal>?'):
+            memory.accept(Narsese.parser.parse(line))
+        self.assertEqual(len(memory.query_index), 3)
+
+        answers = memory.accept(Narsese.parser.parse('<robin --> bird>.'))[2]
+        self.assertEqual([str(answer.term) for answer in answers], ['<robin-->bird>'])
+        self.assertEqual(memory.query_fanout['candidate_queries'], 1)
+        self.assertEqual(memory.query_fanout['matched'], 1)
+
+    def test_query_answered_by_belief(self):
+        '''a query is answered by the beliefs of the concepts which match it'''
+        memory = Memory(100, 100)
+        for line in ('<robin --> bird>.', '<robin --> animal>.', '<tiger --> animal>.', '<swan <-> robin>.'):
+            memory.accept(Narsese.parser.parse(line))
+        answers = memory.accept(Narsese.parser.parse('<?x --> bird>?'))[2]
+        self.assertEqual([str(answer.term) for answer in answers], ['<robin-->bird>'])
+        self.assertEqual(memory.query_fanout['candidate_beliefs'], 1)
+        answers = memory.accept(Narsese.parser.parse('<robin <-> ?x>?'))[2]
+        self.assertEqual([str(answer.term) for answer in answers], ['<swan<->robin>'])
+
+        memory.reset()
+        self.assertEqual((len(memory.query_index), len(memory.belief_index)), (0, 0))
+
+    def test_dropped(self):
+        '''the queries no longer in their concepts are dropped from the index when found'''
+        memory = Memory(100, 100)
+        query = Narsese.parser.parse('<?x --> bird>?')
+        memory.accept(query)
+        memory.take_by_key(query.term, remove=True)
+        self.assertEqual(memory.accept(Narsese.parser.parse('<robin --> bird>.'))[2], [])
+        self.assertEqual(memory.query_fanout['dropped'], 1)
+        self.assertNotIn(query, memory.query_index)
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_SkeletonIndex,
+        TEST_Memory_Query,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -1,12 +1,13 @@
-import NARS
+import random
 import unittest
 
 from pynars.NARS.DataStructures import Bag, Task, Concept, Table
 from pynars.Narsese import Judgement, Term, Statement, Copula, Truth   
 
 from pathlib import Path
-import Narsese
+from pynars import Narsese, Global
 from pynars.Narsese import Compound, Connector
+from pynars.NAL.Functions.Tools import calculate_solution_quality, calculate_solution_qualities
 
 
 class TEST_Table(unittest.TestCase):
@@ -37,6 +38,46 @@ class TEST_Table(unittest.TestCase):
         self.assertEqual(table.last(), task1)
         pass
 
+    def test_order(self):
+        '''the same order as `depq.DEPQ`: descending priority, the earlier first among the equal ones, and the last one dropped when full'''
+        from depq import DEPQ
+        random.seed(0)
+        tasks = [Narsese.parser.parse(f'<robin{i}-->bird>. %0.9;0.9%') for i in range(20)]
+        table = Table(8)
+        depq = DEPQ(maxlen=8)
+        for _ in range(500):
+            task = random.choice(tasks)
+            p = random.choice((0.1, 0.2, 0.5, 0.9, random.random()))
+            table.add(task, p)
+            if task in depq: depq.remove(task)
+            depq.insert(task, p)
+            self.assertEqual(table.items(), tuple(depq))
+            self.assertEqual(set(table), set(tasks).intersection(table.values()))
+            self.assertTrue(all(task in table for task in table))
+
+    def test_match(self):
+        '''the vectorized scoring selects the same belief as `calculate_solution_quality`'''
+        random.seed(0)
+        time = Global.time
+        Global.time = 20
+        table = Table(100)
+        for i in range(100):
+            tense = random.choice(('', ':|:', ':/:', ':\\:'))
+            task = Narsese.parser.parse(f'<robin-->bird>. {tense} %{random.random():.2f};{0.01+random.random()*0.98:.2f}%')
+            if not task.is_eternal: task.stamp.t_occurrence = random.randint(0, 40)
+            table.add(task, task.truth.c)
+        for line in ('<robin-->bird>?', '<robin-->bird>? :|:', '<?x-->bird>?', '<robin-->bird>. :/:'):
+            sentence = Narsese.parser.parse(line).sentence
+            for rate_by_confidence in (True, False):
+                qualities = [calculate_solution_quality(sentence, task.sentence, rate_by_confidence) for task in table]
+                self.assertEqual(list(calculate_solution_qualities(sentence, [task.sentence for task in table], rate_by_confidence)), qualities)
+                best = table[qualities.index(max(qualities))]
+                table.vectorized = True
+                self.assertIs(table.match(sentence, rate_by_confidence), best)
+                table.vectorized = False
+                self.assertIs(table.match(sentence, rate_by_confidence), best)
+        Global.time = time
+
         
 
 if __name__ == '__main__':
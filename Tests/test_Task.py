@@ -0,0 +1,79 @@
+import unittest
+from copy import copy, deepcopy
+import pickle
+
+from pynars.Narsese import parse, Budget, Task, Truth
+
+
+class TEST_Task(unittest.TestCase):
+    def test_slots(self):
+        task = parse("<A --> B>. :|: %0.9;0.8%")
+        for obj in (task, task.sentence, task.stamp, task.truth, task.budget):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj))
+        self.assertEqual(task.input_id, -1)
+        self.assertIsNone(task.best_solution)
+        self.assertFalse(task.processed)
+        self.assertFalse(task.immediate_rules_applied)
+
+        question = parse("<A --> B>?")
+        self.assertIsNone(question.sentence.truth)
+        self.assertIsNone(question.sentence.best_answer)
+        goal = parse("<A --> B>!")
+        self.assertIsNone(goal.sentence.best_solution)
+        self.assertIsNone(goal.sentence.best_answer)
+
+    def test_copy(self):
+        task = parse("<A --> B>. :|: %0.9;0.8%")
+        task.processed = True
+
+        task_eternal = task.eternalize()
+        self.assertTrue(task_eternal.processed)
+        self.assertTrue(task_eternal.is_eternal)
+        self.assertFalse(task.is_eternal)
+
+        for task2 in (copy(task), deepcopy(task), pickle.loads(pickle.dumps(task))):
+            self.assertEqual(str(task2), str(task))
+            self.assertEqual(hash(task2), hash(task))
+            self.assertTrue(task2.processed)
+
+    def test_budget_default(self):
+        budget = Budget(None, None, None)
+        self.assertEqual(tuple(budget), (Budget.priority_default, Budget.durability_default, Budget.quality_default))
+
+    def test_new_task(self):
+        '''a task built from a term is the same as the one parsed, but for its input id'''
+        for text, new_task in (
+            ("<A --> B>. %0.9;0.8%", lambda term: Task.new_judgement(term, Truth(0.9, 0.8, 1))),
+            ("<A --> B>. :|:", lambda term: Task.new_judgement(term, tense=0)),
+            ("<(*, $x, B) --> C>.", Task.new_judgement),
+            ("<A --> B>! :|: %0.9;0.8%", lambda term: Task.new_goal(term, Truth(0.9, 0.8, 1), tense=0)),
+            ("<A --> B>?", Task.new_question),
+            ("<A --> B>@", Task.new_quest),
+        ):
+            task = parse(text)
+            task2 = new_task(task.term)
+            self.assertEqual(type(task2.sentence), type(task.sentence))
+            self.assertEqual(task2.sentence.repr(False), task.sentence.repr(False), text)
+            self.assertEqual(hash(task2), hash(task))
+            self.assertEqual(tuple(task2.budget), tuple(task.budget))
+            self.assertEqual(task2.stamp.t_occurrence, task.stamp.t_occurrence)
+            self.assertNotEqual(task2.evidential_base, task.evidential_base)
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_Task
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+        
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -10,7 +10,75 @@ class TEST_Term(unittest.TestCase):
         print(t2)
         pass
 
-        
+    def test_interned(self):
+        from pynars.Narsese import Term, parse
+        t1 = parse("<(&, A, B) --> [C]>.").term
+        t2 = parse("<(&, A, B) --> [C]>.").term
+        self.assertIs(t1, t2)
+        self.assertIs(t1.subject, parse("(&, A, B).").term)
+        self.assertIs(Term("A"), t1.subject[0])
+        self.assertIs(t1.sub_terms, t2.sub_terms)
+        self.assertIn(Term("C"), t1)
+
+    def test_interned_commutative(self):
+        '''a commutative term keeps the order of its components, but is equal to the same term in another order'''
+        from pynars.Narsese import parse
+        for text1, text2 in (("(&, A, B).", "(&, B, A)."), ("{A, B}.", "{B, A}."), ("<A <-> B>.", "<B <-> A>."), ("<(&, A, B) --> C>.", "<(&, B, A) --> C>.")):
+            t1, t2 = parse(text1).term, parse(text2).term
+            self.assertIsNot(t1, t2)
+            self.assertEqual(t1, t2)
+            self.assertEqual(str(t1), text1[:-1].replace(" --> ", "-->").replace(" <-> ", "<->"))
+            self.assertEqual(str(t2), text2[:-1].replace(" --> ", "-->").replace(" <-> ", "<->"))
+        self.assertIs(parse("(&, A, B, A).").term, parse("(&, A, B).").term)
+        self.assertIs(parse("(|, {A}, {B}).").term, parse("{A, B}.").term)
+        self.assertNotEqual(parse("(*, A, B).").term, parse("(*, B, A).").term)
+        self.assertNotEqual(parse("<X --> Y>.").term, parse("<Y --> X>.").term)
+
+    def test_interned_copy(self):
+        from copy import copy, deepcopy
+        import pickle
+        from pynars.Narsese import parse
+        t1 = parse("<(&, A, B) --> C>.").term
+        self.assertIs(copy(t1), t1)
+        self.assertIs(deepcopy(t1), t1)
+        t2 = pickle.loads(pickle.dumps(t1))
+        self.assertIsNot(t2, t1)
+        self.assertEqual(t2, t1)
+        self.assertEqual(t2.sub_terms, t1.sub_terms)
+
+    def test_not_interned_with_variables(self):
+        from pynars.Narsese import parse
+        t1 = parse("<$x --> (&, A, B)>.").term
+        t2 = parse("<$x --> (&, A, B)>.").term
+        self.assertIsNot(t1, t2)
+        self.assertEqual(t1, t2)
+        self.assertIs(t1.predicate, t2.predicate)
+
+    def test_interning_disabled(self):
+        from pynars.Narsese import Term, parse
+        Term.interning_enabled = False
+        try:
+            t1 = parse("<A --> B>.").term
+            t2 = parse("<A --> B>.").term
+        finally:
+            Term.interning_enabled = True
+        self.assertIsNot(t1, t2)
+        self.assertEqual(t1, t2)
+        self.assertEqual(hash(t1), hash(parse("<A --> B>.").term))
+
+    def test_evicted(self):
+        import gc
+        import weakref
+        from pynars.Narsese import Term
+        from pynars.Narsese._py.Intern import _table
+        term = Term("unique_word_of_test_evicted")
+        self.assertIn((Term, "unique_word_of_test_evicted"), _table)
+        ref = weakref.ref(term)
+        del term
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertNotIn((Term, "unique_word_of_test_evicted"), _table)
+
 
 if __name__ == '__main__':
 
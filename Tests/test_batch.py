@@ -0,0 +1,69 @@
+import json
+import unittest
+from pathlib import Path
+
+from pynars.batch import run_batch, run_script, collect_scripts, main
+from pynars.NARS import Reasoner
+
+examples_path = Path(__file__).parent/'examples'
+
+
+class TEST_Batch(unittest.TestCase):
+
+    def test_collect_scripts(self):
+        scripts = collect_scripts([examples_path/'single_step/nal1', examples_path/'multi_steps/nal1.multistep.nal'])
+        self.assertIn(examples_path/'single_step/nal1/nal1.0.nal', scripts)
+        self.assertEqual(scripts[-1], examples_path/'multi_steps/nal1.multistep.nal')
+        self.assertTrue(all(script.suffix == '.nal' for script in scripts))
+
+    def test_run_script(self):
+        '''The same seed gives the same result, whatever the reasoner ran before.'''
+        nars = Reasoner(100, 100)
+        file = examples_path/'single_step/nal1/nal1.1.nal'
+        result1 = run_script(file, 1, nars)
+        run_script(examples_path/'single_step/nal1/nal1.3.nal', 2, nars)
+        result2 = run_script(file, 1, nars)
+        self.assertIsNone(result1['error'])
+        self.assertEqual(result1['cycles'], 12)
+        self.assertEqual(len(result1['expectations']), 1)
+        for key in ('passed', 'cycles', 'expectations'):
+            self.assertEqual(result1[key], result2[key])
+
+    def test_run_batch(self):
+        '''The workers report the same as a reasoner running the scripts in this process.'''
+        files = [examples_path/'single_step/nal1/nal1.0.nal', examples_path/'single_step/nal1/nal1.1.nal', examples_path/'single_step/nal2/nal2.0.nal']
+        report = run_batch(files, n_workers=2, seed=1)
+        self.assertEqual(report['summary']['n_scripts'], 3)
+        self.assertEqual(report['summary']['n_passed'] + report['summary']['n_failed'], 3)
+        nars = Reasoner(100, 100)
+        for i, (file, result) in enumerate(zip(files, report['scripts'])):
+            self.assertEqual(result['path'], str(file))
+            self.assertEqual(result['seed'], 1 + i)
+            expected = run_script(file, 1 + i, nars)
+            self.assertEqual(result['passed'], expected['passed'])
+            self.assertEqual(result['expectations'], expected['expectations'])
+        json.dumps(report)
+
+    def test_main(self):
+        report = main([str(examples_path/'single_step/nal1/nal1.0.nal'), '--workers', '1'])
+        self.assertEqual(report['summary']['n_workers'], 1)
+        self.assertEqual(report['summary']['cycles'], 3)
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_Batch,
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
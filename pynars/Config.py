@@ -23,6 +23,10 @@ class Config:
     durability: float=0.8
     quality: float=0.5
     num_buckets: int = 100
+    bag_engine: str = 'indexed' # the implementation of the buckets in `Bag`. 'indexed': O(1) amortized operations; 'list': plain lists
+    inference_cache_size: int = 10000 # the maximum number of entries in the cache of each inference method of `KanrenEngine`. `None` means unbounded
+    inference_cache_ttl: int = None # the number of cycles after which a cached entry expires. `None` means never
+    parse_cache_size: int = 1000 # the maximum number of sentences cached by the Narsese parser. `None` means unbounded, and `0` disables the cache
     max_duration: int = 10000
     f: float=1.0
     c: float=0.9
@@ -48,6 +52,7 @@ class Config:
     nlevels_term_link: int=10
     capacity_term_link: int=100
     capacity_table: int=100
+    max_term_links_matched: int=10 # the maximum number of term-links peeked at to find a belief in an inference step, `None` for all of them
 
 
     quality_min: float=0.3
@@ -131,6 +136,16 @@ def load(file_path: str):
         pass # TODO
     except:
         pass # TODO
+
+    # set implementations of data structures
+    try:
+        program: dict = content['PROGRAM']
+        Config.bag_engine = program.get('BAG_ENGINE', Config.bag_engine)
+        Config.inference_cache_size = program.get('INFERENCE_CACHE_SIZE', Config.inference_cache_size)
+        Config.inference_cache_ttl = program.get('INFERENCE_CACHE_TTL', Config.inference_cache_ttl)
+        Config.parse_cache_size = program.get('PARSE_CACHE_SIZE', Config.parse_cache_size)
+    except:
+        pass
     
     # set hyper-parameters
     try:
@@ -172,6 +187,7 @@ def load(file_path: str):
             Config.nlevels_term_link = concept.get('NUM_LEVELS_TERMLINK_BAG', Config.nlevels_term_link)
             Config.capacity_term_link = concept.get('CAPACITY_TERMLINK_BAG', Config.capacity_term_link)
             Config.capacity_table = concept.get('CAPACITY_TABLE', Config.capacity_table)
+            Config.max_term_links_matched = concept.get('MAX_TERM_LINKS_MATCHED', Config.max_term_links_matched)
         Config.r_term_complexity_unit = defaults.get('COMPLEXITY_UNIT', Config.r_term_complexity_unit)
         Config.quality_min = defaults.get('QUALITY_MIN', Config.quality_min)
         Config.cycles_per_duration = defaults.get('CYCLES_PER_DURATION', Config.cycles_per_duration)
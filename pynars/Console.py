@@ -1,10 +1,9 @@
 from copy import deepcopy
-from typing import Tuple, Union
+from typing import Callable, Tuple, Union
 from pathlib import Path
 from pynars import Narsese, NAL, NARS
 from time import sleep
 import os
-from pynars.Narsese.Parser.parser import TreeToNarsese
 from pynars.Narsese import Sentence
 import random
 from pynars.NARS import Reasoner as Reasoner
@@ -26,8 +25,11 @@ process id: {os.getpid()}
     ''')
 
 
-def run_line(nars: Reasoner, line: str):
-    '''Run one line of input'''
+def run_line(nars: Reasoner, line: str, sink: Callable = None):
+    '''
+    Run one line of input.
+    The output of each cycle is passed to `sink` as soon as the cycle is done. Without `sink`, snapshots of the outputs are returned.
+    '''
     line = line.strip(' \n')
     # `//` comment
     if line.startswith("//"):
@@ -58,10 +60,11 @@ def run_line(nars: Reasoner, line: str):
     elif line.isdigit():
         n_cycle = int(line)
         print_out(PrintType.INFO, f'Run {n_cycle} cycles.')
+        if sink is not None:
+            nars.run(n_cycle, sink)
+            return None
         tasks_all_cycles = []
-        for _ in range(n_cycle):
-            tasks_all = nars.cycle()
-            tasks_all_cycles.append(deepcopy(tasks_all))
+        nars.run(n_cycle, tasks_all_cycles, snapshot=True)
         return tasks_all_cycles
     # narsese
     else:
@@ -80,64 +83,59 @@ def run_line(nars: Reasoner, line: str):
                     PrintType.ERROR,
                     f'Invalid input! Failed to parse: {line}')
 
+            if sink is not None:
+                nars.run(1, sink)
+                return None
             tasks_all = nars.cycle()
             return [deepcopy(tasks_all)]
         except Exception as e:
             print_out(PrintType.ERROR, f'Unknown error: {line}. \n{e}')
 
 
+def print_tasks_line(tasks_line: Tuple[List[Task], Task, Task, List[Task], Task, Tuple[Task, Task]]):
+    '''Print the output of a cycle'''
+    # unpack one of lines of tasks, and then print out
+    tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest, \
+    (task_operation_return, task_executed) = tasks_line
+
+    # while derived task(s)
+    for task in tasks_derived: print_out(PrintType.OUT, task.sentence.repr(), *task.budget)
+
+    # while revising a judgement
+    if judgement_revised is not None: print_out(PrintType.OUT, judgement_revised.sentence.repr(),*judgement_revised.budget)
+               
+    # while revising a goal                                 
+    if goal_revised is not None: print_out(PrintType.OUT, goal_revised.sentence.repr(), *goal_revised.budget)
+
+    # while answering a question for truth value
+    if answers_question is not None:
+        for answer in answers_question:
+            print_out(
+                PrintType.ANSWER,
+                answer.sentence.repr(),
+                *answer.budget)
+    # while answering a quest for desire value
+    if answers_quest is not None:
+        for answer in answers_quest: print_out(PrintType.ACHIEVED, answer.sentence.repr(), *answer.budget)
+    # while executing an operation
+    if task_executed is not None:
+        print_out(
+            PrintType.EXE,
+            f'''{task_executed.term.repr()} = {
+                str(task_operation_return) 
+                if task_operation_return is not None
+                else None}''')
+
+
 def handle_lines(nars: Reasoner, lines: str):
-    '''Handle inputs with NARS reasoner'''
-    tasks_lines = []
+    '''Handle inputs with NARS reasoner, printing the outputs as the cycles go'''
     # run input line by line #
     for line in lines.split('\n'):
         # skip empty lines
         if len(line) == 0:
             continue
         # run non-empty lines
-        tasks_line = run_line(nars, line)
-        if tasks_line is not None:
-            tasks_lines.extend(tasks_line)
-    # print the output #
-    tasks_lines: List[Tuple[
-        List[Task],
-        Task,
-        Task,
-        List[Task],
-        Task,
-        Tuple[Task, Task]]]
-    for tasks_line in tasks_lines:
-        # unpack one of lines of tasks, and then print out
-        tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest, \
-        (task_operation_return, task_executed) = tasks_line
-    
-        # while derived task(s)
-        for task in tasks_derived: print_out(PrintType.OUT, task.sentence.repr(), *task.budget)
-
-        # while revising a judgement
-        if judgement_revised is not None: print_out(PrintType.OUT, judgement_revised.sentence.repr(),*judgement_revised.budget)
-                   
-        # while revising a goal                                 
-        if goal_revised is not None: print_out(PrintType.OUT, goal_revised.sentence.repr(), *goal_revised.budget)
-
-        # while answering a question for truth value
-        if answers_question is not None:
-            for answer in answers_question:
-                print_out(
-                    PrintType.ANSWER,
-                    answer.sentence.repr(),
-                    *answer.budget)
-        # while answering a quest for desire value
-        if answers_quest is not None:
-            for answer in answers_quest: print_out(PrintType.ACHIEVED, answer.sentence.repr(), *answer.budget)
-        # while executing an operation
-        if task_executed is not None:
-            print_out(
-                PrintType.EXE,
-                f'''{task_executed.term.repr()} = {
-                    str(task_operation_return) 
-                    if task_operation_return is not None
-                    else None}''')
+        run_line(nars, line, sink=print_tasks_line)
 
 
 def run_file(nars: Reasoner, filepath: str = None):
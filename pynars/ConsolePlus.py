@@ -226,6 +226,12 @@ def cycles(*args: List[str]) -> None:
     if(current_NARS_interface.reasoner.cycles_count == 0): current_NARS_interface.print_output(type=PrintType.INFO, content="No cycles have been run yet.")
     else: current_NARS_interface.print_output(
         type=PrintType.INFO, content=f'''The average cycles per second is {int(1 // current_NARS_interface.reasoner.avg_cycle_duration)} based on the last {current_NARS_interface.reasoner.cycles_count} cycles. Last cycle took {current_NARS_interface.reasoner.last_cycle_duration:.6f} seconds.''')
+    inference = current_NARS_interface.reasoner.inference
+    if hasattr(inference, 'cache_info'):
+        current_NARS_interface.print_output(
+            type=PrintType.INFO, content='Inference cache: ' + ', '.join(
+                f'{name} {info.hits/max(1, info.hits+info.misses):.1%} hit ({info.currsize} entries, {info.evictions} evicted)'
+                for name, info in inference.cache_info().items()))
 
 @cmd_register(('volume'), (int, 100))
 def volume(vol:int) -> None:
@@ -43,18 +43,19 @@ def run_line(nars: Reasoner, line: str):
         if task_executed is not None:
             ret.append(f'{task_executed.term.repr()} = {str(task_operation_return) if task_operation_return is not None else None}')
 
+    def sink(tasks_line):
+        satisfaction.append(nars.global_eval.S)
+        busyness.append(nars.global_eval.B)
+        alertness.append(nars.global_eval.A)
+        wellness.append(nars.global_eval.W)
+        handle_line(tasks_line)
+
     line = line.strip(' \n')
     if line.startswith("'"):
         return None
     elif line.isdigit():
         n_cycle = int(line)
-        for _ in range(n_cycle):
-            tasks_all = nars.cycle()
-            satisfaction.append(nars.global_eval.S)
-            busyness.append(nars.global_eval.B)
-            alertness.append(nars.global_eval.A)
-            wellness.append(nars.global_eval.W)
-            handle_line(tasks_all)
+        nars.run(n_cycle, sink)
     else:
         line = line.rstrip(' \n')
         if len(line) == 0:
@@ -66,12 +67,7 @@ def run_line(nars: Reasoner, line: str):
             else:
                 ret.append(f':Invalid input! Failed to parse: {line}')
 
-            tasks_all = nars.cycle()
-            satisfaction.append(nars.global_eval.S)
-            busyness.append(nars.global_eval.B)
-            alertness.append(nars.global_eval.A)
-            wellness.append(nars.global_eval.W)
-            handle_line(tasks_all)
+            nars.run(1, sink)
         except Exception as e:
             ret.append(f':Unknown error: {line}. \n{e}')
     return ret, (satisfaction, busyness, alertness, wellness)
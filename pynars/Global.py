@@ -1,47 +1,134 @@
-import inspect
+'''
+The states shared by the parts of a reasoner: the clock, the counter of input ids, the premises being processed, the theorems, and the random number generator.
+
+They are owned by a `ReasonerContext`. The current context is held in a context variable, so that each thread (or asyncio task) sees its own one, and it defaults to a process-wide context. The attributes `Global.time` and `Global.States` and the functions `Global.get_input_id` and `Global.random` read the current context, so the modules using them (the parser, `Sentence`, `Memory`, the engines, etc.) need not be passed the context explicitly.
+
+Several reasoners can run side by side in one process by giving each one its own context:
+
+    reasoner1 = Reasoner(100, 100, context=ReasonerContext(seed=1))
+    reasoner2 = Reasoner(100, 100, context=ReasonerContext(seed=2))
+
+`Reasoner` activates its context in its methods (`cycle`, `input_narsese`, etc., see `in_context`). Elsewhere, a context is activated by `with context: ...` (within a single thread).
+'''
+import random as _random
+import sys
+from contextvars import ContextVar
+from functools import wraps
+from types import ModuleType
 
-time = 0
-_input_id = 0
-def get_input_id():
-    global _input_id
-    input_id = _input_id
-    _input_id += 1
-    return input_id
 
-class States:
+class ReasonerStates:
+    '''The premises, the concept and the rules processed in the current cycle, for debugging.'''
     task = None
     belief = None
     concept = None
     rules = None
 
-    @classmethod
-    def reset(cls):
-        ''''''
-        for name in vars(cls):
-            attr = getattr(cls, name)
-            if inspect.ismethod(attr): continue
-            if name.startswith('_'): continue
-            if isinstance(attr, property): continue
-            # if isinstance(attr, classmethod): continue
-            setattr(cls, name, None)
-
-    @classmethod
-    def record_premises(cls, task=None, belief=None):
-        cls.task = task
-        cls.belief = belief
-    
-    @classmethod
-    def record_concept(cls, concept=None):
-        cls.concept = concept
-
-    @classmethod
-    def record_rules(cls, rules=None):
-        cls.rules = rules
-    
+    def __init__(self, context: 'ReasonerContext') -> None:
+        self._context = context
+
+    def reset(self):
+        self.task = self.belief = self.concept = self.rules = None
+
+    def record_premises(self, task=None, belief=None):
+        self.task = task
+        self.belief = belief
+
+    def record_concept(self, concept=None):
+        self.concept = concept
+
+    def record_rules(self, rules=None):
+        self.rules = rules
+
+    @property
+    def time(self):
+        return self._context.time
+
+    def __repr__(self):
+        return f'<States: time={self.time}\n\tconcept: {self.concept}\n\ttask: {self.task}\n\tbelief: {self.belief}\n\trules: {self.rules}\n>.'
+
+
+class ReasonerContext:
+    '''
+    The clock, the counter of input ids, the states and the theorems of a reasoner, as well as its random number generator.
+
+    Args:
+        seed: the seed of the random number generator of the context. If `None`, the generator is seeded from the system.
+        rng: the random number generator, e.g. the module `random` itself. It overrides `seed`.
+    '''
+
+    def __init__(self, seed=None, rng=None) -> None:
+        self.time = 0
+        self._input_id = 0
+        self.states = ReasonerStates(self)
+        self.theorems = None # the bag of theorems, filled by `Reasoner`
+        self.rng = rng if rng is not None else _random.Random(seed)
+        self._tokens = []
+
+    def reset(self):
+        '''Rewind the clock and the input ids, and clear the states. The theorems and the random number generator are kept.'''
+        self.time = 0
+        self._input_id = 0
+        self.states.reset()
+
+    def get_input_id(self):
+        input_id = self._input_id
+        self._input_id += 1
+        return input_id
+
+    def __enter__(self):
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current.reset(self._tokens.pop())
+
+    def __repr__(self):
+        return f'<ReasonerContext: time={self.time}, #inputs={self._input_id}>'
+
+
+# the process-wide context draws from the module `random`, so that `random.seed` keeps seeding it.
+default_context = ReasonerContext(rng=_random)
+_current: ContextVar = ContextVar('reasoner_context', default=default_context)
+
+
+def current_context() -> ReasonerContext:
+    return _current.get()
+
+
+def get_input_id():
+    return _current.get().get_input_id()
+
+
+def random() -> float:
+    '''Draw a number in [0, 1) from the random number generator of the current context.'''
+    return _current.get().rng.random()
+
+
+def in_context(method):
+    '''Decorate a method of an object having a `context` (e.g. `Reasoner`), so that the context is the current one while the method runs.'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = _current.set(self.context)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _current.reset(token)
+    return wrapper
+
+
+class _Global(ModuleType):
     @property
     def time(self):
-        return time
-    
-    @classmethod
-    def __repr__(cls):
-        return f'<States: time={time}\n\tconcept: {cls.concept}\n\ttask: {cls.task}\n\tbelief: {cls.belief}\n\trules: {cls.rules}\n>.'
\ No newline at end of file
+        return _current.get().time
+
+    @time.setter
+    def time(self, value):
+        _current.get().time = value
+
+    @property
+    def States(self):
+        return _current.get().states
+
+
+sys.modules[__name__].__class__ = _Global
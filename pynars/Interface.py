@@ -7,7 +7,7 @@ from pathlib import Path
 import argparse  # for cmdline
 
 # compatible type annotation
-from typing import List, Dict, Tuple, Union
+from typing import Callable, List, Dict, Tuple, Union
 
 # pynars
 from pynars.utils.Print import print_out as print_out_origin
@@ -335,16 +335,14 @@ class NARSInterface:
         - Returned value: List[NARSOutput], a list of output results after NARS processing, each element is an NARS output object.
 
         Internal variable types, meanings and mutual relations:
-        - Task List: List[Tuple], which stores information about tasks processed by NARS. Each element is a task row and contains information about multiple tasks.
-        - Task line: Tuple, which contains information about multiple tasks, such as the exported task, modified target, and modified target.
+        - Task line: Tuple, the output of a cycle, which contains information about multiple tasks, such as the exported task, modified target, and modified target.
         - out Output list: List[NARSOutput], stores NARS output results, each element is an NARS output object.
 
         Main operation process:
         1. Decompose the input statement flow into multiple statements.
-        2. Go through each statement, call "processing statement" to pass the statement to NARS for processing, and add the processing result to the task list.
-        3. Traverse the task list, convert the task-related information into NARS output objects, and add them to the out output list.
-        4. Traverse the out output list, call `self.print_output` to print the output, and call `self._handle_NARS_output` to broadcast the output.
-        5. Return to the out output list.
+        2. Go through each statement, and call `self.run_line` to pass the statement to NARS for processing. The output of each cycle is streamed (see `Reasoner.run`) to a sink, without being copied.
+        3. The sink converts the task-related information of the cycle into NARS output objects, calls `self.print_output` to print them, calls `self._handle_NARS_output` to broadcast them, and adds them to the out output list.
+        4. Return to the out output list.
 
         Possible exceptions:
         - Incorrect format of the input NAL statement: If the input statement does not comply with the NAL syntax rules, the NARS processing exception may occur.
@@ -358,85 +356,81 @@ class NARSInterface:
 
         # start to handle
 
-        task_list = []
-        for line in lines.split('\n'):
-            if len(line) == 0:
-                continue
-
-            task_line = self.run_line(reasoner=self._NARS, line=line)
-            self._input_history.append(line)
-            if task_line is not None:
-                task_list.extend(task_line)
-
         outs: List[NARSOutput] = []
 
-        task_list: List[
-            Tuple[
-                List[Task], Task, Task,
-                List[Task], Task,
-                Tuple[Task, Task]
-            ]
-        ]
-        for task_line in task_list:
-            tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest,\
-                (task_operation_return, task_executed) = task_line
-            # * only the 'OUT' will be affected by silence level
-            for derived_task in tasks_derived:
-                '''
-                Ref. OpenNARS 3.1.0 Memory.java line 344~352
-                    ```
-                    final float budget = t.budget.summary();
-                    final float noiseLevel = 1.0f - (narParameters.VOLUME / 100.0f);
-                    
-                    if (budget >= noiseLevel) {  // only report significant derived Tasks
-                        emit(OUT.class, t);
-                        if (Debug.PARENTS) {
-                            emit(DEBUG.class, "Parent Belief\t" + t.parentBelief);
-                            emit(DEBUG.class, "Parent Task\t" + t.parentTask + "\n\n");
-                        }
-                    }
-                    ```
-                '''
-                if derived_task.budget.summary > self.volume_threshold:
-                    outs.append(
-                        NARSOutput(
-                            PrintType.OUT, derived_task.sentence.repr(), *derived_task.budget)
-                    )
-
-            if judgement_revised is not None:
-                if judgement_revised.budget.summary > self.volume_threshold:
-                    outs.append(NARSOutput(
-                        PrintType.OUT, judgement_revised.sentence.repr(), *judgement_revised.budget))
-            if goal_revised is not None:
-                if judgement_revised.budget.summary > self.volume_threshold:
-                    outs.append(NARSOutput(
-                        PrintType.OUT, goal_revised.sentence.repr(), *goal_revised.budget))
-            if answers_question is not None:
-                for answer in answers_question:
-                    outs.append(
-                        NARSOutput(PrintType.ANSWER, answer.sentence.repr(), *answer.budget))
-            if answers_quest is not None:
-                for answer in answers_quest:
-                    outs.append(NARSOutput(
-                        PrintType.ACHIEVED, answer.sentence.repr(), *answer.budget))
-            if task_executed is not None:
-                outs.append(NARSOutput(
-                    PrintType.EXE, f'{task_executed.term.repr()} = {str(task_operation_return) if task_operation_return is not None else None}'))
-
+        def sink(task_line):
+            outs_cycle = self._outputs_of_cycle(task_line)
             # * print & event patch
-            for out in outs:
+            for out in outs_cycle:
                 if out:
                     self.print_output(type=out.type, content=out.content, p=out.p,
                                       d=out.d, q=out.q, comment_title=out.comment_title, end=out.end)
                 # broadcast outputs before return
                 self._handle_NARS_output(out=out)
+            outs.extend(outs_cycle)
+
+        for line in lines.split('\n'):
+            if len(line) == 0:
+                continue
+
+            self.run_line(reasoner=self._NARS, line=line, sink=sink)
+            self._input_history.append(line)
 
         # return outputs
         return outs
 
+    def _outputs_of_cycle(self, task_line: Tuple[List[Task], Task, Task, List[Task], Task, Tuple[Task, Task]]) -> List[NARSOutput]:
+        '''Convert the output of a cycle into NARS output objects'''
+        outs: List[NARSOutput] = []
+        tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest,\
+            (task_operation_return, task_executed) = task_line
+        # * only the 'OUT' will be affected by silence level
+        for derived_task in tasks_derived:
+            '''
+            Ref. OpenNARS 3.1.0 Memory.java line 344~352
+                ```
+                final float budget = t.budget.summary();
+                final float noiseLevel = 1.0f - (narParameters.VOLUME / 100.0f);
+                
+                if (budget >= noiseLevel) {  // only report significant derived Tasks
+                    emit(OUT.class, t);
+                    if (Debug.PARENTS) {
+                        emit(DEBUG.class, "Parent Belief\t" + t.parentBelief);
+                        emit(DEBUG.class, "Parent Task\t" + t.parentTask + "\n\n");
+                    }
+                }
+                ```
+            '''
+            if derived_task.budget.summary > self.volume_threshold:
+                outs.append(
+                    NARSOutput(
+                        PrintType.OUT, derived_task.sentence.repr(), *derived_task.budget)
+                )
+
+        if judgement_revised is not None:
+            if judgement_revised.budget.summary > self.volume_threshold:
+                outs.append(NARSOutput(
+                    PrintType.OUT, judgement_revised.sentence.repr(), *judgement_revised.budget))
+        if goal_revised is not None:
+            if goal_revised.budget.summary > self.volume_threshold:
+                outs.append(NARSOutput(
+                    PrintType.OUT, goal_revised.sentence.repr(), *goal_revised.budget))
+        if answers_question is not None:
+            for answer in answers_question:
+                outs.append(
+                    NARSOutput(PrintType.ANSWER, answer.sentence.repr(), *answer.budget))
+        if answers_quest is not None:
+            for answer in answers_quest:
+                outs.append(NARSOutput(
+                    PrintType.ACHIEVED, answer.sentence.repr(), *answer.budget))
+        if task_executed is not None:
+            outs.append(NARSOutput(
+                PrintType.EXE, f'{task_executed.term.repr()} = {str(task_operation_return) if task_operation_return is not None else None}'))
+        return outs
+
     # run line
-    def run_line(self, reasoner: reasoner, line: str) -> Union[None, List[Task]]:
-        '''Run one line of input'''
+    def run_line(self, reasoner: reasoner, line: str, sink: Callable = None) -> Union[None, List[Task]]:
+        '''Run one line of input. The output of each cycle is passed to `sink` if any, otherwise snapshots of the outputs are returned'''
         line = line.strip(' \r\n\t')  # ignore spaces
         # special notations
         if line.startswith("''"):  #
@@ -459,11 +453,12 @@ class NARSInterface:
         elif line.isdigit():
             n_cycles = int(line)
             self.print_output(PrintType.INFO, f'Run {n_cycles} cycles.')
+            if sink is not None:
+                reasoner.run(n_cycles, sink)
+                return None
             tasks_in_cycles: List[Task] = []
             # Get all export statements run during this period, deep copy for backup
-            for _ in range(n_cycles):
-                tasks_caught = reasoner.cycle()
-                tasks_in_cycles.append(deepcopy(tasks_caught))
+            reasoner.run(n_cycles, tasks_in_cycles, snapshot=True)
             return tasks_in_cycles
         # narsese
         else:
@@ -476,6 +471,9 @@ class NARSInterface:
                 else:  # input failed
                     self.print_output(
                         PrintType.ERROR, f'Input "{line}" failed.')
+                if sink is not None:
+                    reasoner.run(1, sink)
+                    return None
                 tasks_caught = reasoner.cycle()  # run cycles
                 return [deepcopy(tasks_caught)]  # Returns a inferred statement
 
@@ -1,7 +1,6 @@
 from typing import Union
 from pynars.Config import Config
-from pynars.Narsese import Stamp
-from copy import deepcopy
+from pynars.Narsese import Stamp, Base
 from pynars.Narsese import Connector, Copula
 
 
@@ -13,15 +12,16 @@ _temporal_interval = {
 }
 
 def Stamp_merge(stamp1: Stamp, stamp2: Stamp, order_mark: Union[Copula, Connector]=None, reverse_order=False, t_bias=0):
-    stamp: Stamp = deepcopy(stamp1)
-    # stamp.is_external = stamp1.is_external
-    if stamp is not None:
-        stamp.extend_evidenital_base(stamp2.evidential_base)
-        if not stamp1.is_eternal and not stamp2.is_eternal:
-            stamp.t_occurrence = max(stamp1.t_occurrence, stamp2.t_occurrence)
-        if not stamp1.is_eternal:
-            # occurrence time interval
-            interval = _temporal_interval.get(order_mark, 0)
-            if reverse_order: interval = -interval
-            stamp.t_occurrence += interval + t_bias
-    return stamp
\ No newline at end of file
+    '''
+    Make the stamp of a conclusion from those of its two premises: the creation time is that of `stamp1`, and the evidential base is the merge of the two bases (see `Base.merge`), which are not copied.
+    '''
+    if stamp1 is None: return None
+    t_occurrence = stamp1.t_occurrence
+    if t_occurrence is not None:
+        if stamp2.t_occurrence is not None:
+            t_occurrence = max(t_occurrence, stamp2.t_occurrence)
+        # occurrence time interval
+        interval = _temporal_interval.get(order_mark, 0)
+        if reverse_order: interval = -interval
+        t_occurrence += interval + t_bias
+    return Stamp(stamp1.t_creation, t_occurrence, stamp1.t_put, Base.merge(stamp1.evidential_base, stamp2.evidential_base))
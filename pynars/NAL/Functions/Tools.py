@@ -2,7 +2,7 @@
 
 # def compound_remove_components
 
-from typing import Union
+from typing import List, Union
 from pynars import Global
 from pynars.Config import Config, Enable
 from pynars.NAL.Functions.TemporalFunctions import eternalize, project
@@ -10,7 +10,7 @@ from pynars.Narsese import Budget
 from pynars.Narsese import Sentence, Judgement, Truth, Task
 from copy import deepcopy
 # import Config, Global
-from math import sqrt
+from math import sqrt, nan
 from pynars.Narsese import Sentence, Stamp, Term
 from pynars.Narsese import TRUE, FALSE, UNSURE
 from pynars.Narsese import Goal, Quest, Question
@@ -119,6 +119,54 @@ def calculate_solution_quality(s_in: Sentence, s_solution: Sentence, rate_by_con
         return truth.c
 
 
+def calculate_solution_qualities(s_in: Sentence, s_solutions: List[Sentence], rate_by_confidence: bool=True):
+    '''
+    The vectorized version of `calculate_solution_quality`, which evaluates several solutions to the same problem at once, with NumPy arrays of their truth-values and occurrence times. The results are the same as those of `calculate_solution_quality`.
+
+    Args: 
+        s_in (Sentence): the sentence in an input task.
+        s_solutions (List[Sentence]): the sentences in the memory for solving the task.
+    Returns:
+        qualities (np.ndarray): the quality of each solution.
+    '''
+    import numpy as np
+
+    truths = [s.truth for s in s_solutions]
+    c = np.array([truth.c for truth in truths], dtype=float)
+    t_occur = [s.stamp.t_occurrence for s in s_solutions]
+    t_source = np.array([t if t is not None else nan for t in t_occur], dtype=float)
+    is_eternal = np.isnan(t_source)
+
+    # project the truths of the events occurring at another time, and eternalize them.
+    t_target = s_in.stamp.t_occurrence
+    if t_target is None:
+        to_project = ~is_eternal
+    else:
+        to_project = ~is_eternal & (t_source != t_target)
+    if to_project.any():
+        c_projected = c[to_project]
+        k = np.array([truth.k for truth in truths], dtype=float)[to_project]
+        if t_target is not None:
+            t_s = t_source[to_project]
+            t_current = Global.time
+            v = np.abs(t_s - t_target)
+            t_current_is_in_interval = (np.minimum(t_s, t_target) <= t_current) & (t_current <= np.maximum(t_s, t_target))
+            s = np.where(t_current_is_in_interval, 0.5, np.minimum(np.abs(t_s - t_current), np.abs(t_target - t_current)))
+            c_projected = c_projected * (1 - v/(2*s + v))
+        c[to_project] = c_projected/(c_projected + k)
+
+    if not rate_by_confidence:
+        f = np.array([truth.f for truth in truths], dtype=float)
+        complexity = np.array([s.term.complexity for s in s_solutions], dtype=float)
+        qualities = (c * (f - 0.5) + 0.5) / np.sqrt(np.sqrt(np.sqrt(complexity * Config.r_term_complexity_unit)))
+    else:
+        qualities = c
+
+    punct = s_in.punct
+    qualities[[i for i, s in enumerate(s_solutions) if s.punct is not punct and s.term.has_qvar]] = 0.0
+    return qualities
+
+
 # def temporal_matching_order(s1: Sentence, s2: Sentence):
 #     if Enable.temporal_rasoning:
 #         # raise 'Eliminate this line.'
@@ -0,0 +1,142 @@
+'''
+A driver running the cycles of a `Reasoner` in a dedicated thread, while coroutines feed it with inputs.
+
+The producers (e.g. the coroutines serving sockets or websockets) put their inputs into `AsyncChannel`s, which are bounded queues: a producer waits while its channel is full, but the cycles never wait for a producer.
+`AsyncReasoner.run` alternates, on the event loop, between moving the inputs queued into the channels of the reasoner, as many as they have room for, and awaiting a step of `cycles_per_step` cycles, which runs in the executor. While a step runs, the event loop keeps serving the producers.
+
+The reasoner must only be used through the driver while it runs, since it is not thread-safe. Each step is run within the context of the reasoner (see `pynars.Global`), so the Narsese queued is parsed there.
+
+The driver records, in histograms with logarithmic bins (see `Profiler.Histogram`):
+
+    ingest_latency      the time from putting an input into an `AsyncChannel` to putting it into the channel of the reasoner
+    cycle_duration      the duration of each cycle
+    cycle_interval      the time between the starts of two consecutive cycles of a run, whose spread is the jitter of the cycles
+'''
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, List, Tuple, Union
+
+from ..DataStructures import Channel, AsyncChannel, AsyncNarseseChannel
+from .Profiler import Histogram
+from .Reasoner import Reasoner
+
+
+class AsyncReasoner:
+
+    def __init__(self, reasoner: Reasoner, cycles_per_step: int=1, capacity: int=None, executor: Executor=None) -> None:
+        '''
+        Args:
+            cycles_per_step: the number of cycles run between two intakes of the inputs queued.
+            capacity: the capacity of `narsese_channel`. By default, that of the Narsese channel of the reasoner.
+            executor: where the cycles are run. By default, a thread of its own, which `close` shuts down.
+        '''
+        self.reasoner = reasoner
+        self.cycles_per_step = cycles_per_step
+        self._own_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1, thread_name_prefix='AsyncReasoner')
+
+        target = reasoner.narsese_channel
+        self.narsese_channel = AsyncNarseseChannel(capacity if capacity is not None else target.capacity, target)
+        self.channels: List[AsyncChannel] = [self.narsese_channel]
+
+        self.ingest_latency = Histogram()
+        self.cycle_duration = Histogram()
+        self.cycle_interval = Histogram()
+        self.n_cycles = 0
+
+        self._running = False
+        self._t_last_cycle: float = None
+
+    def add_channel(self, capacity: int, target: Channel=None) -> AsyncChannel:
+        '''
+        Add a channel of tasks, which are ingested into `target`. By default, `target` is a new `Channel` of the same capacity, which is added to the channels of the reasoner.
+        It must not be called while the driver runs.
+        '''
+        if target is None:
+            target = Channel(capacity)
+            self.reasoner.channels.append(target)
+        channel = AsyncChannel(capacity, target)
+        self.channels.append(channel)
+        return channel
+
+    async def input_narsese(self, text: str):
+        '''Queue a line of Narsese, waiting while `narsese_channel` is full.'''
+        await self.narsese_channel.put(text)
+
+    async def run(self, n_cycles: int=None, sink: Union[Callable, Any]=None) -> int:
+        '''
+        Run `n_cycles` cycles, or until `stop` is called if `n_cycles` is None, ingesting the inputs queued before each step.
+
+        Args:
+            sink: as in `Reasoner.run`. It is called from the thread running the cycles.
+
+        Returns:
+            the number of cycles run.
+        '''
+        loop = asyncio.get_running_loop()
+        emit = None if sink is None else sink if callable(sink) else sink.append
+        self._running = True
+        self._t_last_cycle = None
+        n_done = 0
+        try:
+            while self._running and (n_cycles is None or n_done < n_cycles):
+                n = self.cycles_per_step if n_cycles is None else min(self.cycles_per_step, n_cycles - n_done)
+                batches = []
+                room = {} # id(target) -> the number of items it has still room for, shared by the channels ingested into it
+                for channel in self.channels:
+                    target = channel.target
+                    n_room = room.get(id(target), None)
+                    if n_room is None: n_room = target.capacity - len(target)
+                    items = channel.take_nowait(n_room)
+                    room[id(target)] = n_room - len(items)
+                    batches.append((channel, items))
+                await loop.run_in_executor(self.executor, self._step, batches, n, emit)
+                n_done += n
+        finally:
+            self._running = False
+        return n_done
+
+    def stop(self):
+        '''Make `run` return after the current step.'''
+        self._running = False
+
+    def close(self):
+        '''Shut down the executor, if it is the driver's own.'''
+        if self._own_executor: self.executor.shutdown(wait=True)
+
+    def _step(self, batches: List[Tuple[AsyncChannel, List[Tuple[Any, float]]]], n_cycles: int, emit: Callable):
+        '''Ingest the inputs taken from the queues, then run `n_cycles` cycles. It is run in the executor.'''
+        reasoner = self.reasoner
+        with reasoner.context:
+            for channel, items in batches:
+                if len(items) == 0: continue
+                channel.ingest([item for item, _ in items])
+                t_ingested = perf_counter()
+                for _, t_put in items:
+                    self.ingest_latency.add(t_ingested - t_put)
+
+            cycle = reasoner.cycle
+            t_last = self._t_last_cycle
+            for _ in range(n_cycles):
+                t0 = perf_counter()
+                if t_last is not None: self.cycle_interval.add(t0 - t_last)
+                t_last = t0
+                outputs = cycle()
+                self.cycle_duration.add(perf_counter() - t0)
+                if emit is not None: emit(outputs)
+            self._t_last_cycle = t_last
+            self.n_cycles += n_cycles
+
+    def stats(self) -> dict:
+        '''The histograms (see the module docstring), as a dict which can be serialized to JSON.'''
+        return dict(
+            n_cycles=self.n_cycles,
+            queued=[len(channel) for channel in self.channels],
+            ingest_latency=self.ingest_latency.to_dict(),
+            cycle_duration=self.cycle_duration.to_dict(),
+            cycle_interval=self.cycle_interval.to_dict(),
+        )
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: #cycles={self.n_cycles}, #channels={len(self.channels)}>'
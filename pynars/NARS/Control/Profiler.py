@@ -0,0 +1,157 @@
+'''
+Opt-in instrumentation of `Reasoner.cycle`.
+
+A `CycleProfiler` is attached by `reasoner.profiler = CycleProfiler()` and detached by `reasoner.profiler = None`. While it is detached, the reasoner only checks that it is `None` at each phase.
+
+The reasoner records the duration of each phase of a cycle:
+
+    cycle                           the whole cycle
+    observe                         `Reasoner.observe`
+    observe.channels                taking the inputs from the channels into the overall experience and the event buffer
+    observe.temporal_chaining       `EventBuffer.generate_temporal_sentences`, within `observe.channels`
+    observe.internal_experience     moving a task from the internal experience to the overall experience
+    observe.memory_accept           `Memory.accept`
+    observe.temporal_inference      the temporal inference of NAL-7
+    observe.mental_operation        the mental operations of NAL-9
+    consider                        `Reasoner.consider`
+    consider.take_concept           taking the concept out of the memory
+    consider.put_back               putting the concept back into the memory
+    consider.task_link              taking the task-link
+    consider.term_link_scan         searching the term-links for a belief
+    inference.immediate             the immediate rules, and the tasks derived by them
+    inference.structural            the structural rules (theorems)
+    inference.compositional         the compositional rules
+    inference.syllogistic           the syllogistic rules
+    inference.backward              the backward rules, for questions and goals
+    filter                          putting the derived tasks into the internal experience and filtering them by complexity
+
+and counts:
+
+    tasks_derived.<kind>            the tasks derived by each kind of inference above
+    cache_hits.<kind>, cache_misses.<kind>
+                                    the results of each kind of inference taken from the cache of `KanrenEngine`, or computed
+    rules_tried.<method>            the rules tried by each method of `KanrenEngine` (see `KanrenEngine.candidate_rules`)
+    query_fanout.judgements         the judgements looked up in the index of the pending queries of `Memory`
+    query_fanout.candidate_queries  the queries found there, and checked against the judgements
+    query_fanout.queries            the queries looked up in the index of the beliefs of `Memory`
+    query_fanout.candidate_beliefs  the concepts with beliefs found there, and checked against the queries
+    query_fanout.matched            the pairs of a query and a judgement (or a concept) whose terms match
+    query_fanout.dropped            the queries no longer pending, and the concepts no longer in the memory, found in the indexes
+
+Each duration is put in a histogram with logarithmic bins: the bin `i > 0` counts the durations in `[2**(i-1), 2**i)` microseconds, the bin `0` those under 1 microsecond and the last bin the longer ones.
+'''
+import json
+from math import frexp
+from time import perf_counter
+from typing import Dict, List
+
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    n_bins: int = 26 # up to 2**24 us, about 17s
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0]*self.n_bins
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        _, exponent = frexp(duration*1e6)
+        self.counts[min(max(exponent, 0), self.n_bins-1)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max: self.max = duration
+
+    @property
+    def mean(self) -> float:
+        return self.total/self.count if self.count > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        '''The upper edge (in seconds) of the bin containing the `q`-quantile.'''
+        if self.count == 0: return 0.0
+        rank = q*self.count
+        n = 0
+        for i, count in enumerate(self.counts):
+            n += count
+            if n >= rank: return min(2**i*1e-6, self.max)
+        return self.max
+
+    @classmethod
+    def edges(cls) -> List[float]:
+        '''The upper edges of the bins, in seconds. The last bin has no upper edge.'''
+        return [2**i*1e-6 for i in range(cls.n_bins-1)] + [float('inf')]
+
+    def to_dict(self) -> dict:
+        return dict(count=self.count, total=self.total, mean=self.mean, max=self.max, p50=self.quantile(0.5), p99=self.quantile(0.99), counts=list(self.counts))
+
+
+class CycleProfiler:
+    '''The durations of the phases of the cycles, and the counters, recorded by a `Reasoner`. See the module docstring.'''
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._tracked: Dict[str, Dict[str, int]] = {}
+        self.n_cycles = 0
+
+    clock = staticmethod(perf_counter)
+
+    def lap(self, phase: str, t0: float) -> float:
+        '''Record the time since `t0` as a duration of `phase`, and return the current time, from which the next phase can be timed.'''
+        t1 = perf_counter()
+        histogram = self.histograms.get(phase, None)
+        if histogram is None: histogram = self.histograms[phase] = Histogram()
+        histogram.add(t1 - t0)
+        return t1
+
+    def count(self, counter: str, n: int=1):
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def count_cache(self, kind: str, cached: bool):
+        self.count(f'cache_hits.{kind}' if cached else f'cache_misses.{kind}')
+
+    def track(self, prefix: str, values: Dict[str, int]):
+        '''
+        Add the increase of the monotonic counters `values` (e.g. `KanrenEngine.rules_tried`) since the last call to the counters `{prefix}.{name}`.
+        The first call only takes the values as a reference.
+        '''
+        last = self._tracked.get(prefix, None)
+        self._tracked[prefix] = dict(values)
+        if last is None: return
+        for name, value in values.items():
+            delta = value - last.get(name, 0)
+            if delta != 0: self.count(f'{prefix}.{name}', delta)
+
+    def reset(self):
+        self.histograms.clear()
+        self.counters.clear()
+        self._tracked.clear()
+        self.n_cycles = 0
+
+    def to_dict(self) -> dict:
+        '''The histograms and the counters, as a dict which can be serialized to JSON.'''
+        return dict(
+            n_cycles=self.n_cycles,
+            edges=Histogram.edges()[:-1],
+            phases={phase: histogram.to_dict() for phase, histogram in sorted(self.histograms.items())},
+            counters=dict(sorted(self.counters.items())),
+        )
+
+    def export(self, path: str):
+        '''Write `to_dict()` into the JSON file `path`.'''
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self) -> str:
+        '''A table of the phases, sorted by their total duration, and of the counters.'''
+        lines = [f'#cycles={self.n_cycles}', f'{"phase":<36} {"count":>8} {"total(ms)":>10} {"mean(us)":>9} {"p50(us)":>8} {"p99(us)":>8} {"max(us)":>9}']
+        for phase, histogram in sorted(self.histograms.items(), key=lambda item: -item[1].total):
+            lines.append(f'{phase:<36} {histogram.count:>8} {histogram.total*1e3:>10.1f} {histogram.mean*1e6:>9.1f} {histogram.quantile(0.5)*1e6:>8.0f} {histogram.quantile(0.99)*1e6:>8.0f} {histogram.max*1e6:>9.0f}')
+        for counter, value in sorted(self.counters.items()):
+            lines.append(f'{counter:<36} {value:>8}')
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: #cycles={self.n_cycles}, #phases={len(self.histograms)}>'
@@ -1,4 +1,3 @@
-import random
 from os import remove
 from pynars.NAL.Functions.BudgetFunctions import Budget_forward, Budget_backward
 from pynars.NAL.Functions.StampFunctions import Stamp_merge
@@ -20,12 +19,14 @@ from ..DataStructures import Bag, Memory, NarseseChannel, Buffer, Task, Concept,
 from ..InferenceEngine import GeneralEngine, TemporalEngine, VariableEngine, KanrenEngine
 from pynars import Config
 from pynars.Config import Enable
-from typing import Callable, List, Tuple, Union
+from typing import Any, Callable, Iterable, List, Tuple, Union
+from copy import deepcopy
 import pynars.NARS.Operation as Operation
 from pynars import Global
 from time import time
 from pynars.NAL.Functions.Tools import project_truth, project
 from ..GlobalEval import GlobalEval
+from .Profiler import CycleProfiler
 from ..InferenceEngine.KanrenEngine import util
 
 
@@ -33,8 +34,8 @@ class Reasoner:
     avg_inference = 0
     num_runs = 0
     
-    all_theorems = Bag(100, 100, take_in_order=False)
     theorems_per_cycle = 1
+    inputs_per_cycle = 1 # the number of tasks taken from each channel in `observe`
 
     structural_enabled = True
     immediate_enabled = True
@@ -46,8 +47,15 @@ class Reasoner:
             self._theorem = theorem
 
     def __init__(self, n_memory, capacity, config='./config.json', 
-                 nal_rules={1, 2, 3, 4, 5, 6, 7, 8, 9}, inference: str = 'kanren') -> None:
+                 nal_rules={1, 2, 3, 4, 5, 6, 7, 8, 9}, inference: str = 'kanren', context: Global.ReasonerContext = None) -> None:
+        '''
+        Args:
+            context: the clock, the input ids, the states, the theorems and the random number generator of the reasoner. By default, the current one (see `pynars.Global`), which is shared by all the reasoners created without a context.
+        '''
         # print('''Init...''')
+        self.context = context if context is not None else Global.current_context()
+        if self.context.theorems is None:
+            self.context.theorems = Bag(100, 100, take_in_order=False)
         Config.load(config)
 
         self.global_eval = GlobalEval()
@@ -57,7 +65,7 @@ class Reasoner:
 
             if self.structural_enabled:
                 for theorem in self.inference.theorems:
-                    priority = random.randint(0,9) * 0.01
+                    priority = self.context.rng.randint(0,9) * 0.01
                     item = self.TheoremItem(theorem, Budget(0.5 + priority, 0.8, 0.5))
                     self.all_theorems.put(item)
         else:
@@ -84,10 +92,16 @@ class Reasoner:
         self.u_top_level_attention = 0.5
 
         # metrics
+        self.profiler: CycleProfiler = None # opt-in, see `Profiler.py`
         self.cycles_count = 0
         self.last_cycle_duration = 0
         self.avg_cycle_duration = 0
 
+    @property
+    def all_theorems(self) -> Bag:
+        return self.context.theorems
+
+    @Global.in_context
     def reset(self):
         self.memory.reset()
         self.overall_experience.reset()
@@ -99,13 +113,19 @@ class Reasoner:
 
         self.sequence_buffer.reset()
         self.operations_buffer.reset()
+        self.event_buffer.reset()
+        self.global_eval.reset()
+        self.u_top_level_attention = 0.5
+
+        if type(self.inference) is KanrenEngine:
+            self.inference.cache_clear()
 
         if self.structural_enabled:
             if type(self.inference) is KanrenEngine:
                 # reset theorems priority
                 self.all_theorems.reset()
                 for theorem in self.inference.theorems:
-                    priority = random.randint(0,9) * 0.01
+                    priority = self.context.rng.randint(0,9) * 0.01
                     item = self.TheoremItem(theorem, Budget(0.5 + priority, 0.8, 0.5))
                     self.all_theorems.put(item)
 
@@ -113,12 +133,45 @@ class Reasoner:
         self.avg_inference = 0
         self.num_runs = 0
 
+    @Global.in_context
+    def save(self, path):
+        '''Write a snapshot of the memory, the clock and the counter of input ids of the reasoner to `path`. See `Memory.save`.'''
+        self.memory.save(path)
+
+    @Global.in_context
+    def load(self, path):
+        '''
+        Restore the memory, the clock and the counter of input ids of the reasoner from the snapshot at `path` (see `save`).
+        The reasoner is reset first, so the tasks in its buffers and channels are dropped.
+        '''
+        self.reset()
+        self.memory.load(path)
+
     def cycles(self, n_cycle: int):
         tasks_all_cycles = []
-        for _ in range(n_cycle):
-            tasks_all_cycles.append(self.cycle())
+        self.run(n_cycle, tasks_all_cycles.append)
         return tasks_all_cycles
 
+    @Global.in_context
+    def run(self, n_cycle: int, sink: Union[Callable, Any] = None, snapshot: bool = False):
+        '''
+        Run `n_cycle` cycles, and stream the output of each cycle (the tuple returned by `cycle`) to `sink`.
+
+        Args:
+            sink: a callable, or a container with `append`, e.g. `collections.deque(maxlen=n)` as a bounded ring buffer. If `None`, the outputs are dropped.
+            snapshot: if true, `sink` receives deep copies of the outputs, which the following cycles cannot alter. Otherwise, the outputs are not copied.
+        '''
+        cycle = self.cycle
+        if sink is None:
+            for _ in range(n_cycle): cycle()
+            return
+        emit = sink if callable(sink) else sink.append
+        if snapshot:
+            for _ in range(n_cycle): emit(deepcopy(cycle()))
+        else:
+            for _ in range(n_cycle): emit(cycle())
+
+    @Global.in_context
     def input_narsese(self, text, go_cycle: bool = False) -> Tuple[bool, Union[Task, None], Union[Task, None]]:
         success, task, task_overflow = self.narsese_channel.put(text)
         if go_cycle:
@@ -126,21 +179,40 @@ class Reasoner:
             return success, task, task_overflow, tasks
         return success, task, task_overflow
 
+    @Global.in_context
+    def input_narsese_bulk(self, lines: Iterable[str]) -> List[Tuple[bool, Union[Task, None], Union[Task, None]]]:
+        '''
+        Input many lines of Narsese at once, e.g. the lines of a `.nal` file, without running any cycle.
+        The blank lines, the comments and the numbers of cycles are skipped. The sentences seen before are not parsed again (see `LarkParser`).
+
+        Returns:
+            (success, task, task_overflow) for each line of Narsese, as `input_narsese`.
+        '''
+        return self.narsese_channel.put_lines(lines)
+
+    @Global.in_context
     def cycle(self):
         start_cycle_time_in_seconds = time()
         """Everything to do by NARS in a single working cycle"""
         Global.States.reset()
+        profiler = self.profiler
+        if profiler is not None:
+            if type(self.inference) is KanrenEngine:
+                profiler.track('rules_tried', self.inference.rules_tried)
+            profiler.track('query_fanout', self.memory.query_fanout)
+            t_cycle = t0 = profiler.clock()
         tasks_derived: List[Task] = []
 
         judgement_revised, goal_revised, answers_question, answers_quest = None, None, None, None
         task_operation_return, task_executed = None, None
 
-        random_number: float = random.random()
+        random_number: float = self.context.rng.random()
 
         data_structure_accessed_busyness = None
         if random_number < self.u_top_level_attention:
             judgement_revised, goal_revised, answers_question, answers_quest = self.observe(
                 tasks_derived)
+            if profiler is not None: t0 = profiler.lap('observe', t0)
 
             if answers_question is not None and len(answers_question) != 0:
                 for each in answers_question:
@@ -150,6 +222,7 @@ class Reasoner:
             data_structure_accessed_busyness = self.overall_experience.busyness
         else:
             self.consider(tasks_derived)
+            if profiler is not None: t0 = profiler.lap('consider', t0)
             data_structure_accessed_busyness = self.memory.busyness
 
         self.u_top_level_attention = Config.Config.r_top_level_attention_adjust * data_structure_accessed_busyness \
@@ -166,6 +239,14 @@ class Reasoner:
         tasks_derived = [
             task for task in tasks_derived if task.term.complexity <= thresh_complexity]
 
+        if profiler is not None:
+            profiler.lap('filter', t0)
+            profiler.lap('cycle', t_cycle)
+            profiler.n_cycles += 1
+            if type(self.inference) is KanrenEngine:
+                profiler.track('rules_tried', self.inference.rules_tried)
+            profiler.track('query_fanout', self.memory.query_fanout)
+
         """done with cycle"""
         self.do_cycle_metrics(start_cycle_time_in_seconds)
 
@@ -179,7 +260,10 @@ class Reasoner:
         """
         # step 4. Apply inference step
         #   general inference step
+        profiler = self.profiler
+        if profiler is not None: t0 = profiler.clock()
         concept: Concept = self.memory.take(remove=True)
+        if profiler is not None: profiler.lap('consider.take_concept', t0)
         if concept is not None:
             # self.num_runs += 1
             # t0 = time()
@@ -190,8 +274,10 @@ class Reasoner:
             # print("inference:", 1 // self.avg_inference, "per second", f"({1//t1})")
             
             is_concept_valid = True  # TODO
+            if profiler is not None: t0 = profiler.clock()
             if is_concept_valid:
                 self.memory.put_back(concept)
+            if profiler is not None: profiler.lap('consider.put_back', t0)
 
     def observe(self, tasks_derived: List[Task]):
         """
@@ -199,17 +285,23 @@ class Reasoner:
             Process Channels/Buffers
         """
         judgement_revised, goal_revised, answers_question, answers_quest = None, None, None, None
+        profiler = self.profiler
+        if profiler is not None: t0 = profiler.clock()
         # step 1. Take out an Item from `Channels`, and then put it into the `Overall Experience` and Event Buffers
         for channel in self.channels:
-            task_in: Task = channel.take()
-            if task_in is not None:
+            for _ in range(self.inputs_per_cycle):
+                task_in: Task = channel.take()
+                if task_in is None: break
                 self.overall_experience.put(task_in)
                 if self.event_buffer.can_task_enter(task_in):
                     self.event_buffer.put(task_in)
-                    # when there's a new event, run the temporal chaining
-                    temporal_results = self.event_buffer.generate_temporal_sentences()
+                    # when there's a new event, run the temporal chaining on the combinations containing it
+                    if profiler is not None: t_chaining = profiler.clock()
+                    temporal_results = self.event_buffer.generate_temporal_sentences(task_in)
                     for result in temporal_results:
                         self.overall_experience.put(result)
+                    if profiler is not None: profiler.lap('observe.temporal_chaining', t_chaining)
+        if profiler is not None: t0 = profiler.lap('observe.channels', t0)
 
         # step 2. Take out an Item from the `Internal Experience`, with putting it back afterwards, and then put it
         # into the `Overall Experience`
@@ -217,6 +309,7 @@ class Reasoner:
         if task is not None:
             self.overall_experience.put(task)
             self.internal_experience.put_back(task)
+        if profiler is not None: t0 = profiler.lap('observe.internal_experience', t0)
 
         # step 3. Process a task in the global experience buffer
         task: Task = self.overall_experience.take()
@@ -230,6 +323,7 @@ class Reasoner:
             # goal_revised = self.process_goal(task, concept)
             judgement_revised, goal_revised, answers_question, answers_quest, (
                 task_operation_return, task_executed), _tasks_derived = self.memory.accept(task)
+            if profiler is not None: t0 = profiler.lap('observe.memory_accept', t0)
             if task_operation_return is not None:
                 tasks_derived.append(task_operation_return)
             # if task_executed is not None: tasks_derived.append(task_executed)
@@ -278,6 +372,7 @@ class Reasoner:
 
             #   temporal induction in NAL-7
             if Enable.temporal_reasoning and task is not None and task.is_judgement and task.is_external_event:
+                if profiler is not None: t0 = profiler.clock()
                 concept_task: Concept = self.memory.take_by_key(
                     task.term, remove=False)
                 # t1 = time()
@@ -288,6 +383,7 @@ class Reasoner:
                         self.operations_buffer
                     )
                 )
+                if profiler is not None: profiler.lap('observe.temporal_inference', t0)
                 # t2 = time()
                 # print(f"time: {t2-t1}")
             else:
@@ -296,10 +392,12 @@ class Reasoner:
             #   mental operation of NAL-9
             if Enable.operation:  # it should be `Enable.mental_operation`?
                 # self.memory.
+                if profiler is not None: t0 = profiler.clock()
                 concept_task: Concept = self.memory.take_by_key(
                     task.term, remove=False)
                 task_operation_return, task_executed, belief_awared = self.mental_operation(
                     task, concept_task, answers_question, answers_quest)
+                if profiler is not None: profiler.lap('observe.mental_operation', t0)
                 if task_operation_return is not None:
                     tasks_derived.append(task_operation_return)
                 if task_executed is not None:
@@ -357,6 +455,8 @@ class Reasoner:
 
         '''One step inference.'''
         tasks_derived = []
+        profiler = self.profiler
+        if profiler is not None: t0 = profiler.clock()
 
         Global.States.record_concept(concept)
         
@@ -367,18 +467,18 @@ class Reasoner:
             return tasks_derived
         
         concept.task_links.put_back(task_link)
+        if profiler is not None: t0 = profiler.lap('consider.task_link', t0)
 
         task: Task = task_link.target
 
         # inference for two-premises rules
-        term_links = []
         term_link_valid = None
         is_valid = False
 
-        for _ in range(len(concept.term_links)): # TODO: should limit max number of links to process
-            # To find a belief, which is valid to interact with the task, by iterating over the term-links.
-            term_link: TermLink = concept.term_links.take(remove=True)
-            term_links.append(term_link)
+        # To find a belief, which is valid to interact with the task, by peeking at the term-links in the order in which the bag would take them out, up to `Config.max_term_links_matched` of them.
+        # Only the term-link found is taken out of the bag (and put back after it is rewarded); the others keep their positions.
+        for term_link in concept.term_links.peek(Config.Config.max_term_links_matched):
+            term_link: TermLink
 
             if not task_link.novel(term_link, Global.time):
                 continue
@@ -402,6 +502,9 @@ class Reasoner:
                 is_valid = True
                 break
 
+        if is_valid:
+            concept.term_links.take_by_key(term_link_valid, remove=True)
+        if profiler is not None: t0 = profiler.lap('consider.term_link_scan', t0)
         
         ### IMMEDIATE
 
@@ -413,6 +516,9 @@ class Reasoner:
 
                 backward = task.is_question or task.is_goal
                 res, cached = self.inference.inference_immediate(task.sentence, backward=backward)
+                if profiler is not None:
+                    profiler.count_cache('immediate', cached)
+                    n_derived = len(tasks_derived)
 
                 if not cached:
                     results.extend(res)
@@ -452,6 +558,9 @@ class Reasoner:
 
                 # record immediate rule application for task
                 task.immediate_rules_applied = True
+                if profiler is not None:
+                    profiler.count('tasks_derived.immediate', len(tasks_derived) - n_derived)
+                    t0 = profiler.lap('inference.immediate', t0)
 
 
         ### STRUCTURAL
@@ -461,6 +570,7 @@ class Reasoner:
                 Global.States.record_premises(task)
 
                 results = []
+                if profiler is not None: n_derived = len(tasks_derived)
 
                 theorems = []
                 for _ in range(min(self.theorems_per_cycle, len(self.all_theorems))):
@@ -469,6 +579,7 @@ class Reasoner:
                 
                 for theorem in theorems:
                     res, cached = self.inference.inference_structural(task.sentence, theorem._theorem)
+                    if profiler is not None: profiler.count_cache('structural', cached)
 
                     if not cached:
                         if res:
@@ -503,6 +614,10 @@ class Reasoner:
                             # normalize the variable indices
                             task_derived.term._normalize_variables()
                             tasks_derived.append(task_derived)
+
+                if profiler is not None:
+                    profiler.count('tasks_derived.structural', len(tasks_derived) - n_derived)
+                    t0 = profiler.lap('inference.structural', t0)
         
 
         if is_valid \
@@ -520,6 +635,9 @@ class Reasoner:
                     
                     if not cached: 
                         results.extend(res)
+                    if profiler is not None:
+                        profiler.count_cache('compositional', cached)
+                        t0 = profiler.lap('inference.compositional', t0)
             
             # Temporal Projection and Eternalization
             if belief is not None:
@@ -534,6 +652,9 @@ class Reasoner:
 
             if not cached:
                 results.extend(res)
+            if profiler is not None:
+                profiler.count_cache('syllogistic', cached)
+                n_derived = len(tasks_derived)
 
             for term, truth in results:
 
@@ -577,10 +698,13 @@ class Reasoner:
                     if conclusion.is_predictive or conclusion.is_retrospective:
                         add_task(conclusion.temporal_swapped())
 
-            if term_link is not None:
-                for derived_task in tasks_derived: 
-                    reward: float = max(derived_task.budget.priority, task.achieving_level())
-                    term_link.reward_budget(reward)
+            for derived_task in tasks_derived: 
+                reward: float = max(derived_task.budget.priority, task.achieving_level())
+                term_link_valid.reward_budget(reward)
+
+            if profiler is not None:
+                profiler.count('tasks_derived.syllogistic', len(tasks_derived) - n_derived)
+                t0 = profiler.lap('inference.syllogistic', t0)
 
         # BACKWARD
         if is_valid \
@@ -592,6 +716,9 @@ class Reasoner:
 
             if not cached:
                 results.extend(res)
+            if profiler is not None:
+                profiler.count_cache('backward', cached)
+                n_derived = len(tasks_derived)
 
             for term, _ in results:
                 # budget = Budget_backward(truth, task_link.budget, term_link_valid.budget)
@@ -600,6 +727,10 @@ class Reasoner:
                 task_derived = Task(question_derived) #, budget)
                 tasks_derived.append(task_derived)
 
+            if profiler is not None:
+                profiler.count('tasks_derived.backward', len(tasks_derived) - n_derived)
+                t0 = profiler.lap('inference.backward', t0)
+
         if is_valid \
             and task.is_goal: # TODO: handle other cases
 
@@ -609,6 +740,9 @@ class Reasoner:
 
             if not cached:
                 results.extend(res)
+            if profiler is not None:
+                profiler.count_cache('backward', cached)
+                n_derived = len(tasks_derived)
 
             for term, truth in results:
                 # budget = Budget_backward(truth, task_link.budget, term_link_valid.budget)
@@ -627,9 +761,13 @@ class Reasoner:
                 task_derived = Task(goal_derived) #, budget)
                 tasks_derived.append(task_derived)
 
+            if profiler is not None:
+                profiler.count('tasks_derived.backward', len(tasks_derived) - n_derived)
+                t0 = profiler.lap('inference.backward', t0)
+
 
-        for term_link in term_links: 
-            concept.term_links.put_back(term_link)
+        if is_valid:
+            concept.term_links.put_back(term_link_valid)
         
         return list(filter(lambda t: t.is_question or t.truth.c > 0, tasks_derived))
     
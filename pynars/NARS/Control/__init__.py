@@ -1 +1,3 @@
-from .Reasoner import Reasoner
\ No newline at end of file
+from .Reasoner import Reasoner
+from .Profiler import CycleProfiler
+from .AsyncReasoner import AsyncReasoner
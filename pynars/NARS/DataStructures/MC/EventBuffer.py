@@ -4,7 +4,8 @@ from pynars.NARS import Reasoner
 from pynars.NARS.DataStructures.MC import Utils
 from pynars.NARS.DataStructures.MC.OutputBuffer import Reaction
 from pynars.NARS.DataStructures.MC.Utils import PriorityQueue, BufferTask, satisfaction_level, preprocessing
-from pynars.Narsese import Compound, Judgement, Task, Interval, parser, Term, Truth, Copula, Statement
+from pynars.Config import Config
+from pynars.Narsese import Compound, Judgement, Task, Interval, Term, Truth, Copula, Statement
 
 
 class Anticipation:
@@ -40,7 +41,7 @@ class PredictiveImplication:
         if truth.c < 0.3:
             return None, None
 
-        task = parser.parse(self.conclusion.word + ". " + str(truth))
+        task = Task.new_judgement(self.conclusion, truth)
 
         return self.interval, task
 
@@ -76,7 +77,7 @@ class EventBuffer:
         self.num_operations = num_operations
         self.slots = [Slot(num_events, num_anticipations, num_operations) for _ in range(1 + 2 * num_slot)]
         self.curr = num_slot
-        self.predictive_implications = PriorityQueue(num_predictive_implications)
+        self.predictive_implications = PriorityQueue(num_predictive_implications, identifier=lambda x: x.task.term)
         self.reactions = PriorityQueue(num_predictive_implications * 5)
         self.N = N
 
@@ -240,9 +241,8 @@ class EventBuffer:
 
         # update the predictive implications
         for each in prediction_award_penalty:
-            each[0].task = revision(each[0].task, parser.parse(each[0].task.term.word + ". %" + str(each[1]) + ";0.9%"))
-            self.predictive_implications.edit(each[0], each[0].task.truth.e * preprocessing(each[0].task, memory),
-                                              lambda x: x.task.term)
+            each[0].task = revision(each[0].task, Task.new_judgement(each[0].task.term, Truth(each[1], 0.9, Config.k)))
+            self.predictive_implications.edit(each[0], each[0].task.truth.e * preprocessing(each[0].task, memory))
 
     def predictive_implication_application(self, memory):
         """
@@ -255,7 +255,7 @@ class EventBuffer:
         while len(self.predictive_implications) != 0:
             implication, _ = self.predictive_implications.pop()
             applied = False
-            for each_event in self.slots[self.curr].events.pq:
+            for each_event in self.slots[self.curr].events:
                 if implication.condition == each_event[1].task.term:
                     interval, conclusion = implication.get_conclusion(each_event[1])
                     if interval is None:
@@ -284,7 +284,7 @@ class EventBuffer:
         reactions = []
         # ==============================================================================================================
 
-        for each in self.predictive_implications.pq:
+        for each in self.predictive_implications:
             if each[1].task.truth.f >= threshold_f and each[1].task.truth.c >= threshold_c:
                 if each[1].to_memory_cooldown <= 0:
                     memory.accept(each[1].task)
@@ -380,13 +380,9 @@ class EventBuffer:
                                                             each_curr_event.task)
                         # if tmp.task.truth.e * preprocessing(tmp.task, memory) <= 0.05:
                         #     continue
-                        existed = None
-                        for j in range(len(self.predictive_implications)):
-                            if self.predictive_implications.pq[j][1].task.term == tmp.task.term:
-                                existed = self.predictive_implications.pq.pop(j)
-                                break
+                        existed, _ = self.predictive_implications.take_by_key(tmp.task.term)
                         if existed is not None:
-                            tmp = self.prediction_revision(existed[1], tmp)
+                            tmp = self.prediction_revision(existed, tmp)
 
                         self.predictive_implications.push(tmp, tmp.task.truth.e * preprocessing(tmp.task, memory))
 
@@ -1,6 +1,6 @@
 from pynars.NARS.DataStructures.MC.EventBuffer import EventBuffer
 from pynars.NARS.DataStructures.MC.Utils import PriorityQueue
-from pynars.Narsese import parser
+from pynars.Narsese import Task, Operator
 
 
 class SensorimotorChannel:
@@ -111,11 +111,11 @@ class SensorimotorChannel:
             reaction_to_use, _ = self.reactions.pop()
             if inputs is not None:
                 for each_input in inputs:
-                    tmp = reaction_to_use.fire(each_input)
-                    if tmp is not None:
-                        self.operations[tmp]()
+                    operation = reaction_to_use.fire(each_input)
+                    if operation is not None:
+                        self.operations[str(operation)]()
                         has_operation = True
-                        inputs.append(tmp)
+                        inputs.append(Task.new_judgement(operation))
                     break
 
         # babbling
@@ -123,7 +123,7 @@ class SensorimotorChannel:
             operation_from_babbling = self.babbling()
             if operation_from_babbling is not None:
                 self.operations[operation_from_babbling]()
-                inputs.append(parser.parse(operation_from_babbling + "."))
+                inputs.append(Task.new_judgement(Operator(operation_from_babbling[1:])))
 
         print("input_from_environment", inputs)
 
@@ -1,58 +1,113 @@
 import random
+from bisect import bisect_left
 
 from pynars.NAL.Functions import Or
 
 
 class PriorityQueue:
     """
-    It is not a heap, it is a sorted array by insertion sort. Since we need to 1) access the largest item, 2) access the
-    smallest item, 3) access an item in the middle.
+    It is not a heap, it is a sorted array, since we need to 1) access the largest item, 2) access the smallest item,
+    3) access an item in the middle.
+
+    The values are kept in a sorted list of keys `(value, -n)`, where `n` counts the pushes, so that an item is found
+    by bisection, and the items are kept in a list in the same order. Among the items with the same value, the oldest
+    one is the highest. If an `identifier` is given, the keys of the items are also indexed by their identifiers, so
+    that an item is edited or taken out by its identifier without a linear scan.
     """
 
-    def __init__(self, size):
-        self.pq = []
+    def __init__(self, size, identifier=None):
         self.size = size
+        self.identifier = identifier
+        self._keys = []
+        self._items = []
+        self._index = {}  # identifier -> the keys of the items with this identifier
+        self._count = 0
 
     def __len__(self):
-        return len(self.pq)
+        return len(self._items)
+
+    def __iter__(self):
+        """
+        Iterate over the (value, item) pairs, from the lowest value to the highest.
+        """
+        return ((key[0], item) for key, item in zip(self._keys, self._items))
+
+    @property
+    def pq(self):
+        """
+        The (value, item) pairs, from the lowest value to the highest, as a new list.
+        """
+        return list(self)
+
+    def _insert(self, item, value):
+        self._count += 1
+        key = (value, -self._count)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._items.insert(i, item)
+        if self.identifier is not None:
+            self._index.setdefault(self.identifier(item), []).append(key)
+
+    def _remove_at(self, i):
+        key = self._keys.pop(i)
+        item = self._items.pop(i)
+        if self.identifier is not None:
+            identity = self.identifier(item)
+            keys = self._index[identity]
+            keys.remove(key)
+            if len(keys) == 0:
+                del self._index[identity]
+        return item, key[0]
 
     def push(self, item, value):
         """
         Add a new one, regardless whether there are duplicates.
+        If the queue is full, the lowest one is evicted, and returned.
+        """
+        self._insert(item, value)
+        if len(self._items) > self.size:
+            return self._remove_at(0)[0]
+        return None
+
+    def take_by_key(self, identity):
+        """
+        Take out the lowest item whose identifier is `identity`, and return it with its value.
+        It returns (None, None) if there is no such item.
+        """
+        keys = self._index.get(identity, None)
+        if keys is None:
+            return None, None
+        return self._remove_at(bisect_left(self._keys, min(keys)))
+
+    def edit(self, item, value, identifier=None):
         """
-        added = False
-        for i in range(len(self.pq)):
-            if value <= self.pq[i][0]:
-                self.pq = self.pq[:i] + [(value, item)] + self.pq[i:]
-                added = True
-                break
-        if not added:
-            self.pq = self.pq + [(value, item)]
-        if len(self.pq) > self.size:
-            self.pq = self.pq[1:]
-
-    def edit(self, item, value, identifier):
-        """
-        Replacement.
-        """
-        found = False
-        for i in range(len(self.pq)):
-            if identifier(self.pq[i][1]) == identifier(item):
-                self.pq.pop(i)
-                # self.pq = self.pq[:i - 1] + self.pq[i:]
-                found = True
-                break
-        if not found:
-            return
+        Replacement. The lowest item with the same identifier as `item` is replaced by `item` with the new value.
+        """
+        if identifier is None:
+            identifier = self.identifier
+        if identifier is self.identifier:
+            existed, _ = self.take_by_key(identifier(item))
+            if existed is None:
+                return
+        else:
+            identity = identifier(item)
+            i = next((i for i, each in enumerate(self._items) if identifier(each) == identity), None)
+            if i is None:
+                return
+            self._remove_at(i)
         self.push(item, value)
 
     def pop(self):
         """
         Pop the highest.
         """
-        value, item = self.pq[-1]
-        self.pq = self.pq[:-1]
-        return item, value
+        return self._remove_at(len(self._items) - 1)
+
+    def pop_min(self):
+        """
+        Pop the lowest.
+        """
+        return self._remove_at(0)
 
     def random_pop(self):
         """
@@ -63,11 +118,9 @@ class PriorityQueue:
 
         It only gives the item, not the value.
         """
-        for i in range(len(self.pq) - 1, -1, -1):
-            if random.random() < self.pq[i][0]:
-                ret = self.pq[i]
-                self.pq = self.pq[:i] + self.pq[i + 1:]
-                return ret[1]
+        for i in range(len(self._items) - 1, -1, -1):
+            if random.random() < self._keys[i][0]:
+                return self._remove_at(i)[0]
         return None
 
     def show(self, identifier):
@@ -75,8 +128,8 @@ class PriorityQueue:
         Show each item in the priority queue. Since it may contain items other than BufferTasks, you can design you own
         identifier to show what you want to show.
         """
-        for each in sorted(self.pq, key=lambda x: x[0]):
-            print(round(each[0], 3), "|", each[1].interval, "|", identifier(each[1]))
+        for value, item in self:
+            print(round(value, 3), "|", item.interval, "|", identifier(item))
         print("---")
 
 
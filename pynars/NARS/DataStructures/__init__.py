@@ -9,6 +9,7 @@ if True:
     from ._py.Channel import *
     from ._py.Concept import *
     from ._py.Memory import *
+    from ._py.SkeletonIndex import *
     from ._py.Link import *
     from ._py.Table import *
     from ._py.Link import *
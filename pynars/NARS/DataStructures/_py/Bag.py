@@ -3,19 +3,23 @@ import random
 import math
 from depq import DEPQ
 from pynars.Config import Config
-from pynars.Narsese import Item, Task
+from pynars.Narsese import Item, Task, Budget
 from pynars.NAL.Functions.BudgetFunctions import *
-from typing import Union, Callable, Any
+from typing import Union, Callable, Any, Iterator
 from .Distributor import Distributor
+from .Level import Level, levels
 
 
 class Bag:
-    # TODO: Re-implement this DataStructure, in order to optimize the complexity.
     class LUT:
         def __init__(self, key=None, *args, **kwargs):
             self.lut = OrderedDict(*args, **kwargs)
             self.key = key
 
+        def hash_key(self, key):
+            if self.key is not None: key = self.key(key)
+            return hash(key)
+
         def get(self, key, default = None):
             if self.key is not None: key = self.key(key)
             return self.lut.get(hash(key), default)
@@ -42,22 +46,28 @@ class Bag:
             self.lut.clear()
 
 
-    def __init__(self, capacity: int, n_buckets: int = None, take_in_order: bool = True, key: Callable[[Item], Any]=None) -> None:
+    def __init__(self, capacity: int, n_buckets: int = None, take_in_order: bool = True, key: Callable[[Item], Any]=None, engine: str = None) -> None:
         '''
         Args:
             capacity (int): the maximum number of items.
             n_buckets (int): the number of buckets.
             take_in_order (bool): if True, an item is taken out in order within a bucket, otherwise a random item is taken out.
+            key (Callable[[Item], Any]): the function mapping an item to its key in the look up table.
+            engine (str): the implementation of the buckets, `'indexed'` or `'list'` (see `Level.py`). If None, `Config.bag_engine` is used.
         '''
         self.capacity = capacity
         self.take_in_order = take_in_order
         self.item_lut = self.LUT(key=key)  # look up table
+        self.level_lut = dict() # the hash of the key of an item -> the index of the level containing the item
         self.n_levels = n_buckets if n_buckets is not None else Config.num_buckets
         self.pointer = self.n_levels - 1  # Pointing to the Bag's current bucket number
 
         self.distributor = Distributor.new(self.n_levels)
         
-        self.levels = tuple(list() for i in range(self.n_levels))  # initialize buckets between 0 and capacity
+        self.engine = engine if engine is not None else Config.bag_engine
+        Level = levels[self.engine]
+        self.levels = tuple(Level() for i in range(self.n_levels))  # initialize buckets between 0 and capacity
+        self._nonempty_levels = 0 # bit i is set iff the i-th level is not empty
 
         self.current_counter = 0
         self.level_index = capacity % self.n_levels
@@ -81,21 +91,23 @@ class Bag:
                 self.pointer = self.distributor.pick(self.level_index)
                 self.level_index = self.distributor.next(self.level_index)
 
+        level: Level = self.levels[self.pointer]
         if self.take_in_order:
             # take the first item from the current bucket
             idx = 0
+            if remove:
+                hash_key, item = level.pop_first()
+            else:
+                item = level.first()
         else:
             # take an item randomly from the current bucket
-            rnd = random.random()
-            cnt = len(self.levels[self.pointer])
-            idx = int(rnd * cnt)
+            if remove:
+                hash_key, item, idx = level.pop_sample()
+            else:
+                item, idx = level.sample()
 
         if remove:
-            bucket: list = self.levels[self.pointer]
-            item = bucket.pop(idx)
-            self.item_lut.pop(item)
-        else:
-            item = self.levels[self.pointer][idx]
+            self._forget(hash_key, self.pointer)
 
         self.current_counter = idx
 
@@ -103,11 +115,12 @@ class Bag:
 
     def take_by_key(self, key, remove = True) -> Union[Item, None]:
         if remove:
-            item: Item = self.item_lut.pop(key)
+            hash_key = self.item_lut.hash_key(key)
+            item: Item = self.item_lut.lut.get(hash_key, None)
             if item is not None:
-                bucket = self.levels[self.map_priority(item.budget.priority)]
-                if item in bucket:
-                    bucket.remove(item)
+                pointer = self.level_lut[hash_key]
+                self.levels[pointer].remove(hash_key, item)
+                self._forget(hash_key, pointer)
         else:
             item = self.item_lut.get(key, None)
         return item
@@ -118,10 +131,10 @@ class Bag:
             return None
         pointer = self._get_min_nonempty_level()
         if not remove:
-            item = self.levels[pointer][0]
+            item = self.levels[pointer].first()
         else:
-            item = self.levels[pointer].pop(0)
-            self.item_lut.pop(item)
+            hash_key, item = self.levels[pointer].pop_first()
+            self._forget(hash_key, pointer)
         return item
 
     def take_max(self, remove = True) -> Item:
@@ -129,23 +142,46 @@ class Bag:
         if len(self) == 0:
             return None
         pointer = self._get_max_nonempty_level()
-        item = self.levels[pointer][-1]
         if not remove:
-            item = self.levels[pointer][-1]
+            item = self.levels[pointer].last()
         else:
-            item = self.levels[pointer].pop()
-            self.item_lut.pop(item)
+            hash_key, item = self.levels[pointer].pop_last()
+            self._forget(hash_key, pointer)
         return item
 
+    def peek(self, n: int = None) -> Iterator[Item]:
+        '''
+        Iterate over the items in the order in which `take` would take them out one after the other (in order within each level), but without taking them out of the bag, so that they keep their positions.
+        The levels are visited by the distributor, which goes on from where it stopped, as it does in `take`.
+        At most `n` items are yielded if `n` is not None. The bag must not be modified during the iteration.
+        '''
+        if n is None: n = len(self)
+        levels = self._nonempty_levels
+        iterators = {}
+        while n > 0 and levels != 0:
+            pointer = self.distributor.pick(self.level_index)
+            self.level_index = self.distributor.next(self.level_index)
+            if not levels & (1 << pointer): continue
+            iterator = iterators.get(pointer, None)
+            if iterator is None: iterator = iterators[pointer] = iter(self.levels[pointer])
+            item = next(iterator, None)
+            if item is None:
+                levels &= ~(1 << pointer)
+                continue
+            yield item
+            n -= 1
+
     def put(self, item: Item, key=None):
         if key is None: 
             key = item
 
         item_popped = None
-        old_item: Item = self.take_by_key(key, remove=False)
+        hash_key = self.item_lut.hash_key(key)
+        old_item: Item = self.item_lut.lut.get(hash_key, None)
         if old_item is not None:
             # merge duplicate items
             Budget_merge(old_item.budget, item.budget)
+            self._relevel(hash_key, old_item)
             return item_popped
         pointer_new = self.map_priority(item.budget.priority)
 
@@ -153,21 +189,58 @@ class Bag:
             # if the capacity is exceeded, remove the lowest-priority item
             pointer = self._get_min_nonempty_level()
             if pointer_new >= pointer:
-                bucket = self.levels[self.pointer]
-                if len(bucket) > 0:
-                    item_lowest = bucket.pop(0)
-                    self.item_lut.pop(item_lowest)
-                    item_popped = item_lowest
+                hash_key_lowest, item_lowest = self.levels[pointer].pop_first()
+                self._forget(hash_key_lowest, pointer)
+                item_popped = item_lowest
             else:
                 item_popped = item
                 return item_popped
 
-        self.item_lut[key] = item
-        level: list = self.levels[pointer_new]
-        level.append(item)
+        self.item_lut.lut[hash_key] = item
+        self.level_lut[hash_key] = pointer_new
+        self.levels[pointer_new].append(hash_key, item)
+        self._nonempty_levels |= 1 << pointer_new
 
         return item_popped
 
+    def put_at(self, item: Item, pointer: int, key=None):
+        '''
+        Put an item at the end of the `pointer`-th level as it is, e.g. when a bag is restored from a snapshot (where the priority of an item may not map to the level it was in).
+        If there is no such level, if the bag is full or if the item is already there, it is put as by `put`.
+        '''
+        if key is None:
+            key = item
+        hash_key = self.item_lut.hash_key(key)
+        if pointer >= self.n_levels or len(self.item_lut) >= self.capacity or hash_key in self.item_lut.lut:
+            return self.put(item, key)
+        self.item_lut.lut[hash_key] = item
+        self.level_lut[hash_key] = pointer
+        self.levels[pointer].append(hash_key, item)
+        self._nonempty_levels |= 1 << pointer
+        return None
+
+    def update_budget(self, key, *fns: Callable[[Budget], Any]) -> Union[Item, None]:
+        '''
+        Update the budget of an item in place, by applying `fns` to it in turn, so that several updates are batched into a single bag operation.
+        The item is moved to another level only if the level its priority maps to has changed; otherwise it keeps its position in the level.
+
+        Returns:
+            the item updated, or None if there is no item with the key in the bag.
+        '''
+        hash_key = self.item_lut.hash_key(key)
+        item: Item = self.item_lut.lut.get(hash_key, None)
+        if item is None: return None
+        budget = item.budget
+        for fn in fns: fn(budget)
+        self._relevel(hash_key, item)
+        return item
+
+    def reprioritize(self, item: Item, priority: float, key=None) -> Union[Item, None]:
+        '''Set the priority of an item in the bag, see `update_budget`.'''
+        def set_priority(budget: Budget):
+            budget.priority = priority
+        return self.update_budget(key if key is not None else item, set_priority)
+
     def put_back(self, item: Item, key=None):
         ''''''
         # return putIn(oldItem);
@@ -196,6 +269,26 @@ class Bag:
     def __len__(self):
         return len(self.item_lut)
 
+    def _forget(self, hash_key, pointer: int):
+        '''Remove the bookkeeping of an item which has been removed from the `pointer`-th level.'''
+        del self.item_lut.lut[hash_key]
+        del self.level_lut[hash_key]
+        if len(self.levels[pointer]) == 0:
+            self._nonempty_levels &= ~(1 << pointer)
+
+    def _relevel(self, hash_key, item: Item):
+        '''Move an item to the level its priority maps to, if it is not there.'''
+        pointer_old = self.level_lut[hash_key]
+        pointer_new = self.map_priority(item.budget.priority)
+        if pointer_new == pointer_old: return
+        level_old: Level = self.levels[pointer_old]
+        level_old.remove(hash_key, item)
+        if len(level_old) == 0:
+            self._nonempty_levels &= ~(1 << pointer_old)
+        self.levels[pointer_new].append(hash_key, item)
+        self.level_lut[hash_key] = pointer_new
+        self._nonempty_levels |= 1 << pointer_new
+
     def _is_current_level_empty(self):
         return len(self.levels[self.pointer]) == 0
 
@@ -207,27 +300,18 @@ class Bag:
 
     def _move_to_max_nonempty_level(self):
         if len(self) == 0: return
-        self.pointer = self.n_levels - 1
-        while len(self.levels[self.pointer]) == 0:
-            self._move_down_to_next_level()
+        self.pointer = self._get_max_nonempty_level()
 
     def _get_min_nonempty_level(self):
-        pointer_cache = self.pointer
-        self._move_to_min_nonempty_level()
-        pointer = self.pointer
-        self.pointer = pointer_cache
-        return pointer
+        levels = self._nonempty_levels
+        return (levels & -levels).bit_length() - 1
 
     def _get_max_nonempty_level(self):
-        pointer_cache = self.pointer
-        self._move_to_max_nonempty_level()
-        pointer = self.pointer
-        self.pointer = pointer_cache
-        return pointer
+        return self._nonempty_levels.bit_length() - 1
 
     def _move_to_min_nonempty_level(self):
-        self.pointer = 0
-        self._move_to_next_nonempty_level()
+        if len(self) == 0: return
+        self.pointer = self._get_min_nonempty_level()
 
     def _move_down_to_next_level(self):
         self.pointer = (self.pointer - 1) % self.n_levels
@@ -237,9 +321,14 @@ class Bag:
 
     def reset(self):
         self.item_lut.clear()
+        self.level_lut.clear()
         for level in self.levels:
             level.clear()
-        self.pointer = 0
+        self._nonempty_levels = 0
+        self.pointer = self.n_levels - 1
+        self.current_counter = 0
+        self.level_index = self.capacity % self.n_levels
+        self.busyness = 0.5
 
 
     def __repr__(self) -> str:
@@ -4,7 +4,7 @@ from .Bag import Bag
 from pynars.Config import Config
 from pynars.Narsese import Item, Task, TermType, Compound, Interval, Statement
 from pynars.NAL.Functions.BudgetFunctions import *
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Set, Tuple
 
 
 class Buffer(Bag):
@@ -52,39 +52,101 @@ class EventBuffer:
         and compound events, e.g., (A &/ B).
 
         The operation for generating temporal statements is exhaustive. That means, for generating 3-component
-        implication statements like (A &/ B =/> C), the algorithm scales O(n^3) for n elements
+        implication statements like (A &/ B =/> C), the algorithm scales O(n^3) for n elements.
+        When a new event is given, only the combinations containing it are generated, which scales O(n^2).
 
         The oldest events are at the lowest index, the newest events are at the highest index.
         The larger the event's timestamp, the newer it is.
+
+        Args:
+            capacity (int): the maximum number of events in the buffer.
+            max_arity (int): 2 to generate only the compound events (A &/ B), 3 to generate the implications (A &/ B =/> C) as well.
+            max_combinations (int): the maximum number of combinations generated at once, the ones spanning the shortest time first. None for all of them.
     '''
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, max_arity: int=3, max_combinations: int=None):
         self.buffer: List[Task] = []
         self.capacity: int = capacity
+        self.max_arity = max_arity
+        self.max_combinations = max_combinations
+        # the combinations of events already generated, by the keys of their events, so that they are not generated again.
+        self._generated: Set[Tuple] = set()
 
     def __len__(self):
         return len(self.buffer)
 
+    def reset(self):
+        self.buffer.clear()
+        self._generated.clear()
+
     def get_oldest_event(self):
         return self.buffer[0]
 
     def get_newest_event(self):
         return self.buffer[-1]
 
-    def generate_temporal_sentences(self):
+    @staticmethod
+    def _key(event_task: Task):
+        return (event_task.term, event_task.stamp.t_occurrence)
+
+    def _combinations(self, index: int=None):
+        '''The tuples of indices `(i, j)` and `(i, j, k)`, with `i < j < k`, of the events to combine, which contain `index` if it is not None.'''
+        n = len(self.buffer)
+        triples = self.max_arity >= 3
+        if index is None:
+            for i in range(n):
+                for j in range(i+1, n):
+                    yield (i, j)
+                    if triples:
+                        for k in range(j+1, n): yield (i, j, k)
+            return
+        m = index
+        for i in range(m):
+            yield (i, m)
+        for j in range(m+1, n):
+            yield (m, j)
+        if triples:
+            for i in range(m):
+                for j in range(i+1, m): yield (i, j, m)
+                for k in range(m+1, n): yield (i, m, k)
+            for j in range(m+1, n):
+                for k in range(j+1, n): yield (m, j, k)
+
+    def generate_temporal_sentences(self, new_event_task: Task=None):
+        '''
+        Generate the compound events (A &/ B) and the temporal implications ((A &/ B) =/> C) of the events in the buffer, where A, B and C are in the order of their occurrences.
+
+        If `new_event_task` is given, only the combinations containing it are generated, i.e. the new ones after it has been put into the buffer; if it has not entered the buffer, nothing is generated.
+        A combination of events whose terms and occurrence times are the same as those of a combination generated before is not generated again, as long as its events are in the buffer.
+        '''
         results: List[Task] = []
-        # first event A occurred, then event B occurred, then event C
-        for i in range(len(self.buffer)):
-            event_A_task = self.buffer[i]
-            for j in range(i+1,len(self.buffer)):
+        if new_event_task is None:
+            index = None
+        else:
+            index = next((i for i in range(len(self.buffer)-1, -1, -1) if self.buffer[i] is new_event_task), None)
+            if index is None: return results
+
+        combinations = self._combinations(index)
+        if self.max_combinations is not None:
+            combinations = sorted(combinations, key=lambda combination: combination[-1] - combination[0])
+        compound_event_tasks = {}
+        for combination in combinations:
+            if self.max_combinations is not None and len(results) >= self.max_combinations: break
+            key = tuple(self._key(self.buffer[i]) for i in combination)
+            if key in self._generated: continue
+            self._generated.add(key)
+
+            # first event A occurred, then event B occurred, then event C
+            i, j = combination[:2]
+            compound_event_task = compound_event_tasks.get((i, j), None)
+            if compound_event_task is None:
                 # create (A &/ B)
-                event_B_task = self.buffer[j]
-                compound_event_task = induction_composition(event_A_task, event_B_task)
+                compound_event_task = compound_event_tasks[(i, j)] = induction_composition(self.buffer[i], self.buffer[j])
+            if len(combination) == 2:
                 results.append(compound_event_task) # append
-                for k in range(j + 1, len(self.buffer)):
-                    # create (A &/ B) =/> C
-                    event_C = self.buffer[k]
-                    temporal_implication_task = induction_implication(compound_event_task, event_C)
-                    results.append(temporal_implication_task)  # append
+            else:
+                # create (A &/ B) =/> C
+                temporal_implication_task = induction_implication(compound_event_task, self.buffer[combination[2]])
+                results.append(temporal_implication_task)  # append
 
         return results
 
@@ -113,7 +175,9 @@ class EventBuffer:
 
         if len(self.buffer) > self.capacity:
             # if too many events, take out the oldest event
-            self.buffer.pop(0)
+            key = self._key(self.buffer.pop(0))
+            if len(self._generated) > 0:
+                self._generated = {combination for combination in self._generated if key not in combination}
 
     def can_task_enter(self, task: Task):
        return task.is_event \
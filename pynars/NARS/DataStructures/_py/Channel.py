@@ -1,9 +1,12 @@
+import asyncio
+from time import perf_counter
 from pynars.Narsese import Sentence
 from .Buffer import Buffer
 from queue import Queue
 from pynars.Narsese import Task
 from pynars.Narsese import parser
 from pynars.utils.Print import print_out, PrintType
+from typing import Iterable, List, Tuple, Union
 
 class Channel(Buffer):
     ''''''
@@ -25,6 +28,63 @@ class NarseseChannel(Channel):
         
         task_overflow = Buffer.put(self, task)
         return True, task, task_overflow
-            
-            
-    
\ No newline at end of file
+
+    def put_lines(self, lines: Iterable[str]) -> List[Tuple[bool, Union[Task, None], Union[Task, None]]]:
+        '''
+        Put many lines at once, the blank lines, the comments and the numbers of cycles being skipped (see `LarkParser.parse_lines`).
+        Returns the same as `put` for each line of Narsese.
+        '''
+        results = []
+        for task in parser.parse_lines(lines):
+            if task is None:
+                results.append((False, None, None))
+                continue
+            task_overflow = Buffer.put(self, task)
+            results.append((True, task, task_overflow))
+        return results
+
+
+class AsyncChannel:
+    '''
+    An input channel fed by coroutines, e.g. those serving sockets, and drained by an `AsyncReasoner` between its cycles.
+
+    It is backed by an `asyncio.Queue` of bounded `capacity`: once it is full, `put` waits until the reasoner takes some items out (backpressure), and `put_nowait` raises `asyncio.QueueFull`. Hence, many producers can feed one reasoner without blocking its cycles, nor growing without bound.
+    The items are the tasks to put into `target`, the channel of the reasoner they are ingested into (see `AsyncReasoner.add_channel`). Each one is queued along with the time it was put, so that the latency of ingestion can be measured.
+    The queue is bound to the event loop it is first used in.
+    '''
+    def __init__(self, capacity: int, target: Channel=None) -> None:
+        self.capacity = capacity
+        self.target = target
+        self.queue = asyncio.Queue(capacity)
+
+    async def put(self, item):
+        await self.queue.put((item, perf_counter()))
+
+    def put_nowait(self, item):
+        self.queue.put_nowait((item, perf_counter()))
+
+    def take_nowait(self, n: int) -> List[Tuple[object, float]]:
+        '''Take at most `n` items, with the times they were put, without waiting. It is called from the event loop.'''
+        queue = self.queue
+        items = []
+        while len(items) < n and not queue.empty():
+            items.append(queue.get_nowait())
+        return items
+
+    def ingest(self, items: List[object]):
+        '''Put the items taken out into `target`. It is called from the thread running the cycles, within the context of the reasoner.'''
+        target = self.target
+        for item in items:
+            target.put(item)
+
+    def __len__(self):
+        return self.queue.qsize()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: #items={len(self)}, capacity={self.capacity}>'
+
+
+class AsyncNarseseChannel(AsyncChannel):
+    '''An `AsyncChannel` of lines of Narsese, which are parsed at once when they are ingested into a `NarseseChannel` (see `NarseseChannel.put_lines`), so the blank lines, the comments and the numbers of cycles are skipped.'''
+    def ingest(self, lines: List[str]):
+        self.target.put_lines(lines)
@@ -1,4 +1,4 @@
-from typing import Tuple, Type, List, Union
+from typing import Callable, Tuple, Type, List, Union
 
 from pynars.NAL.Functions import Or
 from pynars.NAL.Functions.Tools import calculate_solution_quality, distribute_budget_among_links
@@ -32,6 +32,9 @@ class Concept(Item):
 
     _subterms: List[Term]
 
+    # the tables and the bags of links, which a concept restored from a snapshot fills lazily, see `_restored`.
+    _contents = ('belief_table', 'desire_table', 'question_table', 'quest_table', 'executable_preconditions', 'general_executable_preconditions', 'term_links', 'task_links')
+
 
     def __init__(self, term: Term, budget: Budget, capacity_table: int=None) -> None:
         super().__init__(hash(term), budget)
@@ -60,6 +63,25 @@ class Concept(Item):
         # self._cache_subterms()
         # self.accept(task)
 
+    @classmethod
+    def _restored(cls, term: Term, budget: Budget, restore: Callable[['Concept'], None]) -> 'Concept':
+        '''
+        Make a concept restored from a snapshot (see `Snapshot.py`), without its tables and links. They are filled by `restore(concept)` when one of them is first accessed.
+        '''
+        concept = cls.__new__(cls)
+        Item.__init__(concept, hash(term), budget, copy_budget=False)
+        concept._term = term
+        concept._restore = restore
+        return concept
+
+    def __getattr__(self, name: str):
+        # only called for a missing attribute, i.e., the contents of a concept restored lazily, which are not filled yet.
+        if name not in Concept._contents: raise AttributeError(name)
+        restore = self.__dict__.pop('_restore', None)
+        if restore is None: raise AttributeError(name)
+        restore(self)
+        return getattr(self, name)
+
     @property
     def term(self) -> Term:
         return self._term
@@ -96,11 +118,7 @@ class Concept(Item):
         '''
         Select a belief with highest quality, within the belief_table, according to the task
         '''
-        belief_table: List[Task] = self.belief_table
-        if len(belief_table) == 0: return None
-        qualities = [(calculate_solution_quality(sentence, task.sentence), task) for task in belief_table]
-        _, item_max = max(qualities, key=lambda quality: quality[0])
-        return item_max
+        return self.belief_table.match(sentence)
         
     def add_belief(self, task: Task) -> Union[Judgement, None]:
         ''''''
@@ -114,11 +132,7 @@ class Concept(Item):
         '''
         Select a desire with highest quality, within the desire_table, according to the task
         '''
-        desire_table: List[Task] = self.desire_table
-        if len(desire_table) == 0: return None
-        qualities = [(calculate_solution_quality(goal, task.sentence), task) for task in desire_table]
-        _, item_max = max(qualities, key=lambda quality: quality[0])
-        return item_max
+        return self.desire_table.match(goal)
 
     def add_desire(self, task: Task) -> Union[Task, None]:
         ''''''
@@ -145,21 +159,35 @@ class Concept(Item):
             self._build_term_links(concepts, task, budget)
 
     def update_priority(self, p, concepts: Bag):
-        concepts.take_by_key(key=self,remove=True)
-        self.budget.priority = Or(self.budget.priority, p)
-        concepts.put(item=self)
+        self.update_budget(concepts, p=p)
 
     def update_durability(self, d, concepts: Bag):
-        concepts.take_by_key(key=self, remove=True)
-        self.budget.durability = (Config.concept_update_durability_weight * d
-                                + (1-Config.concept_update_durability_weight)*self.budget.durability)
-        concepts.put(item=self)
+        self.update_budget(concepts, d=d)
 
     def update_quality(self, q, concepts: Bag):
-        concepts.take_by_key(key=self, remove=True)
-        self.budget.quality = (Config.concept_update_quality_weight * q
-                                + (1-Config.concept_update_quality_weight)*self.budget.quality)
-        concepts.put(item=self)
+        self.update_budget(concepts, q=q)
+
+    def update_budget(self, concepts: Bag, p: float=None, d: float=None, q: float=None):
+        '''
+        Update the budget of the concept within the bag `concepts` by the given priority, durability and/or quality, as a single bag operation.
+        '''
+        def update(budget: Budget):
+            if p is not None:
+                budget.priority = Or(budget.priority, p)
+            if d is not None:
+                budget.durability = (Config.concept_update_durability_weight * d
+                                    + (1-Config.concept_update_durability_weight)*budget.durability)
+            if q is not None:
+                budget.quality = (Config.concept_update_quality_weight * q
+                                    + (1-Config.concept_update_quality_weight)*budget.quality)
+
+        if concepts.take_by_key(self, remove=False) is self:
+            concepts.update_budget(self, update)
+        else:
+            # the concept is not in the bag (or another instance is there), so put it in.
+            concepts.take_by_key(self, remove=True)
+            update(self.budget)
+            concepts.put(self)
     
     def _build_task_links(self, concepts: Bag, task: Task):
         ''''''
@@ -212,15 +240,13 @@ class Concept(Item):
     def _insert_task_link(self, task_link: TaskLink, concepts: Bag):
         self.task_links.put(task_link)
         # update the concept's budget using the link's budget
-        self.update_priority(task_link.budget.priority, concepts)
-        self.update_durability(task_link.budget.durability, concepts)
+        self.update_budget(concepts, p=task_link.budget.priority, d=task_link.budget.durability)
         # TODO: more handling. see OpenNARS 3.1.0 Concept.java line 318~366.
     
     def _insert_term_link(self, term_link: TermLink, concepts: Bag):
         self.term_links.put(term_link)
         # update the concept's budget using the link's budget
-        self.update_priority(term_link.budget.priority, concepts)
-        self.update_durability(term_link.budget.durability, concepts)
+        self.update_budget(concepts, p=term_link.budget.priority, d=term_link.budget.durability)
         # TODO: more handling. see OpenNARS 3.1.0 Concept.java line 318~366.
 
     @classmethod
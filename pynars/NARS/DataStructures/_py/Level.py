@@ -0,0 +1,184 @@
+from pynars import Global
+from typing import Any, Dict, Iterator, List, Tuple, Union
+from pynars.Narsese import Item
+
+
+class Level:
+    '''
+    A bucket of a `Bag`, backed by plain lists.
+    Removing an item from the front or the middle of the bucket is linear in the size of the bucket.
+
+    The key of each item is kept alongside, so that the `Bag` can forget an item by the key it was put with.
+    '''
+    __slots__ = ('_items', '_keys')
+
+    def __init__(self) -> None:
+        self._items: List[Item] = []
+        self._keys: List[Any] = []
+
+    def append(self, key, item: Item):
+        self._items.append(item)
+        self._keys.append(key)
+
+    def remove(self, key, item: Item) -> Union[Item, None]:
+        if item not in self._items: return None
+        idx = self._items.index(item)
+        self._keys.pop(idx)
+        return self._items.pop(idx)
+
+    def first(self) -> Item:
+        return self._items[0]
+
+    def last(self) -> Item:
+        return self._items[-1]
+
+    def pop_first(self) -> Tuple[Any, Item]:
+        return self._keys.pop(0), self._items.pop(0)
+
+    def pop_last(self) -> Tuple[Any, Item]:
+        return self._keys.pop(), self._items.pop()
+
+    def sample(self) -> Tuple[Item, int]:
+        '''Pick an item uniformly at random. Return the item and its position in the bucket.'''
+        idx = int(Global.random() * len(self._items))
+        return self._items[idx], idx
+
+    def pop_sample(self) -> Tuple[Any, Item, int]:
+        '''Remove an item picked uniformly at random. Return its key, the item and its position in the bucket.'''
+        idx = int(Global.random() * len(self._items))
+        return self._keys.pop(idx), self._items.pop(idx), idx
+
+    def clear(self):
+        self._items.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: #items={len(self)}>'
+
+
+class IndexedLevel:
+    '''
+    A bucket of a `Bag`, backed by a list of slots and an index from keys to slots.
+    A removed item leaves an empty slot (`None`) behind, and the slots are compacted once the empty ones outnumber the items, so that `append`, `remove`, `pop_first`, `pop_last`, `sample` and `pop_sample` are all O(1) amortized.
+    The insertion order is kept, thus taking items in order behaves the same as `Level`.
+
+    Invariant: if the bucket is not empty, both `_slots[_head]` and `_slots[-1]` hold items.
+    '''
+    __slots__ = ('_slots', '_keys', '_index', '_head', '_count')
+
+    def __init__(self) -> None:
+        self._slots: List[Union[Item, None]] = []
+        self._keys: List[int] = []
+        self._index: Dict[int, int] = {}
+        self._head = 0
+        self._count = 0
+
+    def append(self, key, item: Item):
+        self._index[key] = len(self._slots)
+        self._slots.append(item)
+        self._keys.append(key)
+        self._count += 1
+
+    def remove(self, key, item: Item = None) -> Union[Item, None]:
+        pos = self._index.get(key, None)
+        if pos is None: return None
+        return self._remove_at(pos)[1]
+
+    def first(self) -> Item:
+        return self._slots[self._head]
+
+    def last(self) -> Item:
+        return self._slots[-1]
+
+    def pop_first(self) -> Tuple[Any, Item]:
+        return self._remove_at(self._head)
+
+    def pop_last(self) -> Tuple[Any, Item]:
+        return self._remove_at(len(self._slots) - 1)
+
+    def sample(self) -> Tuple[Item, int]:
+        '''
+        Pick an item uniformly at random, by rejection sampling over the slots. Since at most half of the slots are empty, the expected number of trials is at most 2.
+        Return the item and its position relative to the first item, so that `0` means the first one.
+        '''
+        pos = self._sample_position()
+        return self._slots[pos], pos - self._head
+
+    def pop_sample(self) -> Tuple[Any, Item, int]:
+        pos = self._sample_position()
+        idx = pos - self._head
+        key, item = self._remove_at(pos)
+        return key, item, idx
+
+    def _sample_position(self) -> int:
+        slots = self._slots
+        head = self._head
+        n_slots = len(slots) - head
+        while True:
+            pos = head + int(Global.random() * n_slots)
+            if slots[pos] is not None: return pos
+
+    def clear(self):
+        self._slots.clear()
+        self._keys.clear()
+        self._index.clear()
+        self._head = 0
+        self._count = 0
+
+    def _remove_at(self, pos: int) -> Tuple[Any, Item]:
+        slots = self._slots
+        item = slots[pos]
+        key = self._keys[pos]
+        slots[pos] = None
+        del self._index[key]
+        self._count -= 1
+        if self._count == 0:
+            self.clear()
+            return key, item
+        # restore the invariant
+        if pos == self._head:
+            head = pos + 1
+            while slots[head] is None: head += 1
+            self._head = head
+        elif pos == len(slots) - 1:
+            while slots[-1] is None:
+                slots.pop()
+                self._keys.pop()
+        if len(slots) - self._count > self._count:
+            self._compact()
+        return key, item
+
+    def _compact(self):
+        keys = self._keys
+        slots = []
+        keys_kept = []
+        for pos in range(self._head, len(self._slots)):
+            item = self._slots[pos]
+            if item is None: continue
+            slots.append(item)
+            keys_kept.append(keys[pos])
+        self._slots = slots
+        self._keys = keys_kept
+        self._index = {key: pos for pos, key in enumerate(keys_kept)}
+        self._head = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Item]:
+        return (item for item in self._slots[self._head:] if item is not None)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: #items={len(self)}>'
+
+
+levels = {
+    'list': Level,
+    'indexed': IndexedLevel,
+}
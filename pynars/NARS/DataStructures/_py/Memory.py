@@ -1,3 +1,4 @@
+from collections import defaultdict
 from pynars import Global
 from pynars.Config import Enable, Config
 from pynars.NAL.Functions.BudgetFunctions import Budget_evaluate_goal_solution
@@ -9,11 +10,13 @@ from pynars.NAL.Inference.LocalRules import solution_query, solution_question
 from pynars.NAL.MetaLevelInference.VariableSubstitution import get_elimination__var_const
 from pynars.NARS.DataStructures._py.Link import TaskLink
 from pynars.NARS.GlobalEval import GlobalEval
-from pynars.Narsese import Statement, Budget, Task
+from pynars.Narsese import Statement, Budget, Task, Term
 from pynars.Narsese._py.Sentence import Goal, Question
 from pynars.Narsese._py.Task import Belief, Desire
 from .Bag import Bag
 from .Concept import Concept
+from .SkeletonIndex import SkeletonIndex
+from .Snapshot import save_memory, load_memory
 
 
 class Memory:
@@ -22,6 +25,17 @@ class Memory:
         self.concepts = Bag(capacity, n_buckets=n_buckets, take_in_order=take_in_order)
         # self.output_buffer = output_buffer
         self.global_eval = global_eval if global_eval is not None else GlobalEval()
+        # the pending queries (questions with query-variables), and the terms of the concepts with beliefs, indexed by their constant skeletons. See `SkeletonIndex`.
+        self.query_index = SkeletonIndex(2*capacity, self._is_pending)
+        self.belief_index = SkeletonIndex(2*capacity, self._has_concept)
+        self.query_fanout = defaultdict(int) # monotonic counters of the lookups in the two indexes, see `Profiler.py`
+
+    def _is_pending(self, query: Task):
+        concept: Concept = self.concepts.take_by_key(query.term, remove=False)
+        return concept is not None and query in concept.question_table
+
+    def _has_concept(self, term: Term):
+        return self.concepts.take_by_key(term, remove=False) is not None
 
     @property
     def busyness(self):
@@ -128,6 +142,7 @@ class Memory:
                 trySolution(judg, concept.desires.get(i), nal, true);
             }'''
             concept.add_belief(task)
+            self.belief_index.add(concept.term, concept.term)
 
             # try to solve questions
             answers[Question] = self._solve_judgement(task, concept)
@@ -146,6 +161,7 @@ class Memory:
         concept.question_table.add(task, 0.5)
 
         if task.is_query:
+            self.query_index.add(task, task.term)
             answers = self._solve_query(task, concept)
         else:
             answers = self._solve_question(task, concept)
@@ -317,19 +333,19 @@ class Memory:
                 for task_link in concept.task_links:
                     task_link.reward_budget(reward)
             if answer is not None: answers.append(answer)
-        # 2. try to solve wh-questions
-        sub_terms = belief_task.term.sub_terms
-        for sub_term in sub_terms:
-            concept_term: Concept = self.concepts.take_by_key(sub_term, remove=False)
-            if concept_term is None: continue
-            task_link: TaskLink
-            for task_link in concept_term.task_links:
-                query = task_link.target
-                if query is None: continue
-                if not query.is_query: continue
-                if not query.term.equal(belief_task.term): continue
-                answer = solution_query(query, belief_task)
-                if answer is not None: answers.append(answer)
+        # 2. try to solve wh-questions, among the pending queries with a compatible skeleton
+        fanout = self.query_fanout
+        fanout['judgements'] += 1
+        for query in self.query_index.candidates(belief_task.term):
+            fanout['candidate_queries'] += 1
+            if not self._is_pending(query):
+                self.query_index.remove(query)
+                fanout['dropped'] += 1
+                continue
+            if not query.term.equal(belief_task.term): continue
+            fanout['matched'] += 1
+            answer = solution_query(query, belief_task)
+            if answer is not None: answers.append(answer)
 
         return answers
 
@@ -356,23 +372,22 @@ class Memory:
         answers = []
         # 1. try to solve wh-questions
         if query.is_question:
-            sub_terms = query.term.sub_terms
-            for sub_term in sub_terms:
-                if sub_term.is_qvar: continue
-                concept_term: Concept = self.concepts.take_by_key(sub_term, remove=False)
-                if concept_term is None: continue
-                task_link: TaskLink
-                for task_link in concept_term.task_links:
-                    concept_target: Concept = self.concepts.take_by_key(task_link.target.term, False)
-                    if concept_target is None: continue
-                    if not query.term.equal(concept_target.term): continue
-                    subst = get_elimination__var_const(query.term, concept_target.term, [], [])
-                    if not subst.is_qvar_valid: continue
-                    # if not (concept_target.term.equal(query.term) and subst is not None): continue
-                    for belief in concept_target.belief_table:
-                        answer = solution_query(query, belief)
-                        if answer is not None: answers.append(answer)
-            pass
+            fanout = self.query_fanout
+            fanout['queries'] += 1
+            for term in self.belief_index.candidates(query.term):
+                fanout['candidate_beliefs'] += 1
+                concept_target: Concept = self.concepts.take_by_key(term, remove=False)
+                if concept_target is None:
+                    self.belief_index.remove(term)
+                    fanout['dropped'] += 1
+                    continue
+                if not query.term.equal(concept_target.term): continue
+                subst = get_elimination__var_const(query.term, concept_target.term, [], [])
+                if not subst.is_qvar_valid: continue
+                fanout['matched'] += 1
+                for belief in concept_target.belief_table:
+                    answer = solution_query(query, belief)
+                    if answer is not None: answers.append(answer)
         elif query.is_quest:
             pass
         else:
@@ -447,6 +462,21 @@ class Memory:
 
     def reset(self):
         self.concepts.reset()
+        self.query_index.reset()
+        self.belief_index.reset()
+
+    def save(self, path):
+        '''
+        Write a snapshot of the memory to `path`, along with the clock and the counter of input ids of the current context (see `pynars.Global`), and the global evaluations. See `Snapshot.py` for the format.
+        '''
+        save_memory(self, path)
+
+    def load(self, path):
+        '''
+        Replace the contents of the memory by the snapshot at `path` (see `save`), and restore the clock and the counter of input ids of the current context, and the global evaluations.
+        The tables and the links of a concept are only read from the snapshot when the concept is first accessed.
+        '''
+        load_memory(self, path)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: #items={len(self.concepts)}, #buckets={len(self.concepts.levels)}>"
@@ -0,0 +1,127 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple
+from pynars.Narsese import Term
+
+
+class SkeletonIndex:
+    '''
+    An index of items (e.g. the pending queries, or the terms of the concepts with beliefs), by the constant skeleton of their terms, used by `Memory` to find the queries which a judgement may answer, and the beliefs which may answer a query.
+
+    The skeleton of a statement is its copula, and its sides, where a side with variables is replaced by `None` as it may match anything. The sides of a commutative copula are unordered. The skeleton of a compound is its connector only. The atoms are not indexed.
+    The skeletons are also indexed by each of their sides, so that the items with a given side are found when the other side of the term looked up has variables.
+
+    `candidates(term)` returns the items whose skeletons are compatible with that of the term, i.e., a superset of those whose terms are `equal` to it, which should still be checked.
+
+    Once there are more than `capacity` items, those which are no longer alive (see `is_alive`) are dropped. The items still alive are never dropped: if most of them are, the index is let grow up to twice their number before it is shrunk again. Without `is_alive`, the oldest items are dropped instead, down to three quarters of the capacity. An item added again is made the latest one.
+    '''
+
+    def __init__(self, capacity: int=None, is_alive: Callable[[Hashable], bool]=None) -> None:
+        self.capacity = capacity
+        self.is_alive = is_alive
+        self._limit = capacity # the number of items beyond which the index is shrunk
+        self._groups: Dict[Any, Dict[Hashable, Dict[Hashable, None]]] = {} # head (copula or connector) -> skeleton -> items
+        self._sides: Dict[Any, Dict[Tuple, Dict[Hashable, None]]] = {} # head -> (position, side) -> skeletons
+        self._items: Dict[Hashable, Tuple[Any, Hashable]] = {} # item -> (head, skeleton), in the order of insertion
+
+    @staticmethod
+    def skeleton(term: Term) -> Tuple[Any, Hashable]:
+        '''Return the head of the term (its copula or connector, or `None` for an atom) and its skeleton.'''
+        if term.is_statement:
+            sides = (None if term.subject.has_var else term.subject, None if term.predicate.has_var else term.predicate)
+            return term.copula, (frozenset(sides) if term.is_commutative else sides)
+        elif term.is_compound:
+            return term.connector, None
+        else:
+            return None, None
+
+    @staticmethod
+    def _positions(skeleton: Hashable):
+        '''The sides of a skeleton, tagged by their positions: 'S' for the subject, 'P' for the predicate, or 'C' for either side of a commutative copula.'''
+        if skeleton is None: return ()
+        elif type(skeleton) is frozenset: return tuple(('C', side) for side in skeleton)
+        else: return (('S', skeleton[0]), ('P', skeleton[1]))
+
+    def add(self, item: Hashable, term: Term):
+        if item in self._items:
+            self._items[item] = self._items.pop(item)
+            return
+        head, skeleton = self.skeleton(term)
+        if head is None: return
+        group = self._groups.get(head, None)
+        if group is None:
+            group = self._groups[head] = {}
+            self._sides[head] = {}
+        items = group.get(skeleton, None)
+        if items is None:
+            items = group[skeleton] = {}
+            sides = self._sides[head]
+            for position in self._positions(skeleton):
+                skeletons = sides.get(position, None)
+                if skeletons is None: skeletons = sides[position] = {}
+                skeletons[skeleton] = None
+        items[item] = None
+        self._items[item] = (head, skeleton)
+
+        if self._limit is not None and len(self._items) > self._limit:
+            self.shrink()
+
+    def remove(self, item: Hashable):
+        head, skeleton = self._items.pop(item)
+        group = self._groups[head]
+        items = group[skeleton]
+        del items[item]
+        if len(items) > 0: return
+        del group[skeleton]
+        sides = self._sides[head]
+        for position in self._positions(skeleton):
+            skeletons = sides[position]
+            del skeletons[skeleton]
+            if len(skeletons) == 0: del sides[position]
+        if len(group) == 0:
+            del self._groups[head]
+            del self._sides[head]
+
+    def shrink(self):
+        if self.is_alive is not None:
+            for item in [item for item in self._items if not self.is_alive(item)]:
+                self.remove(item)
+            self._limit = max(self.capacity, 2*len(self._items))
+            return
+        n_kept = self.capacity*3//4
+        if len(self._items) > n_kept:
+            for item in list(self._items)[:len(self._items)-n_kept]:
+                self.remove(item)
+
+    def candidates(self, term: Term) -> List[Hashable]:
+        head, skeleton = self.skeleton(term)
+        group = self._groups.get(head, None)
+        if group is None: return []
+        positions = [position for position in self._positions(skeleton) if position[1] is not None]
+        if len(positions) == 0:
+            skeletons = group.keys()
+        elif len(positions) == 1:
+            # a side with variables matches any side: the skeletons are looked up by the other side.
+            sides = self._sides[head]
+            tag, side = positions[0]
+            skeletons = dict.fromkeys((*sides.get((tag, side), ()), *sides.get((tag, None), ())))
+        elif type(skeleton) is frozenset:
+            a, b = skeleton
+            skeletons = dict.fromkeys((skeleton, frozenset((a, None)), frozenset((b, None)), frozenset((None,))))
+        else:
+            s, p = skeleton
+            skeletons = ((s, p), (s, None), (None, p), (None, None))
+        return [item for skeleton in skeletons for item in group.get(skeleton, ())]
+
+    def reset(self):
+        self._limit = self.capacity
+        self._groups.clear()
+        self._sides.clear()
+        self._items.clear()
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterable[Hashable]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,472 @@
+'''
+Checkpoints of a `Memory`, in a compact and versioned binary format. See `Memory.save` and `Memory.load`.
+
+A snapshot keeps the concepts (with their budgets, tables, and task- and term-links), the tasks, sentences, stamps and evidential bases they refer to, the state of the bags, the pending queries and the beliefs indexed by the memory, as well as the clock, the counter of input ids and the global evaluations.
+Each object is written once, in a table, and referred to by its position in that table: the words are in a table of strings, and each term is a node whose components are earlier nodes.
+
+The file starts with `MAGIC`, the version and the byte order, followed by the sections, in this order: META, STRS, TERM, BASE, STMP, SENT, TASK, CNPT, LINK and MEMO.
+Each section is a header (its tag, the type code of its integers, and the numbers of integers, of floats and of bytes in it), then an array of integers, an array of floats (as doubles), and a blob of bytes. The sections are read one after the other into arrays.
+
+Loading is lazy: the concepts in the bag of the memory are made at once, with their terms and budgets, but their tables and links, and the tasks, sentences and terms these refer to, are only made when the concept is first accessed (see `Concept._restored`).
+'''
+import gc
+import os
+import sys
+from array import array
+from collections import deque
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from pynars import Global
+from pynars.Narsese import Budget, Compound, Connector, Copula, Interval, Statement, Task, Term, Truth, Variable, VarPrefix
+from pynars.Narsese._py.Evidence import Base
+from pynars.Narsese._py.Operation import Operator
+from pynars.Narsese._py.Sentence import Goal, Judgement, Punctuation, Quest, Question, Sentence, Stamp
+from .Bag import Bag
+from .Concept import Concept
+from .Link import Link, LinkType, TaskLink, TermLink
+from .Table import Table
+from pynars.Config import Config
+
+MAGIC = b'PYNARSMM'
+VERSION = 1
+
+_SECTIONS = (b'META', b'STRS', b'TERM', b'BASE', b'STMP', b'SENT', b'TASK', b'CNPT', b'LINK', b'MEMO')
+
+# the kinds of the nodes in the table of terms
+_ATOM, _OPERATOR, _INTERVAL, _VARIABLE, _STATEMENT, _COMPOUND = range(6)
+
+_punctuations = (Punctuation.Judgement, Punctuation.Question, Punctuation.Goal, Punctuation.Quest)
+_sentence_classes = (Judgement, Question, Goal, Quest)
+
+# the sizes of the records of fixed size
+_STAMP_INTS = 7
+_SENTENCE_INTS, _SENTENCE_FLOATS = 5, 3
+_TASK_INTS, _TASK_FLOATS = 6, 3
+_CONCEPT_INTS, _CONCEPT_FLOATS = 3, 3
+
+_TABLES = Concept._contents[:6]
+
+
+class Section:
+    '''The integers, floats and bytes of a section.'''
+    def __init__(self, ints=None, floats=None, blob: bytes=b'') -> None:
+        self.ints = ints if ints is not None else []
+        self.floats = floats if floats is not None else []
+        self.blob = blob
+
+    @staticmethod
+    def _header(tag: bytes, typecode: str, n_ints: int, n_floats: int, n_bytes: int) -> bytes:
+        return tag + typecode.encode() + n_ints.to_bytes(8, 'little') + n_floats.to_bytes(8, 'little') + n_bytes.to_bytes(8, 'little')
+
+    def write(self, f, tag: bytes):
+        try: ints = array('i', self.ints)
+        except OverflowError: ints = array('q', self.ints)
+        floats = array('d', self.floats)
+        f.write(self._header(tag, ints.typecode, len(ints), len(floats), len(self.blob)))
+        ints.tofile(f)
+        floats.tofile(f)
+        f.write(self.blob)
+
+    @classmethod
+    def read(cls, f, tag: bytes, byteswap: bool) -> 'Section':
+        header = f.read(29)
+        if len(header) < 29 or header[:4] != tag:
+            raise ValueError(f'Invalid snapshot: section {tag.decode()} expected.')
+        typecode = chr(header[4])
+        n_ints, n_floats, n_bytes = (int.from_bytes(header[i:i+8], 'little') for i in (5, 13, 21))
+        ints, floats = array(typecode), array('d')
+        ints.fromfile(f, n_ints)
+        floats.fromfile(f, n_floats)
+        if byteswap:
+            ints.byteswap()
+            floats.byteswap()
+        return cls(ints, floats, f.read(n_bytes))
+
+
+class Writer:
+    '''Collect the objects reachable from a memory into tables, and write them as the sections of a snapshot.'''
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        # for each kind of objects, the positions by the ids of the objects, and the objects (which are kept alive so that their ids are not reused)
+        self.terms: Dict[int, int] = {}
+        self._terms: List[Term] = []
+        self.bases: Dict[int, int] = {}
+        self._bases: List[Base] = []
+        self.stamps: Dict[int, int] = {}
+        self._stamps: List[Stamp] = []
+        self.sentences: Dict[int, int] = {}
+        self._sentences: List[Sentence] = []
+        self.tasks: Dict[int, int] = {}
+        self._tasks: List[Task] = []
+        self.concepts: Dict[int, int] = {}
+        self._concepts: List[Concept] = []
+        self.sections = {tag: Section() for tag in _SECTIONS}
+
+    def string(self, string: str) -> int:
+        idx = self.strings.get(string, None)
+        if idx is None: idx = self.strings[string] = len(self.strings)
+        return idx
+
+    def term(self, term: Term) -> int:
+        idx = self.terms.get(id(term), None)
+        if idx is not None: return idx
+        if term.is_statement:
+            record = (_STATEMENT, self.string(term.copula.value), self.term(term.subject), self.term(term.predicate))
+        elif term.is_compound:
+            components = [self.term(component) for component in term.terms]
+            record = (_COMPOUND, self.string(term.connector.value), len(components), *components)
+        elif term.is_var:
+            variables = term._vars_independent if term.is_ivar else term._vars_dependent if term.is_dvar else term._vars_query
+            record = (_VARIABLE, self.string(term.prefix.value), self.string(term.name), int(variables.indices[0]))
+        elif term.is_interval:
+            record = (_INTERVAL, term.interval)
+        elif type(term) is Operator:
+            record = (_OPERATOR, self.string(term.word), int(term.is_mental_operation))
+        elif type(term) is Term:
+            record = (_ATOM, self.string(term.word))
+        else:
+            raise TypeError(f'Cannot write the term {term!r} of type {type(term).__name__}.')
+        self.sections[b'TERM'].ints.extend(record)
+        idx = self.terms[id(term)] = len(self._terms)
+        self._terms.append(term)
+        return idx
+
+    @staticmethod
+    def _index(obj, positions: Dict[int, int], objects: list) -> int:
+        '''The position of an object in its table, where it is appended if it is not there yet (and written later).'''
+        if obj is None: return -1
+        idx = positions.get(id(obj), None)
+        if idx is None:
+            idx = positions[id(obj)] = len(objects)
+            objects.append(obj)
+        return idx
+
+    def base(self, base: Base) -> int:
+        if base is None: return -1
+        idx = self.bases.get(id(base), None)
+        if idx is None:
+            idx = self.bases[id(base)] = len(self._bases)
+            self._bases.append(base)
+            evidences = tuple(base)
+            self.sections[b'BASE'].ints.extend((len(evidences), *evidences))
+        return idx
+
+    def stamp(self, stamp: Stamp) -> int:
+        if stamp is None: return -1
+        idx = self.stamps.get(id(stamp), None)
+        if idx is None:
+            idx = self.stamps[id(stamp)] = len(self._stamps)
+            self._stamps.append(stamp)
+            ints = self.sections[b'STMP'].ints
+            for t in (stamp.t_creation, stamp.t_occurrence, stamp.t_put):
+                ints.extend((0, 0) if t is None else (1, t))
+            ints.append(self.base(stamp.evidential_base))
+        return idx
+
+    def sentence(self, sentence: Sentence) -> int:
+        return self._index(sentence, self.sentences, self._sentences)
+
+    def task(self, task: Task) -> int:
+        return self._index(task, self.tasks, self._tasks)
+
+    def concept(self, concept: Concept) -> int:
+        return self._index(concept, self.concepts, self._concepts)
+
+    def bag(self, bag: Bag, section: Section):
+        '''The state of a bag. Its items are written by the caller, level by level, in order.'''
+        section.ints.extend((bag.n_levels, bag.pointer, bag.level_index, bag.current_counter, len(bag)))
+        section.floats.append(bag.busyness)
+
+    def write_concept(self, concept: Concept):
+        section = self.sections[b'LINK']
+        ints, floats = section.ints, section.floats
+        self.sections[b'CNPT'].ints.extend((self.term(concept.term), len(ints), len(floats)))
+        self.sections[b'CNPT'].floats.extend(concept.budget)
+        for name in _TABLES:
+            table: Table = getattr(concept, name)
+            items = table.items()
+            ints.extend((-1 if table.capacity is None else table.capacity, len(items)))
+            ints.extend(self.task(task) for task, _ in items)
+            floats.extend(p for _, p in items)
+        for bag, is_task_link in ((concept.term_links, False), (concept.task_links, True)):
+            self.bag(bag, section)
+            for pointer, level in enumerate(bag.levels):
+                for link in level:
+                    link: Link
+                    target = self.task(link.target) if is_task_link else self.concept(link.target)
+                    link_type = -1 if link.type is None else link.type.value
+                    source_is_component = -1 if link.source_is_component is None else int(link.source_is_component)
+                    ints.extend((pointer, target, link_type, source_is_component, len(link.component_index), *link.component_index))
+                    floats.extend(link.budget)
+                    if is_task_link:
+                        ints.append(len(link.records))
+                        for record in link.records: ints.extend((self.term(record.term), record.time))
+
+    def write_task(self, task: Task):
+        solution = task.best_solution
+        if solution is None: kind, idx = 0, -1
+        elif isinstance(solution, Task): kind, idx = 1, self.task(solution)
+        else: kind, idx = 2, self.sentence(solution)
+        self.sections[b'TASK'].ints.extend((self.sentence(task.sentence), task.input_id, kind, idx, int(task.processed), int(task.immediate_rules_applied)))
+        self.sections[b'TASK'].floats.extend(task.budget)
+
+    def write_sentence(self, sentence: Sentence):
+        best_answer = getattr(sentence, 'best_answer', None)
+        best_solution = getattr(sentence, 'best_solution', None)
+        self.sections[b'SENT'].ints.extend((_punctuations.index(sentence.punct), self.term(sentence.term), self.stamp(sentence.stamp), self.sentence(best_answer), self.sentence(best_solution)))
+        self.sections[b'SENT'].floats.extend(sentence.truth if sentence.truth is not None else (0.0, 0.0, 0.0))
+
+    def write_memory(self, memory, context: Global.ReasonerContext):
+        meta = self.sections[b'META']
+        meta.ints.extend((context.time, context._input_id))
+        global_eval = memory.global_eval
+        meta.floats.extend((global_eval.S, global_eval.A, global_eval.B, global_eval.W))
+
+        memo = self.sections[b'MEMO']
+        self.bag(memory.concepts, memo)
+        for pointer, level in enumerate(memory.concepts.levels):
+            for concept in level: memo.ints.extend((pointer, self.concept(concept)))
+        queries = [self.task(task) for task in memory.query_index]
+        beliefs = [self.term(term) for term in memory.belief_index]
+        memo.ints.extend((len(queries), *queries, len(beliefs), *beliefs))
+
+        # the concepts refer to tasks and to other concepts, the tasks to sentences and other tasks, and the sentences to other sentences.
+        for objects, write in ((self._concepts, self.write_concept), (self._tasks, self.write_task), (self._sentences, self.write_sentence)):
+            i = 0
+            while i < len(objects):
+                write(objects[i])
+                i += 1
+
+        strings = ''.join(self.strings)
+        self.sections[b'STRS'] = Section([len(string) for string in self.strings], None, strings.encode('utf-8'))
+
+    def dump(self, path: Union[str, Path]):
+        path = Path(path)
+        path_tmp = path.with_name(path.name + '.tmp')
+        with open(path_tmp, 'wb') as f:
+            f.write(MAGIC + VERSION.to_bytes(2, 'little') + (b'<' if sys.byteorder == 'little' else b'>'))
+            for tag in _SECTIONS: self.sections[tag].write(f, tag)
+        os.replace(path_tmp, path)
+
+
+class Reader:
+    '''Read the sections of a snapshot, and make the objects in them on demand.'''
+    def __init__(self, path: Union[str, Path]) -> None:
+        with open(path, 'rb') as f:
+            header = f.read(len(MAGIC) + 3)
+            if header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f'Invalid snapshot: {path}')
+            version = int.from_bytes(header[len(MAGIC):len(MAGIC)+2], 'little')
+            if version != VERSION:
+                raise ValueError(f'Unsupported version {version} of snapshot (expected {VERSION}): {path}')
+            byteswap = header[-1:] != (b'<' if sys.byteorder == 'little' else b'>')
+            self.sections = {tag: Section.read(f, tag, byteswap) for tag in _SECTIONS}
+
+        strs = self.sections[b'STRS']
+        strings = strs.blob.decode('utf-8')
+        self.strings: List[str] = []
+        start = 0
+        for length in strs.ints:
+            self.strings.append(strings[start:start+length])
+            start += length
+        self._enums: Dict[Tuple[type, int], object] = {}
+
+        self._term_offsets = self._offsets(self.sections[b'TERM'].ints, self._term_size)
+        self._base_offsets = self._offsets(self.sections[b'BASE'].ints, lambda ints, i: ints[i] + 1)
+        self._terms: List[Term] = [None]*len(self._term_offsets)
+        self._bases: List[Base] = [None]*len(self._base_offsets)
+        self._stamps: List[Stamp] = [None]*(len(self.sections[b'STMP'].ints)//_STAMP_INTS)
+        self._sentences: List[Sentence] = [None]*(len(self.sections[b'SENT'].ints)//_SENTENCE_INTS)
+        self._tasks: List[Task] = [None]*(len(self.sections[b'TASK'].ints)//_TASK_INTS)
+        self._concepts: List[Concept] = [None]*(len(self.sections[b'CNPT'].ints)//_CONCEPT_INTS)
+
+    @staticmethod
+    def _term_size(ints, i: int) -> int:
+        kind = ints[i]
+        if kind == _COMPOUND: return 3 + ints[i+2]
+        return 3 if kind == _OPERATOR else 2 if kind in (_ATOM, _INTERVAL) else 4
+
+    @staticmethod
+    def _offsets(ints, size) -> List[int]:
+        offsets = []
+        i, n = 0, len(ints)
+        while i < n:
+            offsets.append(i)
+            i += size(ints, i)
+        return offsets
+
+    def _enum(self, cls, idx: int):
+        value = self._enums.get((cls, idx), None)
+        if value is None: value = self._enums[(cls, idx)] = cls(self.strings[idx])
+        return value
+
+    def term(self, idx: int) -> Term:
+        term = self._terms[idx]
+        if term is not None: return term
+        ints = self.sections[b'TERM'].ints
+        i = self._term_offsets[idx]
+        kind = ints[i]
+        if kind == _STATEMENT:
+            term = Statement(self.term(ints[i+2]), self._enum(Copula, ints[i+1]), self.term(ints[i+3]))
+        elif kind == _COMPOUND:
+            term = Compound(self._enum(Connector, ints[i+1]), *(self.term(j) for j in ints[i+3:i+3+ints[i+2]]))
+        elif kind == _VARIABLE:
+            term = Variable(self._enum(VarPrefix, ints[i+1]), self.strings[ints[i+2]], ints[i+3])
+        elif kind == _INTERVAL:
+            term = Interval(ints[i+1])
+        elif kind == _OPERATOR:
+            term = Operator(self.strings[ints[i+1]], is_mental_operation=bool(ints[i+2]))
+        else:
+            term = Term(self.strings[ints[i+1]])
+        self._terms[idx] = term
+        return term
+
+    def base(self, idx: int) -> Base:
+        if idx < 0: return None
+        base = self._bases[idx]
+        if base is None:
+            ints = self.sections[b'BASE'].ints
+            i = self._base_offsets[idx]
+            base = self._bases[idx] = Base._new(tuple(ints[i+1:i+1+ints[i]]))
+        return base
+
+    def stamp(self, idx: int) -> Stamp:
+        if idx < 0: return None
+        stamp = self._stamps[idx]
+        if stamp is None:
+            i = idx*_STAMP_INTS
+            r = self.sections[b'STMP'].ints[i:i+_STAMP_INTS]
+            stamp = self._stamps[idx] = Stamp(r[1] if r[0] else None, r[3] if r[2] else None, r[5] if r[4] else None, self.base(r[6]))
+        return stamp
+
+    def sentence(self, idx: int) -> Sentence:
+        if idx < 0: return None
+        sentence = self._sentences[idx]
+        if sentence is not None: return sentence
+        i, j = idx*_SENTENCE_INTS, idx*_SENTENCE_FLOATS
+        punct, term, stamp, best_answer, best_solution = self.sections[b'SENT'].ints[i:i+_SENTENCE_INTS]
+        cls = _sentence_classes[punct]
+        if cls is Judgement or cls is Goal:
+            sentence = cls(self.term(term), self.stamp(stamp), Truth(*self.sections[b'SENT'].floats[j:j+_SENTENCE_FLOATS]))
+        else:
+            sentence = cls(self.term(term), self.stamp(stamp))
+        self._sentences[idx] = sentence
+        # the sentences referred to are made once this one is in the table, so that cycles end.
+        if best_answer >= 0: sentence.best_answer = self.sentence(best_answer)
+        if best_solution >= 0: sentence.best_solution = self.sentence(best_solution)
+        return sentence
+
+    def task(self, idx: int) -> Task:
+        task = self._tasks[idx]
+        if task is not None: return task
+        i, j = idx*_TASK_INTS, idx*_TASK_FLOATS
+        sentence, input_id, kind, solution, processed, immediate_rules_applied = self.sections[b'TASK'].ints[i:i+_TASK_INTS]
+        task = self._tasks[idx] = Task(self.sentence(sentence), input_id=input_id)
+        task.budget = Budget(*self.sections[b'TASK'].floats[j:j+_TASK_FLOATS])
+        task.processed = bool(processed)
+        task.immediate_rules_applied = bool(immediate_rules_applied)
+        if kind == 1: task.best_solution = self.task(solution)
+        elif kind == 2: task.best_solution = self.sentence(solution)
+        return task
+
+    def concept(self, idx: int) -> Concept:
+        concept = self._concepts[idx]
+        if concept is None:
+            i, j = idx*_CONCEPT_INTS, idx*_CONCEPT_FLOATS
+            cnpt = self.sections[b'CNPT']
+            budget = Budget(*cnpt.floats[j:j+_CONCEPT_FLOATS])
+            concept = self._concepts[idx] = Concept._restored(self.term(cnpt.ints[i]), budget, partial(self.fill_concept, idx))
+        return concept
+
+    @staticmethod
+    def restore_bag(bag: Bag, state, busyness: float):
+        n_levels, pointer, level_index, current_counter = state
+        if n_levels != bag.n_levels: return
+        bag.pointer, bag.level_index, bag.current_counter = pointer, level_index, current_counter
+        bag.busyness = busyness
+
+    def fill_concept(self, idx: int, concept: Concept):
+        '''Make the tables and the links of a concept.'''
+        section = self.sections[b'LINK']
+        ints, floats = section.ints, section.floats
+        cnpt = self.sections[b'CNPT'].ints
+        i, j = cnpt[idx*_CONCEPT_INTS+1], cnpt[idx*_CONCEPT_INTS+2]
+        for name in _TABLES:
+            capacity, n = ints[i], ints[i+1]
+            table = Table(None if capacity < 0 else capacity)
+            for k in range(n): table.add(self.task(ints[i+2+k]), floats[j+k])
+            setattr(concept, name, table)
+            i, j = i + 2 + n, j + n
+        for name, cls, capacity, n_levels in (('term_links', TermLink, Config.capacity_term_link, Config.nlevels_term_link), ('task_links', TaskLink, Config.capacity_task_link, Config.nlevels_task_link)):
+            bag = Bag(capacity, n_levels)
+            state, n = ints[i:i+4], ints[i+4]
+            busyness = floats[j]
+            i, j = i + 5, j + 1
+            for _ in range(n):
+                pointer, target, link_type, source_is_component, n_index = ints[i:i+5]
+                index = tuple(ints[i+5:i+5+n_index])
+                i += 5 + n_index
+                # the links are not made by their constructors, which would work their types out again.
+                link = cls.__new__(cls)
+                link.source = concept
+                link.target = self.task(target) if cls is TaskLink else self.concept(target)
+                link.component_index = index
+                link.link_id = Link.link_id
+                Link.link_id += 1
+                link._hash_value = hash((concept, link.target, index))
+                link.budget = Budget(*floats[j:j+3])
+                j += 3
+                link.type = None if link_type < 0 else LinkType(link_type)
+                link.source_is_component = None if source_is_component < 0 else bool(source_is_component)
+                if cls is TaskLink:
+                    n_records = ints[i]
+                    link.records = deque(TaskLink.Recording(self.term(ints[k]), ints[k+1]) for k in range(i+1, i+1+2*n_records, 2))
+                    i += 1 + 2*n_records
+                bag.put_at(link, pointer)
+            self.restore_bag(bag, state, busyness)
+            setattr(concept, name, bag)
+
+    def load_memory(self, memory, context: Global.ReasonerContext):
+        meta = self.sections[b'META']
+        context.time, context._input_id = meta.ints
+        global_eval = memory.global_eval
+        global_eval.S, global_eval.A, global_eval.B, global_eval.W = meta.floats
+
+        memory.reset()
+        memo = self.sections[b'MEMO']
+        ints = memo.ints
+        bag: Bag = memory.concepts
+        state, n = ints[0:4], ints[4]
+        i = 5
+        for k in range(i, i+2*n, 2): bag.put_at(self.concept(ints[k+1]), ints[k])
+        self.restore_bag(bag, state, memo.floats[0])
+        i += 2*n
+        n = ints[i]
+        for k in ints[i+1:i+1+n]:
+            task = self.task(k)
+            memory.query_index.add(task, task.term)
+        i += 1 + n
+        n = ints[i]
+        for k in ints[i+1:i+1+n]:
+            term = self.term(k)
+            memory.belief_index.add(term, term)
+
+
+def save_memory(memory, path: Union[str, Path], context: Global.ReasonerContext=None):
+    '''Write a snapshot of `memory`, and of the clock and the counter of input ids of `context` (by default, the current one), to `path`.'''
+    writer = Writer()
+    writer.write_memory(memory, context if context is not None else Global.current_context())
+    writer.dump(path)
+
+
+def load_memory(memory, path: Union[str, Path], context: Global.ReasonerContext=None):
+    '''Replace the contents of `memory`, and the clock and the counter of input ids of `context` (by default, the current one), by those in the snapshot at `path`.'''
+    reader = Reader(path)
+    # the objects made in bulk are not garbage, so the collector is paused meanwhile, as its passes over a large heap would dominate.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try: reader.load_memory(memory, context if context is not None else Global.current_context())
+    finally:
+        if gc_enabled: gc.enable()
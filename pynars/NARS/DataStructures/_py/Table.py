@@ -1,53 +1,92 @@
-from typing import Union
-from depq import DEPQ
-from pynars.Narsese import Task, Belief
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Union
+from pynars.NAL.Functions.Tools import calculate_solution_quality, calculate_solution_qualities
+from pynars.Narsese import Task, Belief, Sentence
 
 class Table:
     '''
     Used for belief table, desire table, etc., in the `Concept`.
+
+    The tasks are kept in a list sorted by descending priority, and a task added with the same priority as some others is put after them. Once the capacity is exceeded, the last task is dropped.
+    The priority of each task is indexed by the task, so that the membership test is O(1), and a task is located by a binary search over the priorities.
     '''
+    vectorized: bool = True # whether `match` scores the tasks with NumPy arrays, once there are at least `vectorized_min_size` tasks.
+    vectorized_min_size: int = 32
+
     def __init__(self, capacity):
-        self._table = DEPQ(maxlen=capacity)
+        self.capacity = capacity
+        self._tasks: List[Task] = []
+        self._priorities: List[float] = [] # the opposites of the priorities, in ascending order, so that `bisect` can be used.
+        self._index: Dict[Task, float] = {}
 
     def add(self, task: Task, p: float):
-        if task in self:
-            self._table.remove(task)
-        self._table.insert(task, p)
+        if task in self._index:
+            self._remove(task)
+        pos = bisect_right(self._priorities, -p)
+        self._priorities.insert(pos, -p)
+        self._tasks.insert(pos, task)
+        self._index[task] = p
+
+        if self.capacity is not None and len(self._tasks) > self.capacity:
+            self._priorities.pop()
+            del self._index[self._tasks.pop()]
 
+    def _remove(self, task: Task):
+        p = -self._index.pop(task)
+        tasks = self._tasks
+        for pos in range(bisect_left(self._priorities, p), bisect_right(self._priorities, p)):
+            if tasks[pos] == task:
+                del tasks[pos]
+                del self._priorities[pos]
+                return
 
     # def remove(self, task: Task):
     #     self._table.elim(task)
 
+    def match(self, sentence: Sentence, rate_by_confidence: bool=True) -> Union[Task, None]:
+        '''
+        Select the task whose sentence is the best solution to `sentence`, according to `calculate_solution_quality`. If several ones are the best, the first one is selected.
+        '''
+        tasks = self._tasks
+        if len(tasks) == 0: return None
+        if self.vectorized and len(tasks) >= self.vectorized_min_size:
+            qualities = calculate_solution_qualities(sentence, [task.sentence for task in tasks], rate_by_confidence)
+            return tasks[int(qualities.argmax())]
+        return max(tasks, key=lambda task: calculate_solution_quality(sentence, task.sentence, rate_by_confidence))
+
     @property
     def empty(self):
-        return self._table.is_empty()
-    
+        return len(self._tasks) == 0
+
     def first(self):
-        return self._table.first() if len(self._table) > 0 else None
-    
+        return self._tasks[0] if len(self._tasks) > 0 else None
+
     def last(self):
-        return self._table.last() if len(self._table) > 0 else None
+        return self._tasks[-1] if len(self._tasks) > 0 else None
 
     def __iter__(self):
-        return (value for value, _ in self._table)
-    
+        return iter(self._tasks)
+
+    def __contains__(self, task: Task):
+        return task in self._index
+
     def values(self):
-        return tuple(iter(self))
-    
+        return tuple(self._tasks)
+
     def items(self):
-        return tuple(iter(self._table))
+        return tuple((task, -p) for task, p in zip(self._tasks, self._priorities))
 
     def keys(self):
-        return tuple(key for _, key in self._table)
+        return tuple(-p for p in self._priorities)
 
     def __getitem__(self, idx: int) -> Union[Task, Belief]:
-        return self._table[idx][0]
+        return self._tasks[idx]
 
     def __len__(self):
-        return len(self._table)
+        return len(self._tasks)
 
     def __str__(self):
-        return f'<Table: #items={len(self._table)}, capacity={self._table.maxlen}>'
+        return f'<Table: #items={len(self._tasks)}, capacity={self.capacity}>'
 
     def __repr__(self):
-        return str(self)
\ No newline at end of file
+        return str(self)
@@ -18,6 +18,9 @@ class GlobalEval:
     def __init__(self) -> None:
         pass
 
+    def reset(self):
+        self.S, self.A, self.B, self.W = GlobalEval.S, GlobalEval.A, GlobalEval.B, GlobalEval.W
+
     def update_satisfaction(self, s, p):
         ''''''
         r = GlobalEval.r * p
@@ -1,7 +1,7 @@
 from collections import OrderedDict
 from pynars.NARS.DataStructures import LinkType, TaskLink, TermLink
 from pynars.Narsese._py import SELF
-from sparse_lut import SparseLUT
+from pynars.utils.SparseLUT import SparseLUT
 from pynars import Global
 from ....RuleMap.add_rule import *
 
@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from pynars.NARS.DataStructures import LinkType, TaskLink, TermLink
-from sparse_lut import SparseLUT
+from pynars.utils.SparseLUT import SparseLUT
 from pynars import Global
 from ....RuleMap.add_rule import *
 from pynars.NARS.Operation import *
@@ -1,64 +1,93 @@
 from .util import *
+from pynars.Config import Config
 
 class KanrenEngine:
-    
-    def __init__(self):
-        
-        with open(f'{Path(__file__).parent}/nal-rules.yml', 'r') as file:
-            config = yaml.safe_load(file)
+    # whether to try only the candidate rules selected by `RuleIndex`, rather than all the rules
+    rule_index_enabled = True
 
-        nal1_rules = split_rules(config['rules']['nal1'])
-        nal2_rules = split_rules(config['rules']['nal2'])
-        nal3_rules = split_rules(config['rules']['nal3'])
+    # whether to apply the rules by matchers compiled from them (see `compile_rule`), rather than by the miniKanren solver, whenever they can decide
+    compiled_rules_enabled = False
 
-        nal5_rules = split_rules(config['rules']['nal5'])
+    # the rules compiled from `nal-rules.yml`, shared by all the engines, and the hash of the file they were compiled from
+    _rules: dict = None
+    _rules_digest: str = None
+    path_rules = Path(__file__).parent/'nal-rules.yml'
+    path_rules_cache = Path(__file__).parent/'nal-rules.pkl'
 
-        conditional_syllogistic = split_rules(config['rules']['conditional_syllogistic'])
-
-        higher_order = []
-        
-        # NAL5 includes higher order variants of NAL1-3 rules
-        for rule in (nal1_rules + nal2_rules):
-            # replace --> with ==> in NAL1 & NAL2
-            rule = rule.replace('-->', '==>')
-            # replace <-> with <=> in NAL2
-            rule = rule.replace('<->', '<=>')
-
-            higher_order.append(rule)
-
-        # save subset for backward inference
-        self.rules_backward = [convert(r, True) for r in nal1_rules + nal2_rules 
-                               + higher_order 
-                               + conditional_syllogistic
-                               ]
-        
-        for rule in nal3_rules:
-            # replace --> with ==> and <-> with <=> in NAL3 (except difference)
-            if '(-,' not in rule and '(~,' not in rule:
-                rule = rule.replace('-->', '==>')
-                rule = rule.replace('<->', '<=>')
-                
-                # replace | with || in NAL3 (except difference)
-                if '||' not in rule:
-                    parts = rule.split(' |- ')
-                    parts = (part.replace('|', '||') for part in parts)
-                    rule = ' |- '.join(parts)
-                
-                # replace & with && in NAL3 (except difference)
-                if '&&' not in rule:
-                    rule = rule.replace('&', '&&')
-                
-                higher_order.append(rule)
+    # the methods memoized by `cache_notify`
+    cached_methods = ('backward', 'inference', 'inference_immediate', 'inference_structural', 'inference_compositional')
+    
+    def __init__(self):
         
-        rules = nal1_rules + nal2_rules + nal3_rules + nal5_rules + higher_order + conditional_syllogistic
-
-        self.rules_syllogistic = [convert(r) for r in rules]
-
-        self.rules_immediate = [convert_immediate(r) for r in split_rules(config['rules']['immediate'])]
-
-        self.rules_conditional_compositional = [convert(r, True) for r in split_rules(config['rules']['conditional_compositional'])]
-
-        self.theorems = [convert_theorems(t) for t in split_rules(config['theorems'])]
+        self.caches = {name: InferenceCache(Config.inference_cache_size, Config.inference_cache_ttl) for name in self.cached_methods}
+
+        rules = self.load_rules()
+        self.rules_backward = rules['backward']
+        self.rules_syllogistic = rules['syllogistic']
+        self.rules_immediate = rules['immediate']
+        self.rules_conditional_compositional = rules['conditional_compositional']
+        self.theorems = rules['theorems']
+
+        # rule indices, keyed on the patterns which the premises are unified with in `apply`
+        self.index_backward = RuleIndex(self.rules_backward, lambda rule: (rule[0][0], rule[0][2]))
+        self.index_syllogistic = RuleIndex(self.rules_syllogistic, lambda rule: rule[0][:2])
+        self.index_immediate = RuleIndex(self.rules_immediate, lambda rule: rule[0][:1])
+        self.index_immediate_backward = RuleIndex(self.rules_immediate, lambda rule: rule[0][1:])
+        self.index_compositional = RuleIndex(self.rules_conditional_compositional, lambda rule: rule[0][:2])
+
+        # (id(rule), backward) -> the compiled rule
+        self.compiled_rules = {}
+
+        # the number of calls and of rules tried, of each method
+        self.rule_calls = defaultdict(int)
+        self.rules_tried = defaultdict(int)
+
+    def compiled_rule(self, rule, backward=False):
+        key = (id(rule), backward)
+        compiled = self.compiled_rules.get(key, None)
+        if compiled is None:
+            if len(rule[0]) == 3:
+                (p1, p2, c) = rule[0]
+                patterns, target = ((p1, c), p2) if backward else ((p1, p2), c)
+            else:
+                (p, c) = rule[0]
+                patterns, target = ((c,), p) if backward else ((p,), c)
+            rule_vars = set()
+            for pattern in (*patterns, target): variables(pattern, rule_vars)
+            compiled = compile_rule(patterns, target, distinct_pairs(rule_vars))
+            self.compiled_rules[key] = compiled
+        return compiled
+
+    def candidate_rules(self, index: RuleIndex, name: str, *premises):
+        rules = index.select(*premises) if self.rule_index_enabled else index.rules
+        self.rule_calls[name] += 1
+        self.rules_tried[name] += len(rules)
+        return rules
+
+    @classmethod
+    def load_rules(cls) -> dict:
+        '''
+        Load the compiled rules, which are shared by all the engines in the process and cached on disk (see `util.load_rules`). They are compiled again once `nal-rules.yml` changes.
+        '''
+        if cls._rules is not None:
+            digest = hashlib.sha256(cls.path_rules.read_bytes()).hexdigest()
+            if digest == cls._rules_digest: return cls._rules
+        cls._rules, cls._rules_digest = load_rules(cls.path_rules, cls.path_rules_cache)
+        return cls._rules
+
+    def cache_info(self):
+        '''
+        Returns:
+            Dict[str, CacheInfo]: the hits, misses, evictions, and sizes of the cache of each memoized method.
+        '''
+        return {name: cache.info() for name, cache in self.caches.items()}
+
+    def cache_hit_rates(self):
+        return {name: cache.hit_rate for name, cache in self.caches.items()}
+
+    def cache_clear(self):
+        for cache in self.caches.values():
+            cache.clear()
 
 
     #################################################
@@ -70,7 +99,7 @@ class KanrenEngine:
         lq = logic(q.term)
         lt = logic(t.term)
 
-        for rule in self.rules_backward:
+        for rule in self.candidate_rules(self.index_backward, 'backward', lt, lq):
             res = self.apply(rule, lt, lq, backward=True)
             if res is not None:
                 # TODO: what is a better way of handling this?
@@ -114,7 +143,7 @@ class KanrenEngine:
 
         # temporal = t1.tense is not Tense.Eternal and t2.tense is not Tense.Eternal
 
-        for rule in self.rules_syllogistic:
+        for rule in self.candidate_rules(self.index_syllogistic, 'inference', l1, l2):
         
             # if temporal:
             #     c = term(rule[0][2])
@@ -165,7 +194,10 @@ class KanrenEngine:
         # print("\nRULE:", rule)
         (p1, p2, c), (r, constraints) = rule[0], rule[1]
 
-        if backward:
+        result = self.compiled_rule(rule, backward)(l1, l2) if self.compiled_rules_enabled else UNDECIDED
+        if result is not UNDECIDED:
+            result = (result,) if result is not None else ()
+        elif backward:
             result = run(1, p2, eq((p1, c), (l1, l2)), *constraints)
         else:
             result = run(1, c, eq((p1, p2), (l1, l2)), *constraints)
@@ -206,10 +238,14 @@ class KanrenEngine:
         results = []
 
         l = logic(t.term)
-        for rule in self.rules_immediate:
+        index = self.index_immediate_backward if backward else self.index_immediate
+        for rule in self.candidate_rules(index, 'inference_immediate', l):
             (p, c), (r, constraints) = rule[0], rule[1]
 
-            if backward:
+            result = self.compiled_rule(rule, backward)(l) if self.compiled_rules_enabled else UNDECIDED
+            if result is not UNDECIDED:
+                result = (result,) if result is not None else ()
+            elif backward:
                 result = run(1, p, eq(c, l), *constraints)
             else:
                 result = run(1, c, eq(p, l), *constraints)
@@ -277,7 +313,7 @@ class KanrenEngine:
         
         l1 = logic(t1.term)
         l2 = logic(t2.term)
-        for rule in self.rules_conditional_compositional:
+        for rule in self.candidate_rules(self.index_compositional, 'inference_compositional', l1, l2):
             res = self.apply(rule, l1, l2)
             if res is not None:
                 r, _ = rule[1]
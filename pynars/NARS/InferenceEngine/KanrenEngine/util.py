@@ -2,22 +2,25 @@ from kanren import run, eq, var, lall, lany
 from kanren.constraints import neq, ConstrainedVar
 from unification import unify, reify
 from cons import cons, car, cdr
+from cons.core import ConsPair
 
 from itertools import combinations, product, chain, permutations
 
 from pynars import Narsese, Global
-from pynars.Narsese import Term, Copula, Connector, Statement, Compound, Variable, VarPrefix, Sentence, Punctuation, Stamp, place_holder, Tense
+from pynars.Narsese import Term, Copula, Connector, Statement, Compound, EmptyCompound, Variable, VarPrefix, Sentence, Punctuation, Stamp, place_holder, Tense
 
 from pynars.NAL.Functions import *
 from pynars.NARS.DataStructures import Concept, Task, TaskLink, TermLink, Judgement, Question
 from pynars.NAL.Functions.Tools import project_truth, revisible
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
 from typing import List
 
-from functools import cache
+from functools import cache, wraps
+import threading
 
 from time import time
-import yaml
+import hashlib
+import pickle
 from pathlib import Path
 
 
@@ -55,12 +58,19 @@ def parse(narsese: str, rule=False):
 ### Conversion between Narsese and miniKanren ###
 #################################################
 
-# used in converting from logic to Narsese
-vars_all = defaultdict(lambda: len(vars_all))
+# used in converting from logic to Narsese, per thread so that reasoners can run in several threads
+_local = threading.local()
 vars = set() # used as scratchpad
 
 rules_strong = [] # populated by `convert` below for use in structural inference
 
+def distinct_pairs(variables) -> list:
+    '''The pairs of variables of a rule which should not be bound to the same term.'''
+    var_combinations = list(combinations(variables, 2))
+    # filter out combinations like (_C, C) allowing them to be the same
+    cond = lambda x, y: x.token.replace('_', '') != y.token.replace('_', '')
+    return [c for c in var_combinations if cond(c[0], c[1])]
+
 def convert(rule, conditional_compositional=False):
     # convert to logical form
     premises, conclusion = rule.split(" |- ")
@@ -81,10 +91,7 @@ def convert(rule, conditional_compositional=False):
     p2 = logic(p2, True)
     c = logic(c, True)
 
-    var_combinations = list(combinations(vars, 2))
-    # filter out combinations like (_C, C) allowing them to be the same
-    cond = lambda x, y: x.token.replace('_', '') != y.token.replace('_', '')
-    constraints = [neq(c[0], c[1]) for c in var_combinations if cond(c[0], c[1])]
+    constraints = [neq(x, y) for x, y in distinct_pairs(vars)]
 
     if not conditional_compositional: # conditional compositional rules require special treatment
         if r.replace("'", '') in ['ded', 'ana', 'res', 'int', 'uni', 'dif']:
@@ -108,10 +115,7 @@ def convert_immediate(rule):
     p = logic(p, True)
     c = logic(c, True)
     
-    var_combinations = list(combinations(vars, 2))
-    # filter out combinations like (_C, C) allowing them to be the same
-    cond = lambda x, y: x.token.replace('_', '') != y.token.replace('_', '')
-    constraints = [neq(c[0], c[1]) for c in var_combinations if cond(c[0], c[1])]
+    constraints = [neq(x, y) for x, y in distinct_pairs(vars)]
 
     return ((p, c), (r, constraints))
 
@@ -131,6 +135,136 @@ def convert_theorems(theorem):
     return (l, sub_terms, tuple(matching_rules))
 
 
+##############
+# RULE CACHE #
+##############
+
+_version_rules_cache = 1
+
+def compile_rules(config: dict) -> dict:
+    '''
+    Convert the rules and the theorems in the content of `nal-rules.yml` into their logical forms.
+
+    Returns:
+        dict: the lists of rules `backward`, `syllogistic`, `immediate`, `conditional_compositional`, `strong` (see `rules_strong`), and the `theorems`.
+    '''
+    rules_strong.clear()
+
+    nal1_rules = split_rules(config['rules']['nal1'])
+    nal2_rules = split_rules(config['rules']['nal2'])
+    nal3_rules = split_rules(config['rules']['nal3'])
+
+    nal5_rules = split_rules(config['rules']['nal5'])
+
+    conditional_syllogistic = split_rules(config['rules']['conditional_syllogistic'])
+
+    higher_order = []
+    
+    # NAL5 includes higher order variants of NAL1-3 rules
+    for rule in (nal1_rules + nal2_rules):
+        # replace --> with ==> in NAL1 & NAL2
+        rule = rule.replace('-->', '==>')
+        # replace <-> with <=> in NAL2
+        rule = rule.replace('<->', '<=>')
+
+        higher_order.append(rule)
+
+    # save subset for backward inference
+    rules_backward = [convert(r, True) for r in nal1_rules + nal2_rules 
+                            + higher_order 
+                            + conditional_syllogistic
+                            ]
+    
+    for rule in nal3_rules:
+        # replace --> with ==> and <-> with <=> in NAL3 (except difference)
+        if '(-,' not in rule and '(~,' not in rule:
+            rule = rule.replace('-->', '==>')
+            rule = rule.replace('<->', '<=>')
+            
+            # replace | with || in NAL3 (except difference)
+            if '||' not in rule:
+                parts = rule.split(' |- ')
+                parts = (part.replace('|', '||') for part in parts)
+                rule = ' |- '.join(parts)
+            
+            # replace & with && in NAL3 (except difference)
+            if '&&' not in rule:
+                rule = rule.replace('&', '&&')
+            
+            higher_order.append(rule)
+    
+    rules = nal1_rules + nal2_rules + nal3_rules + nal5_rules + higher_order + conditional_syllogistic
+
+    return dict(
+        backward=rules_backward,
+        syllogistic=[convert(r) for r in rules],
+        immediate=[convert_immediate(r) for r in split_rules(config['rules']['immediate'])],
+        conditional_compositional=[convert(r, True) for r in split_rules(config['rules']['conditional_compositional'])],
+        strong=list(rules_strong),
+        theorems=[convert_theorems(t) for t in split_rules(config['theorems'])],
+    )
+
+def pack_logic(l):
+    '''Convert a logic tree into nested tuples which can be pickled.'''
+    if type(l) is ConsPair: return ('cons', pack_logic(l.car), pack_logic(l.cdr))
+    if isinstance(l, var): return ('var', l.token)
+    return l
+
+def unpack_logic(l):
+    if type(l) is tuple:
+        if l[0] == 'cons': return cons(unpack_logic(l[1]), unpack_logic(l[2]))
+        if l[0] == 'var': return var(l[1])
+    return l
+
+def pack_rule(rule):
+    '''The `neq` constraints cannot be pickled, so that the pairs of variables constrained are kept instead.'''
+    patterns, (r, _) = rule
+    rule_vars = set()
+    for pattern in patterns: variables(pattern, rule_vars)
+    return (tuple(pack_logic(pattern) for pattern in patterns), (r, distinct_pairs(rule_vars)))
+
+def unpack_rule(rule):
+    patterns, (r, pairs) = rule
+    pairs = [(unpack_logic(x), unpack_logic(y)) for x, y in pairs]
+    return (tuple(unpack_logic(pattern) for pattern in patterns), (r, [neq(x, y) for x, y in pairs]))
+
+def pack_rules(rules: dict) -> dict:
+    packed = {name: [pack_rule(rule) for rule in rules[name]] for name in rules if name != 'theorems'}
+    packed['theorems'] = [(pack_logic(l), sub_terms, matching_rules) for l, sub_terms, matching_rules in rules['theorems']]
+    return packed
+
+def unpack_rules(packed: dict) -> dict:
+    rules = {name: [unpack_rule(rule) for rule in packed[name]] for name in packed if name != 'theorems'}
+    rules['theorems'] = [(unpack_logic(l), sub_terms, matching_rules) for l, sub_terms, matching_rules in packed['theorems']]
+    rules_strong[:] = rules['strong']
+    return rules
+
+def load_rules(path_rules: Path, path_cache: Path):
+    '''
+    Load the rules compiled from `path_rules` from the cache `path_cache`, or compile them (and save the cache) if the cache is missing or was compiled from another version of the rules.
+
+    Returns:
+        rules (dict), digest (str): the rules (see `compile_rules`) and the hash of the file of the rules.
+    '''
+    content = Path(path_rules).read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    try:
+        with open(path_cache, 'rb') as f:
+            cache = pickle.load(f)
+        if cache['version'] == _version_rules_cache and cache['hash'] == digest:
+            return unpack_rules(cache['rules']), digest
+    except Exception:
+        pass
+    import yaml # only needed when the cache is missing or stale
+    rules = compile_rules(yaml.safe_load(content))
+    try:
+        with open(path_cache, 'wb') as f:
+            pickle.dump(dict(version=_version_rules_cache, hash=digest, rules=pack_rules(rules)), f)
+    except OSError:
+        pass
+    return rules, digest
+
+
 #################
 # TERM TO LOGIC #
 #################
@@ -179,11 +313,11 @@ def logic(term: Term, rule=False, substitution=False, var_intro=False, structura
 @cache
 def term(logic, root=True):
     # additional variable handling
-    if root: vars_all.clear()
+    if root or not hasattr(_local, 'vars_all'): _local.vars_all = {}
+    vars_all = _local.vars_all
     def create_var(name, prefix: VarPrefix):
-        vars_all[name]
+        idx = vars_all.setdefault(name, len(vars_all))
         var = Variable(prefix, name)
-        idx = vars_all[name]
         if prefix is VarPrefix.Independent:
             var._vars_independent.add(idx, [])
         if prefix is VarPrefix.Dependent:
@@ -220,7 +354,11 @@ def term(logic, root=True):
             is_list = type(t) is (cons or tuple) \
                 and not (type(car(t)) is Copula or type(car(t)) is Connector)
             terms = to_list(cdr(logic), con) if is_list else [term(t, False)]
-            return Compound(con, *terms)
+            if len(terms) == 0: return logic
+            try:
+                return Compound(con, *terms)
+            except EmptyCompound: # no term is left, e.g. in the intersection of two disjoint sets, which is not a valid conclusion
+                return logic
         # else:
         #     return term(car(logic))
     return logic # cons
@@ -369,22 +507,257 @@ def diff(c):
 
 
 
+##############
+# RULE INDEX #
+##############
+
+ATOM = 'atom' # the head of an atomic term
+
+def head(l):
+    '''
+    The copula or connector at the root of a logic tree, `ATOM` for an atomic term, or `None` if it could be anything (i.e. a variable).
+    '''
+    if isinstance(l, var): return None
+    if isinstance(l, cons):
+        h = car(l)
+        return h if isinstance(h, (Copula, Connector)) else None
+    return ATOM
+
+def components(l):
+    '''The logic tree itself, its subject and its predicate (the latter two are `None` unless it is a statement).'''
+    if isinstance(l, cons) and isinstance(car(l), Copula):
+        return (l, car(cdr(l)), cdr(cdr(l)))
+    return (l, None, None)
+
+def is_ground(l):
+    '''Whether a logic tree contains no variable.'''
+    while type(l) is ConsPair:
+        if not is_ground(l.car): return False
+        l = l.cdr
+    return not isinstance(l, var)
+
+class RuleIndex:
+    '''
+    A discrimination index over rules, so that only the rules which may unify with the premises are tried.
+
+    Each pattern of a rule (e.g. both premises of a syllogistic rule) is described by the heads (see `head`) of its root, its subject and its predicate, and a pair of patterns by the positions where both of them have the same variable.
+    Given the premises, a rule is a candidate if each head of the premises matches the head of the rule at the same position (a variable matches anything), and if the components of the premises are not obviously different at the positions where the rule shares a variable.
+    The candidates of a combination of such features are selected once and memoized.
+    '''
+    def __init__(self, rules: list, patterns) -> None:
+        '''
+        Args:
+            rules (list): the rules, in the order they should be tried.
+            patterns (Callable): maps a rule to the tuple of the patterns which the premises are unified with.
+        '''
+        self.rules = rules
+        self._features = []
+        shared = set()
+        for rule in rules:
+            comps = [components(p) for p in patterns(rule)]
+            heads = tuple(head(c) if c is not None else None for comp in comps for c in comp)
+            pairs = set()
+            if len(comps) == 2:
+                for i, c1 in enumerate(comps[0]):
+                    for j, c2 in enumerate(comps[1]):
+                        if isinstance(c1, var) and isinstance(c2, var) and c1 == c2:
+                            pairs.add((i, j))
+            shared |= pairs
+            self._features.append((heads, pairs))
+        self._shared = tuple(sorted(shared))
+        self._candidates = {}
+
+    def select(self, *premises) -> list:
+        comps = [components(l) for l in premises]
+        heads = tuple(head(c) if c is not None else None for comp in comps for c in comp)
+        distinct = frozenset(
+            (i, j) for i, j in self._shared
+            if comps[0][i] is not None and comps[1][j] is not None
+                and comps[0][i] != comps[1][j] and is_ground(comps[0][i]) and is_ground(comps[1][j])
+        ) if len(comps) == 2 else frozenset()
+        key = (heads, distinct)
+        candidates = self._candidates.get(key, None)
+        if candidates is None:
+            candidates = [rule for rule, (heads_rule, pairs) in zip(self.rules, self._features)
+                          if all(h is None or h_rule is None or h == h_rule for h, h_rule in zip(heads, heads_rule))
+                          and distinct.isdisjoint(pairs)]
+            self._candidates[key] = candidates
+        return candidates
+
+
+##################
+# COMPILED RULES #
+##################
+
+_unbound = object()
+UNDECIDED = object() # returned by a compiled rule when the solver is needed to decide
+
+def variables(l, collected: set=None) -> set:
+    '''The variables in a logic tree.'''
+    collected = set() if collected is None else collected
+    while type(l) is ConsPair:
+        variables(l.car, collected)
+        l = l.cdr
+    if isinstance(l, var): collected.add(l)
+    return collected
+
+def compile_pattern(pattern):
+    '''
+    Compile a logic pattern into a function `match(value, bindings)`, which matches a logic tree against the pattern, binding the variables of the pattern in `bindings`.
+    The variables in the value are treated as opaque: if the match depends on binding them, the result is `None` (undecided) rather than `False`.
+    '''
+    if isinstance(pattern, var):
+        def match(value, bindings):
+            bound = bindings.get(pattern, _unbound)
+            if bound is _unbound:
+                bindings[pattern] = value
+                return True
+            if bound is value or bound == value: return True
+            return False if is_ground(bound) and is_ground(value) else None
+        return match
+    if isinstance(pattern, ConsPair):
+        match_car = compile_pattern(pattern.car)
+        match_cdr = compile_pattern(pattern.cdr)
+        def match(value, bindings):
+            if type(value) is not ConsPair:
+                return None if isinstance(value, var) else False
+            matched = match_car(value.car, bindings)
+            return match_cdr(value.cdr, bindings) if matched else matched
+        return match
+    type_pattern = type(pattern)
+    def match(value, bindings):
+        if value is pattern or (type(value) is type_pattern and value == pattern): return True
+        return None if isinstance(value, var) else False
+    return match
+
+def compile_target(target):
+    '''Compile a logic tree into a function `build(bindings)`, which substitutes the bound variables in it, as `reify` does.'''
+    if isinstance(target, var):
+        return lambda bindings: bindings.get(target, target)
+    if isinstance(target, ConsPair):
+        if len(variables(target)) == 0:
+            return lambda bindings: target
+        build_car = compile_target(target.car)
+        build_cdr = compile_target(target.cdr)
+        return lambda bindings: cons(build_car(bindings), build_cdr(bindings))
+    return lambda bindings: target
+
+def compile_rule(patterns: tuple, target, constraints_pairs: list):
+    '''
+    Compile a rule into a function `apply(*values)`, which is equivalent to `run(1, target, eq(patterns, values), *constraints)`, but without the round trip through the miniKanren solver.
+
+    Returns:
+        the reified target, `None` if the rule does not match, or `UNDECIDED` if the variables in the values have to be bound, in which case the solver should be used instead.
+    '''
+    matches = tuple(compile_pattern(pattern) for pattern in patterns)
+    build = compile_target(target)
+    def apply(*values):
+        bindings = {}
+        for match, value in zip(matches, values):
+            matched = match(value, bindings)
+            if not matched: return None if matched is False else UNDECIDED
+        for x, y in constraints_pairs:
+            x = bindings.get(x, _unbound)
+            if x is _unbound: continue
+            y = bindings.get(y, _unbound)
+            if y is _unbound: continue
+            if x is y or x == y: return None
+        return build(bindings)
+    return apply
+
+
 ########################################################################
 
 # UTILITY METHODS
 
 ########################################################################
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+class InferenceCache:
+    '''
+    A bounded cache of the results of an inference method.
+    When the cache is full, the least recently used entry is evicted. If `ttl` is given, an entry also expires `ttl` cycles after it was stored.
+    '''
+    def __init__(self, maxsize: int=10000, ttl: int=None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict() # key -> (time, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        '''
+        Returns:
+            found (bool), value
+        '''
+        entry = self._data.get(key, None)
+        if entry is not None:
+            t, value = entry
+            if self.ttl is None or Global.time - t <= self.ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._data[key]
+            self.evictions += 1
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        self._data[key] = (Global.time, value)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    @property
+    def hit_rate(self) -> float:
+        n = self.hits + self.misses
+        return self.hits / n if n > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cache_key(arg):
+    '''
+    Normalize an argument of an inference method into a cache key.
+    A sentence is keyed on its term, punctuation, truth-value, occurrence time and evidential base rather than on the object itself, so that the cache does not keep the sentence alive.
+    Since the callers skip the results on a hit, only the premises with the same evidence share their results: the same judgement input again, or re-derived from other evidence, is a miss, and is reasoned on again.
+    '''
+    if isinstance(arg, Sentence):
+        truth = getattr(arg, 'truth', None)
+        stamp = arg.stamp
+        return (arg.term, arg.punct, (truth.f, truth.c, truth.k) if truth is not None else None, stamp.t_occurrence, stamp.evidential_base)
+    return arg
+
 def cache_notify(func):
-    func = cache(func)
-    def notify_wrapper(*args, **kwargs):
-        stats = func.cache_info()
-        hits = stats.hits
-        results = func(*args, **kwargs)
-        stats = func.cache_info()
-        cached = False
-        if stats.hits > hits:
-            cached = True
+    '''
+    Memoize an inference method of `KanrenEngine` in the cache `self.caches[func.__name__]`.
+    The wrapped method returns `(results, cached)`, where `cached` tells whether the results were cached.
+    '''
+    name = func.__name__
+    @wraps(func)
+    def notify_wrapper(self, *args, **kwargs):
+        cache = self.caches[name]
+        key = tuple(cache_key(arg) for arg in args)
+        if kwargs: key += tuple(sorted(kwargs.items()))
+        cached, results = cache.get(key)
+        if cached:
             # print(f"NOTE: {func.__name__}() results were cached")
-        return (results, cached)
-    return notify_wrapper
\ No newline at end of file
+            return (results, True)
+        results = func(self, *args, **kwargs)
+        cache.put(key, results)
+        return (results, False)
+    return notify_wrapper
@@ -42,6 +42,7 @@ def execute(task: Task, concept: Concept, memory: Memory):
         belief = executed_task(task)
         if concept is not None: 
             concept.add_belief(belief)
+            memory.belief_index.add(concept.term, concept.term)
         return function_op(args, task, memory), belief
     else: 
         return None, None
\ No newline at end of file
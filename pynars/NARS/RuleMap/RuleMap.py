@@ -3,7 +3,7 @@ from typing import Any, Callable, Iterable, List, Tuple, Union
 from collections import OrderedDict
 
 
-from sparse_lut import SparseLUT
+from pynars.utils.SparseLUT import SparseLUT
 from pynars.Config import Enable
 
 from pynars.utils.Print import print_out, PrintType
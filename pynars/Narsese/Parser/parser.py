@@ -1,36 +1,32 @@
 from pynars.Narsese import Term, Judgement, Tense, Statement, Copula, Truth, Stamp, Interval
 from pynars.Narsese import Base, Operator, Budget, Task, Goal, Punctuation, Question, Quest, Sentence, VarPrefix, Variable, Connector, Compound, SELF
 from pathlib import Path
-from datetime import datetime
 from pynars import Config, Global
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
+from typing import Iterable, Iterator
+import re
 
 root_path = Path(__file__).parent
 narsese_path = root_path/Path('./narsese.lark')
-
-
 narsese_py_path = root_path/Path('./narsese_lark.py')
-# get the last modified time of the file
-mtime_lark = datetime.fromtimestamp(narsese_path.stat().st_mtime)
-mtime_py = datetime.fromtimestamp(narsese_py_path.stat().st_mtime)
-if mtime_lark > mtime_py:
-    # re-generate the ``nasese_lark.py'' file
-    import os
-    print(f'generating [{narsese_py_path}] ...')
-    os.system(f'python -m lark.tools.standalone {narsese_path} > {narsese_py_path}')
 
-import sys
-try:
-    from .narsese_lark import Lark_StandAlone, Transformer, v_args, Token
-except:
-    print('Wrong generation.')
-    exit()
-inline_args = v_args(inline=True)
 
+def generate_lark_parser():
+    '''
+    Re-generate the standalone Lark parser `narsese_lark.py` from the grammar `narsese.lark`, after the grammar is changed.
+    This is not done on import any more, so as not to write into the package.
 
-class TreeToNarsese(Transformer):
+    Usage:
+        python -m pynars.Narsese.Parser.parser
+    '''
+    import subprocess, sys
+    print(f'generating [{narsese_py_path}] ...')
+    code = subprocess.run([sys.executable, '-m', 'lark.tools.standalone', str(narsese_path)], capture_output=True, text=True, check=True).stdout
+    narsese_py_path.write_text(code)
 
-    k: int
+
+class NarseseDefaults:
+    '''The defaults of the budget, the truth-value and the tense of the input, set by `LarkParser.config`.'''
     p_judgement: float
     d_judgement: float
     p_question: float
@@ -47,463 +43,271 @@ class TreeToNarsese(Transformer):
 
     temporal_window: int
 
-    names_ivar: defaultdict
-    names_dvar: defaultdict
-    names_qvar: defaultdict
-
-    @inline_args
-    def task(self, *args):
-        kwargs = dict(args)
-        sentence: Sentence = kwargs['sentence']
-        budget = kwargs.get('budget', None)
-        # budget = (p, d, q)
-        priority, durability, quality = budget or (None, None, None)
-        if budget is None or durability is None or quality is None:
-            if sentence.punct ==  Punctuation.Judgement: # judgement
-                judgement: Judgement = sentence
-                p = priority or self.p_judgement
-                d = durability or self.d_judgement
-                q = quality or Budget.quality_from_truth(judgement.truth)
-            elif sentence.punct ==  Punctuation.Question: # question
-                p = priority or self.p_question
-                d = durability or self.d_question
-                q = quality or 1.0
-            elif sentence.punct ==  Punctuation.Quest: # quest
-                p = priority or self.p_quest
-                d = durability or self.d_quest
-                q = quality or 1.0
-            elif sentence.punct ==  Punctuation.Goal: # goal
-                goal: Goal = sentence
-                p = priority or self.p_goal
-                d = durability or self.d_goal
-                q = quality or Budget.quality_from_truth(goal.truth)
-        else:
-            p, d, q = priority, durability, quality
 
-        budget = Budget(p, d, q)
-
-        kwargs['sentence'] = sentence
-        kwargs['budget'] = budget
-        return Task(**kwargs)
-
-    @inline_args
-    def judgement(self, statement: 'Term|Statement|Compound', *args):
-        statement._rebuild_vars()
-        kwargs = dict(args)
-        truth = kwargs.pop('truth', None)
-        tense = kwargs.pop('tense', None)
-        if truth is not None:
-            f, c, k = truth
-            if c is None:
-                c = self.c_judgement
+def new_statement(term1: Term, copula: Copula, term2: Term) -> Statement:
+    '''Build an input statement, the copulas of instance and property being turned into inheritance.'''
+    if copula == Copula.Instance:
+        term1 = Compound(Connector.ExtensionalSet, term1, is_input=True)
+        copula = Copula.Inheritance
+    elif copula == Copula.Property:
+        term2 = Compound(Connector.IntensionalSet, term2, is_input=True)
+        copula = Copula.Inheritance
+    if copula == Copula.InstanceProperty:
+        term1 = Compound(Connector.ExtensionalSet, term1, is_input=True)
+        term2 = Compound(Connector.IntensionalSet, term2, is_input=True)
+        copula = Copula.Inheritance
+    return Statement(term1, copula, term2, is_input=True)
+
+
+# the terminals of `narsese.lark`
+_re_word = re.compile(r'[^\-^\+^<^>^=^"^&^|^!^.^?^@^~^%^;^\,^:^\/^\\^*^#^$^\[^\]^\{^\}^\(^\)^\ ]+')
+_unit = r'([0]?\.[0-9]+|1\.[0]*|1|0)' # 0 <= x <= 1
+_open_unit = r'([0]?\.[0]*[1-9]{1}[0-9]*)' # 0 < x < 1
+_re_budget = re.compile(rf'\$\s*{_unit}\s*(?:;\s*{_open_unit}\s*(?:;\s*{_unit}\s*)?)?\$\s*')
+_re_tense = re.compile(r'\s*(?::(\||/|\\):|:!\s*([+-]?[0-9]+)\s*:)')
+_re_truth = re.compile(rf'\s*%\s*{_unit}\s*(?:;\s*{_open_unit}\s*(?:;\s*([1-9]{{1}}[0-9]*)\s*)?)?%')
+_re_end = re.compile(r'\s*$')
+_copulas = {copula.value: copula for copula in Copula}
+_puncts = {punct.value: punct for punct in Punctuation}
+
+
+class FastParser:
+    '''
+    A hand-written recursive-descent parser of the most common shape of input: a statement whose terms are atoms or such statements, with the optional budget, tense and truth-value, e.g. `$0.8;0.5$ <<robin-->bird>==><robin-->animal>>. :|: %1.0;0.9%`.
+    Anything else (compounds, variables, operations, ...) is left to the Lark parser, for which `parse` returns `None`.
+    The defaults are those of `NarseseDefaults`, as in `TreeToNarsese`, so that the result is the same as the one of the Lark parser.
+    '''
+
+    def parse(self, text: str):
+        '''
+        Returns:
+            (term, punct, truth, tense, budget), as taken by `new_task`, or `None` if the text is not of the supported shape.
+        '''
+        match = _re_budget.match(text)
+        i = match.end() if match is not None else 0
+        if text.startswith('<', i):
+            statement, i = self._statement(text, i)
+        else: statement = None
+        if statement is None: return None
+        while i < len(text) and text[i].isspace(): i += 1
+        punct = _puncts.get(text[i:i+1], None)
+        if punct is None: return None
+        i += 1
+
+        tense = truth = None
+        m = _re_tense.match(text, i)
+        if m is not None:
+            i = m.end()
+            tense = self._tense(*m.groups())
+        if punct is Punctuation.Judgement or punct is Punctuation.Goal:
+            m = _re_truth.match(text, i)
+            if m is not None:
+                i = m.end()
+                f, c, k = m.groups()
+                truth = (float(f), float(c) if c is not None else None, float(k) if k is not None else None)
+        if _re_end.match(text, i) is None: return None
+
+        return self.resolve(statement, punct, truth, tense, match.groups() if match is not None else None)
+
+    def _statement(self, text: str, i: int):
+        '''Parse `<term copula term>` from `text[i] == '<'`. Returns the statement (`None` if not supported) and the position after it.'''
+        term1, i = self._term(text, i+1)
+        if term1 is None: return None, i
+        copula = _copulas.get(text[i:i+3], None)
+        if copula is None: return None, i
+        term2, i = self._term(text, i+3)
+        if term2 is None: return None, i
+        while i < len(text) and text[i].isspace(): i += 1
+        if not text.startswith('>', i): return None, i
+        return new_statement(term1, copula, term2), i+1
+
+    def _term(self, text: str, i: int):
+        '''Parse an atom or a statement, and the blanks after it.'''
+        while i < len(text) and text[i].isspace(): i += 1
+        if text.startswith('<', i):
+            term, i = self._statement(text, i)
         else:
-            f, c, k = self.f, self.c_judgement, self.k
-
-        tense = Global.time + tense if tense is not None else tense
-        base = Base((Global.get_input_id(),))
-        kwargs['truth'] = Truth(f,c,k)
-        kwargs['stamp'] =  Stamp(Global.time, tense, None, base)
-        return ('sentence', Judgement(statement, **kwargs))
-
-    @inline_args
-    def question(self, statement: 'Term|Statement|Compound', *args):
-        statement._rebuild_vars()
-        kwargs = dict(args)
-        tense = kwargs.pop('tense', None)
-        tense = Global.time + tense if tense is not None else tense
-        base = Base((Global.get_input_id(),))
-        kwargs['stamp'] =  Stamp(Global.time, tense, None, base)
-        return ('sentence', Question(statement, **kwargs))
-
-    @inline_args
-    def quest(self, statement: 'Term|Statement|Compound', *args):
-        statement._rebuild_vars()
-        kwargs = dict(args)
-        tense = kwargs.pop('tense', None)
-        tense = Global.time + tense if tense is not None else tense
-        base = Base((Global.get_input_id(),))
-        kwargs['stamp'] =  Stamp(Global.time, tense, None, base)
-        return ('sentence', Quest(statement, **kwargs))
-
-    @inline_args
-    def goal(self, statement: 'Term|Statement|Compound', *args):
-        statement._rebuild_vars()
-        kwargs = dict(args)
-        desire = kwargs.pop('truth', None)
-        tense = kwargs.pop('tense', None)
-        if desire is not None:
-            f, c, k = desire
-            if c is None:
-                c = self.c_goal
+            match = _re_word.match(text, i)
+            if match is None: return None, i
+            term, i = Term(match.group(), is_input=True), match.end()
+        while i < len(text) and text[i].isspace(): i += 1
+        return term, i
+
+    @staticmethod
+    def _tense(symbol: str, number: str):
+        if symbol is None: return int(number)
+        if symbol == '|': return 0
+        return NarseseDefaults.temporal_window if symbol == '/' else -NarseseDefaults.temporal_window
+
+    @staticmethod
+    def resolve(term: Term, punct: Punctuation, truth: tuple, tense: int, budget: tuple):
+        '''Fill in the defaults of the truth-value (or desire) and of the budget, the way `TreeToNarsese` does.'''
+        if punct is Punctuation.Judgement or punct is Punctuation.Goal:
+            c_default = NarseseDefaults.c_judgement if punct is Punctuation.Judgement else NarseseDefaults.c_goal
+            if truth is not None:
+                f, c, k = truth
+                truth = (f, c if c is not None else c_default, k if k is not None else NarseseDefaults.k)
+            else:
+                truth = (NarseseDefaults.f, c_default, NarseseDefaults.k)
+        priority, durability, quality = (float(x) if x is not None else None for x in budget) if budget is not None else (None, None, None)
+        if durability is None or quality is None:
+            if punct is Punctuation.Judgement:
+                p, d, q = NarseseDefaults.p_judgement, NarseseDefaults.d_judgement, None
+            elif punct is Punctuation.Question:
+                p, d, q = NarseseDefaults.p_question, NarseseDefaults.d_question, 1.0
+            elif punct is Punctuation.Quest:
+                p, d, q = NarseseDefaults.p_quest, NarseseDefaults.d_quest, 1.0
+            else:
+                p, d, q = NarseseDefaults.p_goal, NarseseDefaults.d_goal, None
+            # as in `TreeToNarsese.task`, a zero is taken as missing
+            p = priority or p
+            d = durability or d
+            q = quality or q or Budget.quality_from_truth(Truth(*truth))
         else:
-            f, c, k = self.f, self.c_goal, self.k
-        tense = Global.time + tense if tense is not None else tense
-        base = Base((Global.get_input_id(),))
-        kwargs['desire'] = Truth(f,c,k)
-        kwargs['stamp'] =  Stamp(Global.time, tense, None, base)
-        return ('sentence', Goal(statement, **kwargs))
-
-
-    @inline_args
-    def statement(self, term1, copula, term2):
-        if copula == Copula.Instance:
-            term1 = Compound(Connector.ExtensionalSet, term1, is_input=True)
-            copula = Copula.Inheritance
-        elif copula == Copula.Property:
-            term2 = Compound(Connector.IntensionalSet, term2, is_input=True)
-            copula = Copula.Inheritance
-        if copula == Copula.InstanceProperty:
-            term1 = Compound(Connector.ExtensionalSet, term1, is_input=True)
-            term2 = Compound(Connector.IntensionalSet, term2, is_input=True)
-            copula = Copula.Inheritance
-        return Statement(term1, copula, term2, is_input=True)
-    @inline_args
-    def truth(self, f: Token, c: Token=None, k: Token=None):
-        # truth : "%" frequency [";" confidence [";" k_evidence]] "%"
-        f = float(f.value)
-        c = float(c.value) if c is not None else None
-        k = float(k.value) if k is not None else self.k
-        return ('truth',(f, c, k))
-
-    # @inline_args
-    # def desire(self, truth: tuple):
-    #     # desire : truth
-    #     return ('desire', truth[1])
-
-    @inline_args
-    def budget(self, p: Token, d: Token=None, q: Token=None):
-        # budget : "$" priority [";" durability [";" quality]] "$"
-        p = float(p.value)
-        d = float(d.value) if d is not None else None
-        q = float(q.value) if q is not None else None
-        return ('budget', (p, d, q))
-
-    @inline_args
-    def atom_term(self, word: Token):
-        word = word.value
-        return Term(word, is_input=True)
-
-    @inline_args
-    def op(self, word: Token):
-        word = word.value
-        return Operator(word)
-
-    @inline_args
-    def interval(self, word: Token):
-        num = int(word.value)
-        return Interval(num)
-
-    @inline_args
-    def variable_term(self, var: Variable):
-        # name = var.prefix.value+var.name
-        # if not name in self.names_var:
-        #     idx = len(self.names_var)
-        #     self.names_var[name] = idx
-        # else:
-        #     idx = self.names_var[name]
-        # var.variables
-        return var
-
-    @inline_args
-    def compound_term(self, compound):
-        return compound
-
-    @inline_args
-    def statement_term(self, statement):
-        return statement
-
-    @inline_args
-    def statement_operation1(self, op: Operator, *args: str):
-        terms = (term for term in args)
-        return Statement(Compound(Connector.Product, *terms, is_input=True), Copula.Inheritance, op, is_input=True)
-
-    @inline_args
-    def statement_operation2(self, word: Token, *args: str):
-        op = word.value
-        terms = (term for term in args)
-        return Statement(Compound(Connector.Product, *terms, is_input=True), Copula.Inheritance, Operator(op), is_input=True)
-
-    @inline_args
-    def inheritance(self):
-        return Copula.Inheritance
-
-    @inline_args
-    def similarity(self):
-        return Copula.Similarity
-
-    @inline_args
-    def instance(self):
-        return Copula.Instance
-
-    @inline_args
-    def property(self):
-        return Copula.Property
-
-    @inline_args
-    def instance_property(self):
-        return Copula.InstanceProperty
-
-    @inline_args
-    def implication(self):
-        return Copula.Implication
-
-    @inline_args
-    def predictive_implication(self):
-        return Copula.PredictiveImplication
-
-
-    @inline_args
-    def concurrent_implication(self):
-        return Copula.ConcurrentImplication
-
-    @inline_args
-    def retrospective_implication(self):
-        return Copula.RetrospectiveImplication
-
-    @inline_args
-    def equivalence(self):
-        return Copula.Equivalence
-
-    @inline_args
-    def predictive_equivalence(self):
-        return Copula.PredictiveEquivalence
-
-    @inline_args
-    def concurrent_equivalence(self):
-        return Copula.ConcurrentEquivalence
-
-
-
-
-
-    '''tense'''
-    # @inline_args
-    def tense_present(self, *args):
-        return ('tense', 0)
-
-    @inline_args
-    def tense_future(self, *args):
-        return ('tense', self.temporal_window)
-
-    @inline_args
-    def tense_past(self, *args):
-        return ('tense', -self.temporal_window)
-
-    @inline_args
-    def tense_time(self, number: Token):
-        return ('tense', int(number.value))
-
-
-    '''multi'''
-    @inline_args
-    def multi_prefix(self, connector, *args):
-        return Compound(connector, *args, is_input=True)
-
-    @inline_args
-    def multi_prefix_product(self, *args):
-        return self.multi_prefix(Connector.Product, *args)
-
-    @inline_args
-    def multi_infix(self, expr):
-        # connector = args[1] # TODO: Parse expression according to priorities of the connectors.
-        # terms = [term for i, term in enumerate(args) if i%2==0]
-        # return Compound(connector, *terms, is_input=True)
-        return expr
-
-    @inline_args
-    def multi_prod_expr(self, *args):
-        return Compound(Connector.Product, *args, is_input=True)
-
-    @inline_args
-    def multi_extint_expr(self, *args):
-        return Compound(Connector.ExtensionalIntersection, *args, is_input=True)
-
-    @inline_args
-    def multi_intint_expr(self, *args):
-        return Compound(Connector.IntensionalIntersection, *args, is_input=True)
+            p, d, q = priority, durability, quality
+        return term, punct, truth, tense, (p, d, q)
 
-    @inline_args
-    def multi_parallel_expr(self, *args):
-        return Compound(Connector.ParallelEvents, *args, is_input=True)
+    @staticmethod
+    def new_task(term: Term, punct: Punctuation, truth: tuple, tense: int, budget: tuple) -> Task:
+        '''Build an input task, with a new input id, from the values returned by `parse` (or by `entry_of`).'''
+        term._rebuild_vars()
+        stamp = Stamp(Global.time, Global.time + tense if tense is not None else None, None, Base((Global.get_input_id(),)))
+        if punct is Punctuation.Judgement: sentence = Judgement(term, stamp, Truth(*truth))
+        elif punct is Punctuation.Goal: sentence = Goal(term, stamp, Truth(*truth))
+        elif punct is Punctuation.Question: sentence = Question(term, stamp)
+        else: sentence = Quest(term, stamp)
+        return Task(sentence, Budget(*budget))
 
-    @inline_args
-    def multi_sequential_expr(self, *args):
-        return Compound(Connector.SequentialEvents, *args, is_input=True)
+    @staticmethod
+    def entry_of(task: Task):
+        '''The values from which `new_task` builds the same task again.'''
+        sentence = task.sentence
+        truth = sentence.truth if sentence.punct is Punctuation.Judgement or sentence.punct is Punctuation.Goal else None
+        stamp = sentence.stamp
+        tense = stamp.t_occurrence - stamp.t_creation if stamp.t_occurrence is not None else None
+        budget = task.budget
+        return task.term, sentence.punct, (truth.f, truth.c, truth.k) if truth is not None else None, tense, (budget.priority, budget.durability, budget.quality)
 
-    @inline_args
-    def multi_conj_expr(self, *args):
-        return Compound(Connector.Conjunction, *args, is_input=True)
 
-    @inline_args
-    def multi_disj_expr(self, *args):
-        return Compound(Connector.Disjunction, *args, is_input=True)
-
-    '''single'''
-    @inline_args
-    def single_prefix(self, connector, term1, term2):
-        return Compound(connector, term1, term2, is_input=True)
-
-    @inline_args
-    def single_infix(self, term1, connector, term2):
-        return Compound(connector, term1, term2, is_input=True)
-
-    @inline_args
-    def negation(self, connector, term):
-        return Compound(connector, term, is_input=True)
-
-    @inline_args
-    def ext_image(self, connector, *args):
-        return Compound(connector, *args, is_input=True)
-
-    @inline_args
-    def int_image(self, connector, *args):
-        return Compound(connector, *args, is_input=True)
-
-    '''connectors'''
-
-    @inline_args
-    def con_conjunction(self):
-        return Connector.Conjunction
-
-    @inline_args
-    def con_product(self):
-        return Connector.Product
-
-    @inline_args
-    def con_disjunction(self):
-        return Connector.Disjunction
-
-    @inline_args
-    def con_parallel_events(self):
-        return Connector.ParallelEvents
-
-    @inline_args
-    def con_sequential_events(self):
-        return Connector.SequentialEvents
-
-    @inline_args
-    def con_intensional_intersection(self):
-        return Connector.IntensionalIntersection
-
-    @inline_args
-    def con_extensional_intersection(self):
-        return Connector.ExtensionalIntersection
-
-    @inline_args
-    def con_extensional_difference(self):
-        return Connector.ExtensionalDifference
-
-    @inline_args
-    def con_intensional_difference(self):
-        return Connector.IntensionalDifference
-
-    @inline_args
-    def con_int_set(self):
-        return Connector.IntensionalSet
-
-    @inline_args
-    def con_ext_set(self):
-        return Connector.ExtensionalSet
-
-    @inline_args
-    def con_negation(self):
-        return Connector.Negation
-
-    @inline_args
-    def con_int_image(self):
-        return Connector.IntensionalImage
-
-    @inline_args
-    def con_ext_image(self):
-        return Connector.ExtensionalImage
-
-    @inline_args
-    def independent_var(self, term: Token):
-        var = Variable(VarPrefix.Independent, term.value)
-        name = var.prefix.value+var.name
-        idx = self.names_ivar[name]
-        var._vars_independent.add(idx, [])
-        return var
-    
-    @inline_args
-    def dependent_var(self, term: Token):
-        var = Variable(VarPrefix.Dependent, term.value)
-        name = var.prefix.value+var.name
-        idx = self.names_dvar[name]
-        var._vars_dependent.add(idx, [])
-        return var
-        
-    @inline_args
-    def query_var(self, term: Token):
-        var = Variable(VarPrefix.Query, term.value)
-        name = var.prefix.value+var.name
-        idx = self.names_qvar[name]
-        var._vars_query.add(idx, [])
-        return var
-
-    '''set'''
-    @inline_args
-    def set(self, connector, *terms):
-        return Compound(connector, *terms, is_input=True)
-
-    @inline_args
-    def con_int_set(self):
-        return Connector.IntensionalSet
-
-    @inline_args
-    def con_ext_set(self, *args):
-        return Connector.ExtensionalSet
-
-    # '''list_set'''
-    # def list_set(self, terms):
-    #     return Compound(Connector.List, *terms, is_input=True)
+ParseCacheInfo = namedtuple('ParseCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
 
 
 class LarkParser:
+    '''
+    The parser of Narsese.
+    The common shapes of input are parsed by `FastParser`, and the rest by Lark.
+    The results are kept in a bounded LRU cache keyed by the text, with the blanks normalized, so that the same sentence input again is not parsed again. Only the sentences whose terms are interned (i.e. without variables, see `Intern.py`) are cached, since their terms are shared anyway. Each parse still gives a new task, with a new input id.
+    The Lark parser is only built when it is first needed, so that importing `pynars` stays cheap.
+    '''
     def __init__(self) -> None:
         self.config()
-        tree = TreeToNarsese()
-        tree.names_ivar = defaultdict(lambda: len(tree.names_ivar)) # for variables
-        tree.names_dvar = defaultdict(lambda: len(tree.names_dvar)) # for variables
-        tree.names_qvar = defaultdict(lambda: len(tree.names_qvar)) # for variables
-        self._parser = Lark_StandAlone(transformer=tree)
-        self._tree = tree
+        self._parser = None # built by `_build`
+        self._tree = None
+        self._fast = FastParser()
+        self._cache = OrderedDict() # normalized text -> the values of `FastParser.new_task`
+        self.hits = 0
+        self.misses = 0
 
     def config(self, config_path='./config.json'):
         Config.load(config_path)
 
         # budget
-        TreeToNarsese.p_judgement = Config.Config.p_judgement
-        TreeToNarsese.d_judgement = Config.Config.d_judgement
-        TreeToNarsese.p_question = Config.Config.p_question
-        TreeToNarsese.d_question = Config.Config.d_question
-        TreeToNarsese.p_quest = Config.Config.p_quest
-        TreeToNarsese.d_quest = Config.Config.d_quest
-        TreeToNarsese.p_goal = Config.Config.p_goal
-        TreeToNarsese.d_goal = Config.Config.d_goal
+        NarseseDefaults.p_judgement = Config.Config.p_judgement
+        NarseseDefaults.d_judgement = Config.Config.d_judgement
+        NarseseDefaults.p_question = Config.Config.p_question
+        NarseseDefaults.d_question = Config.Config.d_question
+        NarseseDefaults.p_quest = Config.Config.p_quest
+        NarseseDefaults.d_quest = Config.Config.d_quest
+        NarseseDefaults.p_goal = Config.Config.p_goal
+        NarseseDefaults.d_goal = Config.Config.d_goal
 
         # truth
-        TreeToNarsese.f = Config.Config.f
-        TreeToNarsese.c_judgement = Config.Config.c_judgement
-        TreeToNarsese.c_goal = Config.Config.c_goal
-        TreeToNarsese.k = Config.Config.k
+        NarseseDefaults.f = Config.Config.f
+        NarseseDefaults.c_judgement = Config.Config.c_judgement
+        NarseseDefaults.c_goal = Config.Config.c_goal
+        NarseseDefaults.k = Config.Config.k
 
         # temporal reasoning relative
-        TreeToNarsese.temporal_window = Config.Config.temporal_duration
+        NarseseDefaults.temporal_window = Config.Config.temporal_duration
+
+        # the defaults may have changed
+        self.cache_size = Config.Config.parse_cache_size
+        if hasattr(self, '_cache'): self.cache_clear()
 
 
     def parse(self, text: str) -> Task:
+        # the runs of spaces are collapsed (but not within strings, nor the other blanks, which may be part of words)
+        key = text.strip()
+        if '  ' in key and '"' not in key: key = ' '.join(word for word in key.split(' ') if word)
+        entry = self._cache.get(key, None)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return FastParser.new_task(*entry)
+        self.misses += 1
+
+        entry = self._fast.parse(key)
+        if entry is not None:
+            task = FastParser.new_task(*entry)
+        else:
+            task = self.parse_lark(text)
+            entry = FastParser.entry_of(task)
+        if self.cache_size != 0 and task.term._interned:
+            self._cache[key] = entry
+            if self.cache_size is not None and len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return task
+
+    def _build(self):
+        from .transformer import TreeToNarsese
+        from .narsese_lark import Lark_StandAlone
+        tree = TreeToNarsese()
+        tree.names_ivar = defaultdict(lambda: len(tree.names_ivar)) # for variables
+        tree.names_dvar = defaultdict(lambda: len(tree.names_dvar)) # for variables
+        tree.names_qvar = defaultdict(lambda: len(tree.names_qvar)) # for variables
+        self._parser = Lark_StandAlone(transformer=tree)
+        self._tree = tree
+
+    def parse_lark(self, text: str) -> Task:
+        '''Parse the text by Lark only.'''
+        if self._parser is None: self._build()
         self._tree.names_ivar.clear()
         self._tree.names_dvar.clear()
         self._tree.names_qvar.clear()
         return self._parser.parse(text)
 
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[Task]:
+        '''
+        Parse the lines of Narsese, skipping the blank lines, the comments (`//...` and `'...`) and the numbers of cycles.
+        A line which cannot be parsed gives `None`.
+        '''
+        for line in lines:
+            line = line.strip()
+            if len(line) == 0 or line.startswith('//') or line.startswith("'") or line.isdigit(): continue
+            try:
+                yield self.parse(line)
+            except Exception:
+                yield None
+
+    def cache_info(self) -> ParseCacheInfo:
+        return ParseCacheInfo(self.hits, self.misses, self.cache_size, len(self._cache))
+
+    def cache_clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
 parser = LarkParser()
 def parse(text: str): return parser.parse(text)
 
-# from lark import Lark, Transformer 
-# parser = Lark.open(narsese_path, parser='lalr')
 
-# if __name__ == '__main__':
-#     with open(sys.argv[1]) as f:
-#         print(parser.parse(f.read()))
\ No newline at end of file
+def __getattr__(name: str):
+    # `TreeToNarsese` imports the generated Lark parser, so that it is only imported when asked for.
+    if name == 'TreeToNarsese':
+        from .transformer import TreeToNarsese
+        return TreeToNarsese
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if __name__ == '__main__':
+    generate_lark_parser()
\ No newline at end of file
@@ -10,7 +10,10 @@ from typing import Iterable, List, Type, Union
 from ordered_set import OrderedSet
 from typing import Set
 from pynars.utils.tools import list_contains
-from pynars.Global import States
+
+
+class EmptyCompound(Exception):
+    '''Raised when no component of a compound is left once its components are pre-processed, e.g. in `(&, {A}, {B})`, the intersection of two disjoint sets.'''
 
 
 class Compound(Term):  # , OrderedSet):
@@ -18,6 +21,19 @@ class Compound(Term):  # , OrderedSet):
 
     _terms: Terms
 
+    @classmethod
+    def _intern_key(cls, connector: Connector, *terms: Term, is_input=False):
+        for term in terms:
+            if not term._interned: return None
+        return (Compound, connector, *(id(term) for term in terms))
+
+    def _intern_key_built(self):
+        '''The key of the compound as it is built, e.g. (|, {A}, {B}) is built as {A, B}, or `None` if it should not be interned.'''
+        terms = self._terms
+        for term in terms:
+            if not term._interned: return None
+        return (Compound, self.connector, *(id(term) for term in terms))
+
     def __init__(self, connector: Connector, *terms: Term, is_input=False) -> None:
         ''''''
         self._is_commutative = connector.is_commutative
@@ -30,7 +46,7 @@ class Compound(Term):  # , OrderedSet):
 
         terms = self._terms
         if len(terms) == 0:
-            raise Exception("Empty")
+            raise EmptyCompound("Empty")
 
         self._height = max((term._height for term in terms))+1
 
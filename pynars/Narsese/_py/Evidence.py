@@ -4,9 +4,7 @@ from .Term import Term
 from .Statement import Statement
 from enum import Enum
 from .Tense import Tense
-from typing import Tuple, Type, Set, List, Union
-
-from ordered_set import OrderedSet
+from typing import FrozenSet, Tuple, Type, Set, List, Union
 # from .Evidence import Base
 # from .Task import *
 
@@ -22,17 +20,57 @@ from pynars import Global
 #         return (self._hash_task==evidence._hash_task) and (self._input_id==evidence._input_id)
 
 class Base:
-    '''Evidential Base'''
+    '''
+    Evidential Base.
+
+    It is an immutable value: the ids of the evidences are kept in a tuple, in order and without duplicates, and a base "modified" by `add`, `extend` or `|` is a new one. Hence, a base is shared by the stamps which are copied, instead of being copied along with them.
+    The hash is computed once, when it is first needed.
+
+    Each base also carries a fingerprint of its evidences, computed once at construction: a Bloom signature of `fingerprint_bits` bits, where each evidence sets the bit of its hash modulo `fingerprint_bits`. Two bases whose fingerprints have no bit in common have no evidence in common, so that `is_overlaped` only compares the evidences when the fingerprints intersect.
+    '''
+    __slots__ = ('_tuple', '_set', '_hash', '_fingerprint')
+
+    fingerprint_bits: int = 256
+
     def __init__(self, terms: Tuple[int]=tuple()) -> None:
         # TODO: DOUBT --
         # IF `<A-->B>.`, `<B-->C>.`, `<C--D>.`, THEN it can be derived in a single that `<A-->C>.`, `<B-->D>.`.
         # In the second step, it can be derived that `{<A-->B>. <B-->D>.} |- (1) <A-->D>.`, and `{<A-->C>. <C-->D>.} |- (2) <A-->D>.`
         # Is it reasonable theoretically to apply revision rules between (1) and (2)?
 
-        self._set: Set[int] = OrderedSet(terms)
+        self._tuple: Tuple[int] = tuple(dict.fromkeys(terms))
+        self._set: FrozenSet[int] = None # built when it is first needed
         self._hash = None
-    
-    def interleave(self, base2: Type['Base']) -> Set[int]:
+        self._fingerprint: int = Base.fingerprint(self._tuple)
+
+    @classmethod
+    def _new(cls, evidences: Tuple[int], fingerprint: int=None) -> Type['Base']:
+        '''Make a base from a tuple without duplicates, and its fingerprint if it is known.'''
+        base = object.__new__(cls)
+        base._tuple = evidences
+        base._set = None
+        base._hash = None
+        base._fingerprint = fingerprint if fingerprint is not None else cls.fingerprint(evidences)
+        return base
+
+    @classmethod
+    def fingerprint(cls, evidences: Tuple[int]) -> int:
+        n_bits = cls.fingerprint_bits
+        fingerprint = 0
+        for evidence in evidences:
+            fingerprint |= 1 << (hash(evidence) % n_bits)
+        return fingerprint
+
+    @classmethod
+    def merge(cls, base1: Union[Type['Base'], None], base2: Union[Type['Base'], None]) -> Union[Type['Base'], None]:
+        '''The base of a conclusion from two premises, interleaving their bases (see `interleave`). If one of them is `None`, the other one is returned.'''
+        if base2 is None: return base1
+        if base1 is None: return base2
+        # unless some evidences overflow, the fingerprint of the union is that of the merged base.
+        fingerprint = base1._fingerprint | base2._fingerprint if len(base1) + len(base2) <= Config.maximum_evidental_base_length else None
+        return cls._new(base1.interleave(base2), fingerprint)
+
+    def interleave(self, base2: Type['Base']) -> Tuple[int]:
         '''interleave two bases'''
         # TODO: DOUBT --
         # What if some evidence is lost (because of forgetting)?
@@ -42,48 +80,46 @@ class Base:
         
 
         # TODO: Ref: OpenNARS 3.1.0 Stamp.java line 178~187.
-        # TODO: Optimize this loop with cython.
 
-        base1 = self._set
-        base2 = base2._set
+        base1 = self._tuple
+        base2 = base2._tuple
 
         b1 = len(base1)
         b2 = len(base2)
-        base_length = min(b1 + b2, Config.maximum_evidental_base_length)
-        evidential_base: Set[int] = OrderedSet()
-
-        i1 = i2 = j = 0
-
-        while j < base_length:
-            if i2 < b2:
-                evidential_base.add(base2[i2])
-                j += 1
-                i2 += 1
-            if i1 < b1:
-                evidential_base.add(base1[i1])
-                j += 1
-                i1 += 1
-
-        return evidential_base
-
-    def add(self, id_evidence: int):
-        self._hash = None
-        self._set.add(id_evidence)
-        return self
+        n = min(b1, b2)
+        # the evidences of `base2` and `base1` are taken in turn, the first one from `base2`, and then the rest of the longer one.
+        evidences = [evidence for pair in zip(base2, base1) for evidence in pair]
+        if b2 > n: evidences.extend(base2[n:])
+        elif b1 > n: evidences.extend(base1[n:])
+
+        base_length = Config.maximum_evidental_base_length
+        if len(evidences) > base_length:
+            # the evidences are taken in pairs, as long as both bases have some left.
+            evidences = evidences[:base_length + (base_length % 2 if base_length < 2*n else 0)]
+
+        return tuple(dict.fromkeys(evidences))
+
+    def add(self, id_evidence: int) -> Type['Base']:
+        if id_evidence in self._tuple: return self
+        return Base._new(self._tuple + (id_evidence,), self._fingerprint | 1 << (hash(id_evidence) % self.fingerprint_bits))
     
-    def extend(self, base: Union[Type['Base'] , None]):
-        self._hash = None
-        self._set = self.interleave(base)
-        return self
+    def extend(self, base: Union[Type['Base'] , None]) -> Type['Base']:
+        return Base.merge(self, base)
+
+    @property
+    def evidences(self) -> FrozenSet[int]:
+        if self._set is None: self._set = frozenset(self._tuple)
+        return self._set
 
     def is_overlaped(self, base: Union[Type['Base'], None]) -> bool:
         ''' Check whether another `Base` object is overlapped with `self`.
-        Complexity: O(N) N=min(len(self), len(o))
+        Complexity: O(1) if the fingerprints are disjoint, otherwise O(N) N=len(o)
         '''
-        return not self._set.isdisjoint(base._set) if base is not None else False
+        if base is None or self._fingerprint & base._fingerprint == 0: return False
+        return not self.evidences.isdisjoint(base.evidences)
     
     def do_hashing(self):
-        self._hash = hash(frozenset(self._set))
+        self._hash = hash(self._tuple)
         return self._hash
 
     def __eq__(self, o: Type['Base']) -> bool:
@@ -92,27 +128,40 @@ class Base:
             return True
         elif hash(self) != hash(o):
             return False
-        return self._set == o._set
+        return self._tuple == o._tuple
     
     def __or__(self, base: Type['Base']) -> Type['Base']:
-        return Base(self._set | base._set)
-
-    def __ior__(self, base: Type['Base']) -> Type['Base']:
-        self._hash = None
-        self._set |= base._set
-        return self
+        return Base._new(tuple(dict.fromkeys(self._tuple + base._tuple)), self._fingerprint | base._fingerprint)
 
     def __hash__(self) -> int:
         return self._hash if self._hash is not None else self.do_hashing()
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        return self._tuple
+
+    def __setstate__(self, state):
+        self._tuple = state
+        self._set = None
+        self._hash = None
+        self._fingerprint = Base.fingerprint(state)
+
     def __len__(self) -> int:
-        return len(self._set)
+        return len(self._tuple)
+
+    def __iter__(self):
+        return iter(self._tuple)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}{set(self._set)}"
+        return f"{self.__class__.__name__}{set(self._tuple)}"
 
     def contains(self, base: 'Base'):
-        return len(self._set - base._set) == 0
+        return self.evidences.issubset(base._tuple)
     
     def __contains__(self, evidence) -> bool:
-        return self._set.__contains__(evidence)
\ No newline at end of file
+        return evidence in self.evidences
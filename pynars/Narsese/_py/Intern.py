@@ -0,0 +1,66 @@
+'''
+Hash-consing of terms.
+
+A term without variables never changes once it is built, so structurally identical terms can share one instance.
+Before building a term, its class computes a key from the arguments of the constructor (see `Term._intern_key`). If a term has already been built with the same key and is still alive, that term is returned instead of a new one.
+The components in a key are identified by `id`, which is sound because only interned components are accepted. They are keyed in their order, so that a term always keeps the order of the components it is built with: e.g. `(&, a, b)` and `(&, b, a)` are two objects, which are equal. A compound may also be built into another term than its arguments tell (see `Compound.prepocess_terms`), so it is keyed on what it is built into as well.
+Thus, two interned terms which are written the same are the same object. `Term.__eq__` relies on that for the terms whose words do not depend on the order of commutative components.
+
+The table holds weak references only, so a term is evicted once nothing else refers to it.
+'''
+from collections import namedtuple
+from weakref import WeakValueDictionary
+
+InternInfo = namedtuple('InternInfo', ['hits', 'misses', 'currsize'])
+
+_table = WeakValueDictionary()
+_hits = 0
+_misses = 0
+
+
+class Interned(type):
+    '''
+    The metaclass of `Term`.
+    Only the classes defining `_intern_key` themselves are interned, not their subclasses (e.g. `Variable`), and interning is skipped if `cls.interning_enabled` is false or if `cls._intern_key(...)` returns `None`.
+    '''
+
+    def __call__(cls, *args, **kwargs):
+        global _hits, _misses
+        if not (cls.interning_enabled and '_intern_key' in cls.__dict__): return super().__call__(*args, **kwargs)
+        key = cls._intern_key(*args, **kwargs)
+        if key is None: return super().__call__(*args, **kwargs)
+
+        term = _table.get(key, None)
+        if term is not None:
+            _hits += 1
+            return term
+        _misses += 1
+        term = super().__call__(*args, **kwargs)
+        rekey = getattr(term, '_intern_key_built', None)
+        if rekey is not None:
+            # the term may be built into another one than its arguments tell, e.g. (|, {A}, {B}) into {A, B}.
+            key_built = rekey()
+            if key_built is None: return term
+            if key_built != key:
+                term_built = _table.get(key_built, None)
+                if term_built is not None:
+                    _table[key] = term_built
+                    return term_built
+                _table[key_built] = term
+        term._interned = True
+        _table[key] = term
+        return term
+
+
+def intern_info() -> InternInfo:
+    '''Return the number of terms reused and built through the table, and the number of terms in it.'''
+    return InternInfo(_hits, _misses, len(_table))
+
+
+def intern_clear():
+    '''Reset the statistics and drop the table. The terms already built stay valid, but are no longer interned, so that they are compared with the terms built afterwards by their structure.'''
+    global _hits, _misses
+    for term in list(_table.values()):
+        term._interned = False
+    _table.clear()
+    _hits = _misses = 0
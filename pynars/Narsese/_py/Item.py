@@ -3,6 +3,8 @@ from typing import Type
 from pynars.Config import Config
 from copy import deepcopy
 class Item:
+    __slots__ = ('_hash_value', 'budget')
+
     def __init__(self, hash_value, budget: Budget=None, copy_budget=True) -> None:
         budget = (deepcopy(budget) if copy_budget else budget) if budget is not None else Budget(Config.priority, Config.durability, Config.quality)
         self._hash_value = hash_value
@@ -37,6 +37,7 @@ class Punctuation(Enum):
 
 
 class Stamp:
+    __slots__ = ('t_creation', 't_occurrence', 't_put', 'evidential_base')
 
     def __init__(self, t_creation: int, t_occurrence: int, t_put: int, evidential_base: Type['Base']) -> None:
         '''
@@ -63,15 +64,15 @@ class Stamp:
         self.t_occurrence = None
 
     def extend_evidenital_base(self, base: Type['Base']):
-        if self.evidential_base is None:
-            if base is None:
-                return
-            elif self.evidential_base is None:
-                self.evidential_base = Base(())
-        self.evidential_base.extend(base)
+        self.evidential_base = Base.merge(self.evidential_base, base)
+
+    def __deepcopy__(self, memo):
+        # the evidential base is immutable, so it is shared by the copy.
+        stamp = memo[id(self)] = Stamp(self.t_creation, self.t_occurrence, self.t_put, self.evidential_base)
+        return stamp
 
     def __str__(self):
-        return f'{{{self.t_occurrence}: {", ".join(str(b) for b in self.evidential_base._set)}}}'
+        return f'{{{self.t_occurrence}: {", ".join(str(b) for b in self.evidential_base)}}}'
 
     def __repr__(self):
         return f'<Stamp: {str(self)}>'
@@ -83,7 +84,7 @@ Doubt that are Question and Quest have got a tense?
 
 
 class Sentence:
-    truth: Truth = None
+    __slots__ = ('term', 'word', 'punct', 'stamp', 'truth')
 
     def __init__(self, term: Term, punct: Punctuation, stamp: Stamp, do_hashing: bool = False) -> None:
         ''''''
@@ -91,6 +92,7 @@ class Sentence:
         self.word = term.word + str(punct.value)
         self.punct = punct
         self.stamp: Stamp = stamp
+        self.truth: Truth = None
 
     @property
     def evidential_base(self):
@@ -165,6 +167,8 @@ class Sentence:
 
 
 class Judgement(Sentence):
+    __slots__ = ()
+
     def __init__(self, term: Term, stamp: Stamp = None, truth: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None)
@@ -188,12 +192,14 @@ class Judgement(Sentence):
 
 
 class Goal(Sentence):
-    best_solution: 'Judgement' = None
+    __slots__ = ('best_solution', 'best_answer')
 
     def __init__(self, term: Term, stamp: Stamp = None, desire: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None, None)
         Sentence.__init__(self, term, Punctuation.Goal, stamp)
+        self.best_solution: 'Judgement' = None
+        self.best_answer: 'Judgement' = None
         self.truth = desire if desire is not None else Truth(Config.f, Config.c, Config.k)
 
     def __str__(self) -> str:
@@ -204,13 +210,14 @@ class Goal(Sentence):
 
 
 class Question(Sentence):
-    best_answer: 'Judgement' = None
+    __slots__ = ('best_answer', 'is_query')
 
     def __init__(self, term: Term, stamp: Stamp = None, curiosiry: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None)
         # stamp.set_eternal()
         Sentence.__init__(self, term, Punctuation.Question, stamp)
+        self.best_answer: 'Judgement' = None
         self.is_query = False  # TODO: if there is a query variable in the sentence, then `self.is_query=True`
 
     def __str__(self) -> str:
@@ -222,12 +229,14 @@ class Question(Sentence):
 
 
 class Quest(Sentence):
-    best_answer: 'Goal' = None
+    __slots__ = ('best_answer', 'is_query')
+
     def __init__(self, term: Term, stamp: Stamp = None, curiosiry: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None, None)
         # stamp.set_eternal()
         Sentence.__init__(self, term, Punctuation.Quest, stamp)
+        self.best_answer: 'Goal' = None
         self.is_query = False  # TODO: if there is a query variable in the sentence, then `self.is_query=True`
 
     def __str__(self) -> str:
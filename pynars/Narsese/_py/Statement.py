@@ -10,6 +10,11 @@ from ordered_set import OrderedSet
 
 class Statement(Term):
     type = TermType.STATEMENT
+
+    @classmethod
+    def _intern_key(cls, subject: Term, copula: Copula, predicate: Term, is_input: bool=False, is_subterm=True):
+        if not (subject._interned and predicate._interned): return None
+        return (Statement, id(subject), copula, id(predicate))
     
     def __init__(self, subject: Term, copula: Copula, predicate: Term, is_input: bool=False, is_subterm=True) -> None:
         self._is_commutative = copula.is_commutative
@@ -1,9 +1,11 @@
 from copy import copy
 from typing import Type, Union
 
-from pynars import NAL
+from pynars import NAL, Global
+from pynars.Config import Config
 
 from .Sentence import Sentence, Judgement, Goal, Quest, Question, Stamp
+from .Evidence import Base
 from .Item import Item
 from .Budget import Budget
 from .Term import Term
@@ -12,15 +14,15 @@ from .Truth import Truth
 
 
 class Task(Item):
-    input_id = -1
-    best_solution: 'Task' = None
-    processed = False
-    immediate_rules_applied = False
+    __slots__ = ('sentence', 'input_id', 'best_solution', 'processed', 'immediate_rules_applied')
     
     def __init__(self, sentence: Sentence, budget: Budget=None, input_id: int=None) -> None:
         super().__init__(hash(sentence), budget)
         self.sentence: Sentence = sentence
-        self.input_id = self.input_id if input_id is None else input_id
+        self.input_id = -1 if input_id is None else input_id
+        self.best_solution: 'Task' = None
+        self.processed = False
+        self.immediate_rules_applied = False
 
     @property
     def h(self):
@@ -41,6 +43,40 @@ class Task(Item):
         else:
             raise f'Invalid type! {type(self.sentence)}'
 
+    @staticmethod
+    def _new_stamp(tense: int=None) -> Stamp:
+        t_occurrence = Global.time + tense if tense is not None else None
+        return Stamp(Global.time, t_occurrence, None, Base((Global.get_input_id(),)))
+
+    # The constructors below build an input task directly from a term, the way the parser does from Narsese (with the same defaults, and a new input id), but without the parser.
+    # `tense` is the occurrence time relative to the current time, e.g. `0` for `:|:`, or None for an eternal sentence.
+
+    @classmethod
+    def new_judgement(cls, term: Term, truth: Truth=None, tense: int=None, budget: Budget=None) -> 'Task':
+        term._rebuild_vars()
+        if truth is None: truth = Truth(Config.f, Config.c_judgement, Config.k)
+        if budget is None: budget = Budget(Config.p_judgement, Config.d_judgement, Budget.quality_from_truth(truth))
+        return cls(Judgement(term, cls._new_stamp(tense), truth), budget)
+
+    @classmethod
+    def new_goal(cls, term: Term, desire: Truth=None, tense: int=None, budget: Budget=None) -> 'Task':
+        term._rebuild_vars()
+        if desire is None: desire = Truth(Config.f, Config.c_goal, Config.k)
+        if budget is None: budget = Budget(Config.p_goal, Config.d_goal, Budget.quality_from_truth(desire))
+        return cls(Goal(term, cls._new_stamp(tense), desire), budget)
+
+    @classmethod
+    def new_question(cls, term: Term, tense: int=None, budget: Budget=None) -> 'Task':
+        term._rebuild_vars()
+        if budget is None: budget = Budget(Config.p_question, Config.d_question, 1.0)
+        return cls(Question(term, cls._new_stamp(tense)), budget)
+
+    @classmethod
+    def new_quest(cls, term: Term, tense: int=None, budget: Budget=None) -> 'Task':
+        term._rebuild_vars()
+        if budget is None: budget = Budget(Config.p_quest, Config.d_quest, 1.0)
+        return cls(Quest(term, cls._new_stamp(tense)), budget)
+
     def reward_budget(self, reward: float):
         self.budget.priority = NAL.Functions.Or(self.budget.priority, reward)
 
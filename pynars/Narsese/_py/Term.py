@@ -11,13 +11,14 @@ from bidict import bidict
 from pynars.utils.IndexVar import IntVar
 from typing import Callable
 from typing import Tuple
+from .Intern import Interned
 
 class TermType(Enum):
     ATOM = 0
     STATEMENT = 1
     COMPOUND = 2
 
-class Term:
+class Term(metaclass=Interned):
 
     type = TermType.ATOM
     copula: Copula = None
@@ -42,6 +43,16 @@ class Term:
     _vars_query: IndexVar = None
 
     _height = 0
+
+    interning_enabled: bool = True # Whether the terms without variables are hash-consed. See `Intern.py`.
+    _interned: bool = False # Whether the term is the shared instance in the intern table.
+    _sub_terms: frozenset = None
+
+    @classmethod
+    def _intern_key(cls, word, do_hashing=False, word_sorted=None, is_input=False):
+        '''Return the key of the term in the intern table, or `None` if the term should not be interned.'''
+        if word_sorted is not None: return None
+        return (Term, word)
     
     def __init__(self, word, do_hashing=False, word_sorted=None, is_input=False) -> None:
         self.word = word
@@ -60,7 +71,12 @@ class Term:
 
     @property
     def sub_terms(self) -> Set[Type['Term']]:
-        return set((self, *self._components)) if self._components is not None else set((self, ))
+        sub_terms = self._sub_terms
+        if sub_terms is None:
+            sub_terms = frozenset((self, *self._components)) if self._components is not None else frozenset((self, ))
+            # a term with variables may be cloned and changed, so only the sub-terms of a term without variables are kept.
+            if not self.has_var: self._sub_terms = sub_terms
+        return sub_terms
 
     @property
     def components(self) ->Set[Type['Term']]:
@@ -153,6 +169,9 @@ class Term:
         return self._hash_value if self._hash_value is not None else self.do_hashing()
     
     def __eq__(self, o: Type['Term']) -> bool:
+        if self is o: return True
+        if self._interned and getattr(o, '_interned', False) and self.word == self.word_sorted and o.word == o.word_sorted:
+            return False # two interned terms without commutative parts are equal only if they are the same object, see `Intern.py`
         return self.identical(o) and self._vars_independent.indices == o._vars_independent.indices and self._vars_dependent.indices == o._vars_dependent.indices and self._vars_query.indices == o._vars_query.indices
 
     def __contains__(self, term: Type['Term']) -> bool:
@@ -220,6 +239,26 @@ class Term:
         # clone = copy(self)
         return self
 
+    def __copy__(self):
+        if self._interned: return self
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__getstate__())
+        return clone
+
+    def __deepcopy__(self, memo):
+        if self._interned: return self
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone.__dict__.update(deepcopy(self.__getstate__(), memo))
+        return clone
+
+    def __getstate__(self):
+        # a copy is not in the intern table, and the cached sub-terms, which contain the term itself, would refer to the original one.
+        state = self.__dict__.copy()
+        state.pop('_interned', None)
+        state.pop('_sub_terms', None)
+        return state
+
     def _normalize_variables(self):
         ''''''
         if self.has_var:
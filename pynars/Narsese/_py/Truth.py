@@ -3,6 +3,8 @@ from typing import Type
 
 class Truth:
     # analytic: Type['Truth']
+    __slots__ = ('f', 'c', 'k')
+
     def __init__(self, f, c, k) -> None:
         self.f = f 
         self.c = c
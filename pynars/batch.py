@@ -0,0 +1,173 @@
+'''
+Batch evaluation of `.nal` scripts over a pool of processes.
+
+Each worker process keeps one reasoner, warmed up once, and resets it (`Reasoner.reset`) before each script. The random seed of a script is set by `NARSInterface.change_random_seed`, and is `seed + i` for the i-th script, so that the results do not depend on which worker runs the script.
+A script is run as by `Tests/test_Examples.run_file`: a Narsese line is input and followed by one cycle, a number runs that many cycles, and `''outputMustContain('...')` expects a task among the outputs (the derived tasks, the revised ones and the answers) so far.
+
+The report is a JSON object:
+
+    {
+        "scripts": [{"path", "seed", "passed", "error", "wall_time", "cycles", "cycles_per_sec", "expectations": [{"narsese", "line", "passed"}]}, ...],
+        "summary": {"n_scripts", "n_passed", "n_failed", "n_workers", "wall_time", "cycles", "cycles_per_sec"}
+    }
+
+Usage:
+    python -m pynars.batch Tests/examples/multi_steps Tests/examples/application --workers 4 --report report.json
+'''
+import argparse
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Union
+
+from pynars import Narsese
+from pynars.NARS import Reasoner
+from pynars.Interface import NARSInterface
+from pynars.utils.Print import print_out, PrintType
+
+_reasoner: Reasoner = None # the reasoner of the worker process
+
+
+def _init_worker(n_memory: int, capacity: int):
+    global _reasoner
+    with redirect_stdout(io.StringIO()):
+        _reasoner = Reasoner(n_memory, capacity)
+
+
+class _Outputs:
+    '''The outputs of a script, indexed by term, as far as `outputMustContain` compares them (see `Tests/utils_for_test.output_contains`).'''
+
+    def __init__(self) -> None:
+        self._outputs: Dict[Narsese.Term, set] = {}
+
+    def add(self, task: Narsese.Task):
+        truth = task.truth
+        key = None if truth is None else (round(truth.f, 2), round(truth.c, 2), task.sentence.is_eternal, task.stamp.t_occurrence)
+        self._outputs.setdefault(task.term, set()).add(key)
+
+    def add_cycle(self, tasks_line):
+        tasks_derived, judgement_revised, goal_revised, answers_question, answers_quest, _ = tasks_line
+        for task in tasks_derived: self.add(task)
+        if judgement_revised is not None: self.add(judgement_revised)
+        if goal_revised is not None: self.add(goal_revised)
+        if answers_question is not None:
+            for task in answers_question: self.add(task)
+        if answers_quest is not None:
+            for task in answers_quest: self.add(task)
+
+    def contains(self, target: Narsese.Task) -> bool:
+        keys = self._outputs.get(target.term, ())
+        truth = target.truth
+        for key in keys:
+            if key is None:
+                if truth is None: return True
+                continue
+            f, c, is_eternal, t_occurrence = key
+            if truth is not None and (f != round(truth.f, 2) or c != round(truth.c, 2)): continue
+            if is_eternal != target.sentence.is_eternal: continue
+            if not is_eternal and t_occurrence != target.stamp.t_occurrence: continue
+            return True
+        return False
+
+
+def run_script(path: Union[Path, str], seed: int, reasoner: Reasoner=None) -> dict:
+    '''
+    Run the script `path` with a reset reasoner (by default, the one of the worker process) and the random seed `seed`. Return the result of the script in the report.
+    '''
+    reasoner = reasoner if reasoner is not None else _reasoner
+    result = dict(path=str(path), seed=seed, passed=False, error=None, wall_time=0.0, cycles=0, cycles_per_sec=0.0, expectations=[])
+    outputs = _Outputs()
+    n_cycles = 0
+    t0 = perf_counter()
+    with redirect_stdout(io.StringIO()):
+        NARSInterface.change_random_seed(seed)
+        reasoner.reset()
+        reasoner.context.reset()
+        try:
+            with open(path, 'r') as f:
+                lines = f.readlines()
+            for i, line in enumerate(lines, 1):
+                line = line.strip(' \r\n\t')
+                if line.startswith("''outputMustContain('"):
+                    narsese = line[len("''outputMustContain('"):].rstrip("')")
+                    if len(narsese) == 0: continue
+                    passed = outputs.contains(Narsese.parser.parse(narsese))
+                    result['expectations'].append(dict(narsese=narsese, line=i, passed=passed))
+                elif len(line) == 0 or line.startswith("//") or line.startswith("'"):
+                    continue
+                elif line.isdigit():
+                    for _ in range(int(line)):
+                        outputs.add_cycle(reasoner.cycle())
+                    n_cycles += int(line)
+                else:
+                    success, _, _ = reasoner.input_narsese(line, go_cycle=False)
+                    if not success: raise ValueError(f'line {i}: failed to parse "{line}"')
+                    outputs.add_cycle(reasoner.cycle())
+                    n_cycles += 1
+            result['passed'] = all(expectation['passed'] for expectation in result['expectations'])
+        except Exception as e:
+            result['error'] = f'{type(e).__name__}: {e}'
+    wall_time = perf_counter() - t0
+    result.update(wall_time=wall_time, cycles=n_cycles, cycles_per_sec=n_cycles/wall_time if wall_time > 0 else 0.0)
+    return result
+
+
+def collect_scripts(paths: List[Union[Path, str]]) -> List[Path]:
+    '''The `.nal` files in `paths`, the directories being searched recursively.'''
+    scripts = []
+    for path in map(Path, paths):
+        if path.is_dir(): scripts.extend(sorted(path.rglob('*.nal')))
+        else: scripts.append(path)
+    return scripts
+
+
+def run_batch(paths: List[Union[Path, str]], n_workers: int=None, seed: int=137, n_memory: int=100, capacity: int=100) -> dict:
+    '''Run the scripts in `paths` over `n_workers` processes (by default, one per CPU) and return the report.'''
+    scripts = collect_scripts(paths)
+    n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+    t0 = perf_counter()
+    with ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=(n_memory, capacity)) as executor:
+        results = list(executor.map(run_script, scripts, [seed + i for i in range(len(scripts))]))
+    wall_time = perf_counter() - t0
+    n_passed = sum(1 for result in results if result['passed'])
+    n_cycles = sum(result['cycles'] for result in results)
+    summary = dict(
+        n_scripts=len(results), n_passed=n_passed, n_failed=len(results)-n_passed, n_workers=n_workers,
+        wall_time=wall_time, cycles=n_cycles, cycles_per_sec=n_cycles/wall_time if wall_time > 0 else 0.0
+    )
+    return dict(scripts=results, summary=summary)
+
+
+def main(argv: List[str]=None):
+    parser = argparse.ArgumentParser(description='Run .nal scripts over a pool of processes, and report the outputMustContain checks.')
+    parser.add_argument('paths', metavar='Path', type=str, nargs='+', help='*.nal files, or directories to search for them.')
+    parser.add_argument('--workers', type=int, default=None, help='the number of worker processes (default: the number of CPUs).')
+    parser.add_argument('--seed', type=int, default=137, help='the random seed of the first script; the i-th script uses seed+i.')
+    parser.add_argument('--memory', type=int, default=100, help='the capacity of the memory of each reasoner.')
+    parser.add_argument('--capacity', type=int, default=100, help='the capacity of the buffers of each reasoner.')
+    parser.add_argument('--report', type=str, default=None, help='the path of the JSON report.')
+    args = parser.parse_args(argv)
+
+    report = run_batch(args.paths, args.workers, args.seed, args.memory, args.capacity)
+    for result in report['scripts']:
+        if result['error'] is not None:
+            print_out(PrintType.ERROR, f'{result["path"]}: {result["error"]}')
+        elif not result['passed']:
+            failed = [expectation['narsese'] for expectation in result['expectations'] if not expectation['passed']]
+            print_out(PrintType.ERROR, f'{result["path"]}: missing {", ".join(failed)}')
+        else:
+            print_out(PrintType.INFO, f'{result["path"]}: passed ({result["cycles"]} cycles, {result["wall_time"]:.2f}s)')
+    summary = report['summary']
+    print_out(PrintType.INFO, f'{summary["n_passed"]}/{summary["n_scripts"]} passed in {summary["wall_time"]:.2f}s with {summary["n_workers"]} workers, {summary["cycles_per_sec"]:.0f} cycles/s.')
+    if args.report is not None:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -223,6 +223,7 @@ class IndexVar:
 
 
 def _normalize(variables):
+    if len(variables) == 0: return ()
     p1 = list(OrderedSet(variables))
     p2 = list(range(len(p1)))
     mapping = dict(zip(p1, p2))
@@ -1,4 +1,2 @@
-import warnings
-
-from sparse_lut import SparseLUT # Directly import as an outer module that can let PyNARS run in Python 3.11
-from typing import Any
\ No newline at end of file
+from ._sparse_lut import SparseLUT # a pure-Python implementation, so that PyNARS runs on any platform without the compiled `sparse_lut`
+from typing import Any
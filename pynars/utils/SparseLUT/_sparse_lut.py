@@ -0,0 +1,189 @@
+'''
+A first-party, pure-Python implementation of `SparseLUT` (see `sparse_lut.pyi`).
+
+Each entry added to the table is a list of index-patterns, one per dimension, and a value. A pattern is an int, a list/tuple of ints, or `Any`/`None` which matches every index of the dimension, including `None`.
+Looking up a tuple of indices returns an `OrderedSet` of the values of all the entries matching it (in the order they were added), or `None` if there is none.
+
+`build` compiles the entries into a deterministic automaton with one layer per dimension:
+    - the indices of each dimension are grouped into classes of indices matched by exactly the same entries;
+    - each state of a layer is the set of entries still matching the indices looked up so far, and states with the same set are merged.
+The transitions of all the layers are flattened into a single `array`, where a state is represented by the offset of its row. Thus a look-up is one array access per dimension, with no dict involved.
+'''
+from array import array
+from pathlib import Path
+import pickle
+from typing import Any, Dict, List, Tuple, Union
+from ordered_set import OrderedSet
+
+_version = 1
+
+
+class SparseLUT:
+    shape: Tuple[int]
+    depth: int
+    data: list
+
+    def __init__(self, shape: tuple) -> None:
+        self.shape = tuple(shape)
+        self.depth = len(self.shape) - 1
+        self.data = []
+        self.clear()
+
+    def add(self, indices: Union[list, tuple], value):
+        self.data.append((indices, value))
+
+    def _normalize(self, indices: Union[list, tuple]) -> List[int]:
+        '''Convert the patterns of an entry into bitmasks over the indices of each dimension. The bit `shape[i]` stands for the index `None`.'''
+        masks = []
+        for n, index in zip(self.shape, indices):
+            if index is Any or index is None:
+                mask = (1 << (n + 1)) - 1
+            elif isinstance(index, (list, tuple)):
+                mask = 0
+                for idx in index:
+                    mask |= 1 << (int(idx) if idx is not None else n)
+            elif isinstance(index, slice):
+                mask = 0
+                for idx in range(*index.indices(n)):
+                    mask |= 1 << idx
+            else:
+                mask = 1 << int(index)
+            masks.append(mask)
+        return masks
+
+    def build(self, clear=True):
+        '''
+        Compile the entries added into the look-up table.
+
+        Args:
+            clear (bool): not used. It is kept for compatibility with the interface of `sparse_lut`.
+        '''
+        self.clear()
+        if len(self.data) == 0: return
+
+        masks_entries = [self._normalize(indices) for indices, _ in self.data]
+
+        # group the indices of each dimension into classes, where the indices in a class are matched by the same entries.
+        classes: List[List[int]] = []
+        members: List[List[int]] = [] # members[depth][class]: the bitmask of the entries matching the class
+        for depth, n in enumerate(self.shape):
+            member_ids: Dict[int, int] = {}
+            classes_depth = []
+            for idx in range(n + 1):
+                member = 0
+                for i_entry, masks in enumerate(masks_entries):
+                    if (masks[depth] >> idx) & 1: member |= 1 << i_entry
+                classes_depth.append(member_ids.setdefault(member, len(member_ids)))
+            classes.append(classes_depth)
+            members.append(list(member_ids.keys()))
+
+        # enumerate the states layer by layer, and fill in the transitions.
+        table = array('l')
+        results: List[OrderedSet] = []
+        states = {(1 << len(self.data)) - 1: 0} # the set of entries matching -> the offset of the row
+        for depth in range(len(self.shape)):
+            members_depth = members[depth]
+            is_last = depth == self.depth
+            offset_next = len(table) + len(states) * len(members_depth)
+            states_next: Dict[int, int] = {}
+            for state in states:
+                for member in members_depth:
+                    state_next = state & member
+                    if state_next == 0:
+                        table.append(-1)
+                        continue
+                    target = states_next.get(state_next, None)
+                    if target is None:
+                        target = len(results) if is_last else offset_next + len(states_next) * len(members[depth + 1])
+                        states_next[state_next] = target
+                        if is_last: results.append(self._values(state_next))
+                    table.append(target)
+            states = states_next
+
+        self.classes = classes
+        self.table = table
+        self.results = results
+
+    def _values(self, entries: int) -> OrderedSet:
+        values = OrderedSet()
+        for i_entry, (_, value) in enumerate(self.data):
+            if (entries >> i_entry) & 1: values.add(value)
+        return values
+
+    def clear(self):
+        self.classes: List[List[int]] = [[] for _ in self.shape]
+        self.table = array('l')
+        self.results: List[OrderedSet] = []
+
+    def dump(self, root_path: str, name_cache: str='LUT'):
+        with open(Path(root_path)/f'{name_cache}.pkl', 'wb') as f:
+            pickle.dump((_version, self.shape, self.data, self.classes, self.table, self.results), f)
+
+    def load(self, root_path: str, name_cache: str='LUT'):
+        with open(Path(root_path)/f'{name_cache}.pkl', 'rb') as f:
+            content = pickle.load(f)
+        if not (isinstance(content, tuple) and len(content) == 6 and content[0] == _version and tuple(content[1]) == self.shape):
+            # the cache was dumped by another implementation or version, so rebuild the table from the entries.
+            if len(self.data) == 0 and isinstance(content, tuple) and len(content) == 2:
+                self.data = content[0]
+            self.build()
+            return
+        _, _, self.data, self.classes, self.table, self.results = content
+
+    def draw(self, show_labels=True):
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        g = nx.DiGraph()
+        g.add_node(('state', 0, 0), layer=0, label='root')
+        offsets = [0]
+        for depth, classes in enumerate(self.classes):
+            n_classes = max(classes) + 1 if len(classes) > 0 else 0
+            offsets_next = []
+            for offset in offsets:
+                for i_class in range(n_classes):
+                    target = self.table[offset + i_class]
+                    if target < 0: continue
+                    indices = [idx if idx < self.shape[depth] else None for idx, c in enumerate(classes) if c == i_class]
+                    node = ('state', depth + 1, target)
+                    if node not in g:
+                        label = indices if depth < self.depth else list(self.results[target])
+                        g.add_node(node, layer=depth + 1, label=label)
+                        offsets_next.append(target)
+                    g.add_edge(('state', depth, offset), node)
+            offsets = offsets_next
+
+        plt.clf()
+        pos = nx.multipartite_layout(g, subset_key="layer")
+        if show_labels:
+            labels = nx.draw_networkx_labels(g, pos, {node: attr['label'] for node, attr in g.nodes.items()})
+            for t in labels.values():
+                t.set_rotation(30)
+        nx.draw(g, pos, with_labels=False, node_size=5)
+        plt.show()
+
+    def __setitem__(self, indices: tuple, value):
+        self.add(indices, value)
+
+    def get(self, indices: tuple):
+        '''
+        each item in indices should be int, Any/None.
+        If fewer indices than the dimensions are given, the offset of the state reached is returned instead of the values (or None if no entry matches).
+        '''
+        table = self.table
+        offset = 0
+        try:
+            for index, classes in zip(indices, self.classes):
+                offset = table[offset + classes[index if index is not None and index is not Any else -1]]
+                if offset < 0: return None
+        except (IndexError, TypeError):
+            return None
+        if len(indices) < len(self.shape): return offset
+        return self.results[offset] if len(self.results) > 0 else None
+
+    def __getitem__(self, indices: tuple):
+        if isinstance(indices, int): indices = (indices,)
+        return self.get(indices)
+
+    def __len__(self):
+        return len(self.data)
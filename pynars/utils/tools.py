@@ -25,14 +25,25 @@ def get_size(obj, seen=None):
     if isinstance(obj, dict):
         size += sum([get_size(v, seen) for v in obj.values()])
         size += sum([get_size(k, seen) for k in obj.keys()])
-    elif hasattr(obj, '__dict__'):
-        size += get_size(obj.__dict__, seen)
+    elif hasattr(obj, '__dict__') or len(_slot_names(type(obj))) > 0:
+        if hasattr(obj, '__dict__'): size += get_size(obj.__dict__, seen)
+        size += sum([get_size(getattr(obj, name), seen) for name in _slot_names(type(obj)) if hasattr(obj, name)])
     elif hasattr(obj, '__iter__') and not isinstance(obj, (str, bytes, bytearray)):
         size += sum([get_size(i, seen) for i in obj])
 
     return size
 
 
+def _slot_names(cls) -> tuple:
+    '''the names of the attributes stored in `__slots__`, by `cls` and its bases'''
+    names = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, str): slots = (slots,)
+        names.extend(name for name in slots if name not in ('__dict__', '__weakref__'))
+    return tuple(names)
+
+
 def list_contains(base_list, obj_list):
     ''''''
     if len(base_list) < len(obj_list): return False